@@ -1,19 +1,130 @@
 """HTTP client for Kan.bn API."""
 
-from typing import Any, Dict, Optional
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import httpx
-from kanbn_cli.config import KanbnConfig
-from kanbn_cli.utils.errors import APIError, AuthenticationError, NotFoundError
+from kanbn_cli.api import metrics, offline
+from kanbn_cli.api.offline import OfflineQueue
+from kanbn_cli.api.ratelimit import MAX_RETRIES, READ_METHODS, RateLimiter, retry_after
+from kanbn_cli.config import KanbnConfig, use_profile
+from kanbn_cli.utils.errors import APIError, AuthenticationError, NotFoundError, ValidationError
 
+PAGE_SIZE = 100
+ITEM_KEYS = ("items", "data", "results", "activities", "boards", "workspaces", "cards")
+META_KEYS = ("pagination", "meta")
+CURSOR_KEYS = ("nextCursor", "next_cursor", "cursor", "next")
 
-class KanbnClient:
-    """HTTP client for Kan.bn API."""
+
+def page_items(page: Any, items_key: Optional[str] = None) -> List[Any]:
+    """Extract the item list from a page that is either a list or an envelope."""
+    if isinstance(page, list):
+        return page
+    if not isinstance(page, dict):
+        return []
+    if items_key:
+        return page.get(items_key) or []
+    for key in ITEM_KEYS:
+        if isinstance(page.get(key), list):
+            return page[key]
+    return []
+
+
+def _page_meta(page: Dict[str, Any]) -> Dict[str, Any]:
+    """The paging metadata of an envelope: its ``pagination``/``meta`` object, or itself."""
+    for key in META_KEYS:
+        if isinstance(page.get(key), dict):
+            return page[key]
+    return page
+
+
+def _next_cursor(page: Any, cursor_key: Optional[str] = None) -> Optional[str]:
+    """Return the cursor for the following page, if the envelope advertises one.
+
+    Without ``cursor_key`` only a ``pagination``/``meta`` object is searched,
+    since a top-level ``next`` or ``cursor`` field may be ordinary data.
+    """
+    if not isinstance(page, dict):
+        return None
+    meta = _page_meta(page)
+    if meta.get("hasMore") is False or meta.get("has_more") is False:
+        return None
+    if cursor_key:
+        candidates = [meta.get(cursor_key), page.get(cursor_key)]
+    elif meta is not page:
+        candidates = [meta.get(key) for key in CURSOR_KEYS]
+    else:
+        return None
+    for value in candidates:
+        if value and isinstance(value, (str, int)):
+            return str(value)
+    return None
+
+
+def _timeout(timeout: Optional[float]) -> Any:
+    """Per-request timeout, falling back to the pooled client's default."""
+    return httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+
+
+class _BaseClient:
+    """Request building and response handling shared by the sync and async clients."""
 
     def __init__(self, config: KanbnConfig):
         """Initialize the client with configuration."""
         self.config = config
         self.base_url = config.api_url.rstrip("/")
+        # State files belong to the config's profile, whichever one is active
+        with use_profile(config.profile):
+            self.rate_limiter = RateLimiter.from_config(config)
+        self.metrics = metrics.get_registry()
+        self._host = urlparse(self.base_url).netloc
+        self._offline_queue: Optional[OfflineQueue] = None
+
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    @property
+    def offline_queue(self) -> OfflineQueue:
+        """Journal of writes queued while the API was unreachable."""
+        if self._offline_queue is None:
+            with use_profile(self.config.profile):
+                self._offline_queue = OfflineQueue()
+        return self._offline_queue
+
+    def _queueable(self, method: str, data: Any) -> bool:
+        """Whether a failed request with this method may be queued for replay."""
+        if method.upper() in READ_METHODS or data is not None:
+            return False
+        return offline.is_enabled(self.config)
+
+    def _resolve_placeholders(
+        self,
+        method: str,
+        parts: List[Any],
+        queueable: bool,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], List[Any]]:
+        """Swap replayed ``@local:`` IDs for real ones in ``[endpoint, params, json]``.
+
+        Returns a placeholder entity instead when the request depends on a
+        write that is still queued (and queueing is enabled).
+        """
+        if not offline.has_placeholders(parts):
+            return None, parts
+        missing = self.offline_queue.unresolved(parts)
+        if missing:
+            if not queueable:
+                raise ValidationError(
+                    f"{', '.join(sorted(missing))} is still in the offline queue; "
+                    "run 'kanbn queue replay' first"
+                )
+            return self.offline_queue.enqueue(method, *parts, headers), parts
+        return None, self.offline_queue.resolve(parts)
 
     def _handle_response(self, response: httpx.Response) -> Any:
         """Handle API response and errors."""
@@ -37,50 +148,535 @@ class KanbnClient:
         except Exception:
             return response.text
 
+    def _observe(
+        self,
+        method: str,
+        endpoint: str,
+        response: Optional[httpx.Response],
+        started: float,
+        retried: bool = False,
+        received: Optional[int] = None,
+    ) -> None:
+        """Record one request attempt when metrics are enabled."""
+        if self.metrics is None:
+            return
+        sent = 0
+        if response is not None:
+            sent = len(response.request.content)
+            if received is None:
+                received = len(response.content)
+        self.metrics.observe(
+            self._host,
+            method,
+            endpoint,
+            response.status_code if response is not None else None,
+            time.perf_counter() - started,
+            sent,
+            received or 0,
+            retried,
+        )
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to back off before retrying a throttled request, or None to give up.
+
+        Only applies with a rate limiter: the penalty is written to the shared
+        bucket so every process talking to the host slows down, not just this one.
+        """
+        if response.status_code != 429 or self.rate_limiter is None or attempt >= MAX_RETRIES:
+            return None
+        delay = retry_after(response)
+        self.rate_limiter.penalize(delay)
+        return delay
+
     def _build_headers(self) -> Dict[str, str]:
         """Build request headers with API key."""
         if not self.config.api_token:
             raise AuthenticationError("Not authenticated. Run 'kanbn auth login' first.")
-        
+
         return {
             "x-api-key": self.config.api_token,
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
 
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Any:
+    def _next_page_params(
+        self,
+        page: Any,
+        params: Dict[str, Any],
+        page_size: Optional[int],
+        items_key: Optional[str],
+        cursor_key: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Work out the query parameters for the next page, or None when done."""
+        cursor = _next_cursor(page, cursor_key)
+        if cursor:
+            return {**params, "cursor": cursor}
+        items = page_items(page, items_key)
+        offset = params.get("offset", 0) + len(items)
+        if isinstance(page, dict):
+            meta = _page_meta(page)
+            if not items or meta.get("hasMore") is False:
+                return None
+            if meta.get("total") is not None:
+                return None if offset >= meta["total"] else {**params, "offset": offset}
+            if meta.get("hasMore") is not True:
+                # Envelope without paging metadata: the server returned everything
+                return None
+        elif page_size is None or len(items) != page_size:
+            # Without a limit a bare list is the whole collection; with one, a short
+            # page is the last one and a long page means the limit was ignored
+            return None
+        return {**params, "offset": offset}
+
+
+class KanbnClient(_BaseClient):
+    """HTTP client for Kan.bn API.
+
+    A single pooled ``httpx.Client`` is created on first use and reused for
+    every request, so keep-alive connections are shared across calls and
+    threads. Use the client as a context manager (or call ``close()``) to
+    release the pool when done.
+    """
+
+    def __init__(self, config: KanbnConfig, http: Optional[httpx.Client] = None):
+        """Initialize the client with configuration and an optional shared httpx.Client."""
+        super().__init__(config)
+        self._http = http
+        self._owns_http = http is None
+        self._lock = threading.Lock()
+
+    @property
+    def http(self) -> httpx.Client:
+        """The pooled httpx.Client used for all requests."""
+        if self._http is None:
+            with self._lock:
+                if self._http is None:
+                    self._http = httpx.Client(timeout=None)
+        return self._http
+
+    def close(self) -> None:
+        """Close the connection pool if this client created it."""
+        if self._http is not None and self._owns_http:
+            self._http.close()
+            self._http = None
+
+    def __enter__(self) -> "KanbnClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Make a request and return the decoded response body.
+
+        With the offline queue enabled, a write that cannot reach the API (or
+        that references a write still in the queue) is journaled instead and
+        a placeholder entity is returned. Failures after the request was sent
+        are raised, since the server may already have applied the write.
+        """
+        queueable = self._queueable(method, data)
+        queued, (endpoint, params, json) = self._resolve_placeholders(
+            method, [endpoint, params, json], queueable, headers
+        )
+        if queued is not None:
+            return queued
+        try:
+            return self.send(method, endpoint, params, json, data, timeout, headers)
+        except offline.UNSENT_ERRORS:
+            if not queueable:
+                raise
+            return self.offline_queue.enqueue(method, endpoint, params, json, headers)
+
+    def send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a request straight to the API, bypassing the offline queue."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method)
+            started = time.perf_counter()
+            try:
+                response = self.http.request(
+                    method,
+                    self._url(endpoint),
+                    headers={**self._build_headers(), **(headers or {})},
+                    params=params,
+                    json=json,
+                    data=data,
+                    timeout=_timeout(timeout),
+                )
+            except httpx.TransportError:
+                self._observe(method, endpoint, None, started)
+                raise
+            delay = self._retry_delay(response, attempt)
+            self._observe(method, endpoint, response, started, retried=delay is not None)
+            if delay is None:
+                return self._handle_response(response)
+            attempt += 1
+
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """Make a GET request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(url, headers=self._build_headers(), params=params)
-            return self._handle_response(response)
+        return self.request("GET", endpoint, params=params, timeout=timeout)
+
+    @contextmanager
+    def stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Iterator[str]]:
+        """Make a streaming GET request, yielding an iterator over decoded body chunks.
+
+        Use with the parsers in ``kanbn_cli.api.streaming`` to process large
+        responses without buffering the whole body. A throttled (429) response
+        is retried like ``send`` does, before any chunk is handed out.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire("GET")
+            started = time.perf_counter()
+            with self.http.stream(
+                "GET",
+                self._url(endpoint),
+                headers=self._build_headers(),
+                params=params,
+                timeout=_timeout(timeout),
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    if self._retry_delay(response, attempt) is not None:
+                        self._observe("GET", endpoint, response, started, retried=True)
+                        attempt += 1
+                        continue
+                try:
+                    if response.status_code >= 400:
+                        self._handle_response(response)
+                    yield response.iter_text()
+                finally:
+                    received = response.num_bytes_downloaded
+                    self._observe("GET", endpoint, response, started, received=received)
+                return
+
+    def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        items_key: Optional[str] = None,
+        prefetch: bool = True,
+        cursor_key: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """Yield successive raw pages of a collection endpoint.
+
+        Follows cursors from a ``pagination``/``meta`` envelope, or from the
+        ``cursor_key`` field when given, and falls back to ``offset`` paging
+        otherwise. ``limit`` is only sent when ``page_size`` is given. With
+        ``prefetch`` the next page is requested in the background while the
+        caller is still consuming the current one.
+        """
+        params = dict(params or {})
+        if page_size is not None:
+            params["limit"] = page_size
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        previous_first: Any = None
+        try:
+            page = self.get(endpoint, params=params)
+            while True:
+                items = page_items(page, items_key)
+                if items and previous_first is not None and items[0] == previous_first:
+                    # The server ignored the paging parameters and repeated itself
+                    return
+                previous_first = items[0] if items else None
+
+                next_params = self._next_page_params(
+                    page, params, page_size, items_key, cursor_key
+                )
+                future = None
+                if next_params is not None and executor is not None:
+                    future = executor.submit(self.get, endpoint, next_params)
+                yield page
+                if next_params is None:
+                    return
+                params = next_params
+                page = future.result() if future is not None else self.get(endpoint, params=params)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        items_key: Optional[str] = None,
+        prefetch: bool = True,
+        cursor_key: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """Iterate lazily over every item of a collection endpoint across all pages."""
+        for page in self.iter_pages(
+            endpoint, params, page_size, items_key, prefetch, cursor_key
+        ):
+            yield from page_items(page, items_key)
 
     def post(
-        self, endpoint: str, data: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> Any:
         """Make a POST request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(url, headers=self._build_headers(), data=data, json=json)
-            return self._handle_response(response)
+        return self.request(
+            "POST", endpoint, json=json, data=data, timeout=timeout, headers=headers
+        )
 
-    def put(self, endpoint: str, json: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Any:
+    def put(
+        self, endpoint: str, json: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> Any:
         """Make a PUT request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        with httpx.Client(timeout=timeout) as client:
-            response = client.put(url, headers=self._build_headers(), json=json)
-            return self._handle_response(response)
+        return self.request("PUT", endpoint, json=json, timeout=timeout)
 
-    def patch(self, endpoint: str, json: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Any:
+    def patch(
+        self, endpoint: str, json: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> Any:
         """Make a PATCH request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        with httpx.Client(timeout=timeout) as client:
-            response = client.patch(url, headers=self._build_headers(), json=json)
-            return self._handle_response(response)
+        return self.request("PATCH", endpoint, json=json, timeout=timeout)
 
     def delete(self, endpoint: str, timeout: Optional[float] = None) -> Any:
         """Make a DELETE request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        with httpx.Client(timeout=timeout) as client:
-            response = client.delete(url, headers=self._build_headers())
-            return self._handle_response(response)
+        return self.request("DELETE", endpoint, timeout=timeout)
+
+
+class AsyncKanbnClient(_BaseClient):
+    """Async HTTP client for Kan.bn API with the same interface as KanbnClient."""
+
+    def __init__(self, config: KanbnConfig, http: Optional[httpx.AsyncClient] = None):
+        """Initialize the client with configuration and an optional shared httpx.AsyncClient."""
+        super().__init__(config)
+        self._http = http
+        self._owns_http = http is None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """The pooled httpx.AsyncClient used for all requests."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=None)
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the connection pool if this client created it."""
+        if self._http is not None and self._owns_http:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncKanbnClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Make a request and return the decoded response body."""
+        queueable = self._queueable(method, data)
+        queued, (endpoint, params, json) = self._resolve_placeholders(
+            method, [endpoint, params, json], queueable, headers
+        )
+        if queued is not None:
+            return queued
+        try:
+            return await self.send(method, endpoint, params, json, data, timeout, headers)
+        except offline.UNSENT_ERRORS:
+            if not queueable:
+                raise
+            return self.offline_queue.enqueue(method, endpoint, params, json, headers)
+
+    async def send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a request straight to the API, bypassing the offline queue."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(method)
+                if wait:
+                    await asyncio.sleep(wait)
+            started = time.perf_counter()
+            try:
+                response = await self.http.request(
+                    method,
+                    self._url(endpoint),
+                    headers={**self._build_headers(), **(headers or {})},
+                    params=params,
+                    json=json,
+                    data=data,
+                    timeout=_timeout(timeout),
+                )
+            except httpx.TransportError:
+                self._observe(method, endpoint, None, started)
+                raise
+            delay = self._retry_delay(response, attempt)
+            self._observe(method, endpoint, response, started, retried=delay is not None)
+            if delay is None:
+                return self._handle_response(response)
+            attempt += 1
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Make a GET request."""
+        return await self.request("GET", endpoint, params=params, timeout=timeout)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[AsyncIterator[str]]:
+        """Make a streaming GET request, yielding an async iterator over body chunks."""
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve("GET")
+            if wait:
+                await asyncio.sleep(wait)
+        started = time.perf_counter()
+        async with self.http.stream(
+            "GET",
+            self._url(endpoint),
+            headers=self._build_headers(),
+            params=params,
+            timeout=_timeout(timeout),
+        ) as response:
+            try:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._handle_response(response)
+                yield response.aiter_text()
+            finally:
+                received = response.num_bytes_downloaded
+                self._observe("GET", endpoint, response, started, received=received)
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        items_key: Optional[str] = None,
+        prefetch: bool = True,
+        cursor_key: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        """Yield successive raw pages, prefetching the next one as a background task."""
+        params = dict(params or {})
+        if page_size is not None:
+            params["limit"] = page_size
+        previous_first: Any = None
+        task: Optional[asyncio.Task] = None
+        try:
+            page = await self.get(endpoint, params=params)
+            while True:
+                items = page_items(page, items_key)
+                if items and previous_first is not None and items[0] == previous_first:
+                    return
+                previous_first = items[0] if items else None
+
+                next_params = self._next_page_params(
+                    page, params, page_size, items_key, cursor_key
+                )
+                if next_params is not None and prefetch:
+                    task = asyncio.ensure_future(self.get(endpoint, params=next_params))
+                yield page
+                if next_params is None:
+                    return
+                params = next_params
+                page = await task if task is not None else await self.get(endpoint, params=params)
+                task = None
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        items_key: Optional[str] = None,
+        prefetch: bool = True,
+        cursor_key: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate lazily over every item of a collection endpoint across all pages."""
+        async for page in self.iter_pages(
+            endpoint, params, page_size, items_key, prefetch, cursor_key
+        ):
+            for item in page_items(page, items_key):
+                yield item
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Make a POST request."""
+        return await self.request(
+            "POST", endpoint, json=json, data=data, timeout=timeout, headers=headers
+        )
+
+    async def put(
+        self, endpoint: str, json: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> Any:
+        """Make a PUT request."""
+        return await self.request("PUT", endpoint, json=json, timeout=timeout)
+
+    async def patch(
+        self, endpoint: str, json: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None
+    ) -> Any:
+        """Make a PATCH request."""
+        return await self.request("PATCH", endpoint, json=json, timeout=timeout)
+
+    async def delete(self, endpoint: str, timeout: Optional[float] = None) -> Any:
+        """Make a DELETE request."""
+        return await self.request("DELETE", endpoint, timeout=timeout)
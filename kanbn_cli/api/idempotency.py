@@ -0,0 +1,246 @@
+"""Idempotent create calls.
+
+Every create is sent with an ``Idempotency-Key`` header. When the caller
+supplies the key, its outcome is recorded in ``<data dir>/idempotency.json``
+(pending while in flight, then the created entity), and calling
+``create_once`` again with the same key returns the recorded entity without
+a request, so a batch job can be rerun or retried freely.
+
+Servers that ignore the header are covered by a lookup: when a create timed
+out after being sent, or a previous run died mid-flight, the parent board is
+searched for an entity with the same name (and list, for cards) before the
+request is sent again. Only entities created since the first attempt count
+(give or take a few seconds of clock skew); a key resumed from the store
+looks back LOOKUP_WINDOW, since its first attempt was made by an earlier run.
+
+A create that went to the offline queue is recorded as ``queued`` with its
+``@local:`` ID, never as done: ``queue replay`` records the real entity, and
+until then a rerun gets the same placeholder back. A create the server
+rejected outright is forgotten, so the next run starts fresh.
+"""
+
+import json
+import time
+import uuid
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import httpx
+
+from kanbn_cli.api.records import entity_id
+from kanbn_cli.config import get_data_dir
+from kanbn_cli.utils.dates import parse_timestamp
+from kanbn_cli.utils.filelock import locked_file
+
+KEY_HEADER = "Idempotency-Key"
+
+# How long a key's result is remembered
+DEFAULT_TTL = 24 * 3600
+
+# How far before the recorded start a match still counts, for keys resumed from the store
+LOOKUP_WINDOW = 600
+
+# Allowance for server clock skew when the first attempt was made by this process
+CLOCK_SKEW = 5
+
+# Errors after which the server may or may not have applied the request
+AMBIGUOUS_ERRORS = (
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+
+def idempotency_headers(key: Optional[str]) -> Optional[Dict[str, str]]:
+    """Headers carrying key, or None when no key is given."""
+    return {KEY_HEADER: key} if key else None
+
+
+class Lookup(NamedTuple):
+    """Where to look for an entity a lost create may already have made."""
+
+    board_id: str
+    collection: str  # "lists", "labels" or "cards"
+    name: str
+    list_id: str = ""
+
+
+def find_existing(
+    client: Any, lookup: Lookup, since: float, window: float = LOOKUP_WINDOW
+) -> Optional[Dict[str, Any]]:
+    """Return an entity matching lookup that was created after ``since - window``."""
+    board = client.get(f"boards/{lookup.board_id}")
+    lists = board.get("lists", [])
+    if lookup.collection == "lists":
+        candidates = lists
+    elif lookup.collection == "labels":
+        candidates = board.get("labels", [])
+    else:
+        candidates = [
+            card
+            for lst in lists
+            if not lookup.list_id or entity_id(lst) == lookup.list_id
+            for card in lst.get("cards", [])
+        ]
+
+    cutoff = since - window
+    for entity in reversed(candidates):
+        name = entity.get("title") if lookup.collection == "cards" else entity.get("name")
+        if name != lookup.name:
+            continue
+        created = parse_timestamp(entity.get("createdAt"))
+        if created is not None and created >= cutoff:
+            return entity
+    return None
+
+
+class IdempotencyStore:
+    """Key -> outcome records shared by all processes, expiring after ``ttl`` seconds."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.path = get_data_dir() / "idempotency.json"
+        self.ttl = ttl
+
+    def _update(self, fn: Callable[[Dict[str, Any], float], Any]) -> Any:
+        with locked_file(self.path) as f:
+            try:
+                records = json.loads(f.read() or "{}")
+            except ValueError:
+                records = {}
+            now = time.time()
+            records = {
+                key: record
+                for key, record in records.items()
+                if now - record.get("started", now) < self.ttl
+            }
+            result = fn(records, now)
+            f.seek(0)
+            f.truncate()
+            json.dump(records, f)
+        return result
+
+    def begin(self, key: str) -> Optional[Dict[str, Any]]:
+        """Mark key as in flight; return its existing record, if any."""
+
+        def claim(records: Dict[str, Any], now: float) -> Optional[Dict[str, Any]]:
+            existing = records.get(key)
+            if existing is None:
+                records[key] = {"status": "pending", "started": now}
+            return existing
+
+        return self._update(claim)
+
+    def finish(self, key: str, entity: Any) -> None:
+        """Record the entity created for key."""
+
+        def record(records: Dict[str, Any], now: float) -> None:
+            started = records.get(key, {}).get("started", now)
+            records[key] = {"status": "done", "started": started, "entity": entity}
+
+        self._update(record)
+
+    def queued(self, key: str, local_id: str) -> None:
+        """Record that the create for key is waiting in the offline queue as local_id."""
+
+        def record(records: Dict[str, Any], now: float) -> None:
+            started = records.get(key, {}).get("started", now)
+            records[key] = {"status": "queued", "started": started, "localId": local_id}
+
+        self._update(record)
+
+    def replayed(self, key: str, local_id: str, entity: Any) -> None:
+        """Record the entity a replayed create made, if key is still waiting on local_id."""
+
+        def record(records: Dict[str, Any], now: float) -> None:
+            existing = records.get(key)
+            if existing and existing.get("localId") == local_id:
+                records[key] = {"status": "done", "started": existing["started"], "entity": entity}
+
+        self._update(record)
+
+    def discard(self, key: str) -> None:
+        """Forget key, e.g. after the server rejected its create."""
+        self._update(lambda records, now: records.pop(key, None))
+
+
+def _queued_result(client: Any, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """What a create recorded as queued amounts to now, or None if it will never be sent."""
+    local_id = record.get("localId")
+    for entry in client.offline_queue.state().values():
+        if entry["localId"] != local_id:
+            continue
+        if entry["status"] == "pending":
+            return {"publicId": local_id, "queued": True}
+        if entry["status"] == "done" and entry.get("publicId"):
+            return {"publicId": entry["publicId"]}
+        return None
+    return None
+
+
+def create_once(
+    client: Any,
+    endpoint: str,
+    payload: Dict[str, Any],
+    key: Optional[str] = None,
+    lookup: Optional[Lookup] = None,
+    store: Optional[IdempotencyStore] = None,
+    retries: int = 2,
+) -> Any:
+    """POST a create at most once per key and return the created entity.
+
+    Only caller-supplied keys are recorded in the store; without one a
+    random key still protects the retries made here. Ambiguous failures
+    (timeouts after the request was sent) are retried with the same key,
+    checking ``lookup`` first when given.
+    """
+    if key is None:
+        key, store = uuid.uuid4().hex, None
+    else:
+        store = store or IdempotencyStore()
+    existing = store.begin(key) if store else None
+    if existing is not None and existing.get("status") == "queued":
+        result = _queued_result(client, existing)
+        if result is not None:
+            return result
+        # The queued create failed on replay or was cleared: start over
+        store.discard(key)
+        existing = store.begin(key)
+    if existing is not None and existing.get("status") == "done":
+        return existing["entity"]
+
+    started = existing["started"] if existing else time.time()
+    # Nothing created well before this process's first attempt can be ours,
+    # unless the key was resumed from an earlier run
+    window = LOOKUP_WINDOW if existing is not None else CLOCK_SKEW
+    if existing is not None and lookup is not None:
+        # A previous run sent this create but never recorded the outcome
+        found = find_existing(client, lookup, started)
+        if found is not None:
+            store.finish(key, found)
+            return found
+
+    attempt = 0
+    while True:
+        try:
+            entity = client.post(endpoint, json=payload, headers=idempotency_headers(key))
+            break
+        except AMBIGUOUS_ERRORS:
+            if attempt >= retries:
+                raise
+            attempt += 1
+            found = find_existing(client, lookup, started, window) if lookup is not None else None
+            if found is not None:
+                entity = found
+                break
+        except Exception:
+            # The server rejected the create (or it never left): nothing to resume
+            if store:
+                store.discard(key)
+            raise
+
+    if store:
+        if isinstance(entity, dict) and entity.get("queued"):
+            store.queued(key, entity_id(entity))
+        else:
+            store.finish(key, entity)
+    return entity
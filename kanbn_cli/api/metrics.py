@@ -0,0 +1,231 @@
+"""Request metrics for the API clients, exported in the Prometheus text format.
+
+Metrics are off unless ``KANBN_METRICS_FILE`` or ``KANBN_METRICS_URL`` is
+set; disabled clients skip recording entirely. When enabled, every request
+is counted per endpoint template (IDs replaced by ``{id}``), method and
+status class, with retries, body bytes and a latency histogram. At exit the
+process's samples are either
+
+* merged into ``KANBN_METRICS_FILE`` for node_exporter's textfile collector
+  (summed with what earlier runs wrote, under a lock, and replaced
+  atomically, so many cron jobs can share one file), or
+* POSTed to ``KANBN_METRICS_URL`` (a local OpenMetrics/Pushgateway-style
+  endpoint) as this process's counts.
+
+Samples carry a ``job`` label from ``KANBN_METRICS_JOB`` (default ``kanbn``).
+"""
+
+import atexit
+import os
+import re
+import sys
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from kanbn_cli.utils.filelock import locked_file
+
+# Latency histogram bucket upper bounds, in seconds
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+FAMILIES = {
+    "kanbn_client_requests_total": ("counter", "API requests by endpoint, method and status class"),
+    "kanbn_client_retries_total": ("counter", "API requests retried after a 429 response"),
+    "kanbn_client_request_bytes_total": ("counter", "Request body bytes sent"),
+    "kanbn_client_response_bytes_total": ("counter", "Response body bytes received"),
+    "kanbn_client_request_duration_seconds": ("histogram", "API request latency in seconds"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+SampleKey = Tuple[str, Labels]
+
+_SAMPLE = re.compile(r"^([a-zA-Z_:][\w:]*)(?:\{(.*)\})?\s+(\S+)$")
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+_ID_SEGMENT = re.compile(r"^@local:|\d|^[A-Za-z0-9_-]{12,}$")
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(endpoint: str) -> str:
+    """Collapse IDs in an endpoint path, e.g. ``cards/abc123/labels`` -> ``cards/{id}/labels``."""
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    return "/".join(
+        "{id}" if i % 2 and _ID_SEGMENT.search(segment) else segment
+        for i, segment in enumerate(segments)
+    )
+
+
+def status_class(status: Optional[int]) -> str:
+    """``2xx``-style class of a status code, or ``error`` for transport failures."""
+    return f"{status // 100}xx" if status else "error"
+
+
+class Metrics:
+    """Thread-safe sample store for one process."""
+
+    def __init__(self, job: str = "kanbn"):
+        self.job = job
+        self.samples: Dict[SampleKey, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        host: str,
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        duration: float,
+        sent: int = 0,
+        received: int = 0,
+        retried: bool = False,
+    ) -> None:
+        """Record one request attempt."""
+        base: Labels = (
+            ("job", self.job),
+            ("host", host),
+            ("endpoint", endpoint_template(endpoint)),
+            ("method", method.upper()),
+        )
+        histogram = "kanbn_client_request_duration_seconds"
+        with self._lock:
+            samples = self.samples
+            samples["kanbn_client_requests_total", base + (("status", status_class(status)),)] += 1
+            if retried:
+                samples["kanbn_client_retries_total", base] += 1
+            if sent:
+                samples["kanbn_client_request_bytes_total", base] += sent
+            if received:
+                samples["kanbn_client_response_bytes_total", base] += received
+            for bound in BUCKETS:
+                if duration <= bound:
+                    samples[f"{histogram}_bucket", base + (("le", f"{bound:g}"),)] += 1
+            samples[f"{histogram}_bucket", base + (("le", "+Inf"),)] += 1
+            samples[f"{histogram}_sum", base] += duration
+            samples[f"{histogram}_count", base] += 1
+
+    def snapshot(self) -> Dict[SampleKey, float]:
+        with self._lock:
+            return dict(self.samples)
+
+
+def _family(name: str) -> str:
+    for suffix in ("_bucket", "_sum", "_count"):
+        if name.endswith(suffix) and name[: -len(suffix)] in FAMILIES:
+            return name[: -len(suffix)]
+    return name
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\(.)", lambda m: "\n" if m.group(1) == "n" else m.group(1), value)
+
+
+def render(samples: Dict[SampleKey, float]) -> str:
+    """Format samples as Prometheus text exposition, grouped by metric family."""
+    by_family: Dict[str, list] = defaultdict(list)
+    for (name, labels), value in samples.items():
+        by_family[_family(name)].append((name, labels, value))
+
+    lines = []
+    for family in sorted(by_family):
+        kind, help_text = FAMILIES.get(family, ("untyped", ""))
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+        for name, labels, value in sorted(by_family[family], key=_sort_key):
+            label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels)
+            lines.append(f"{name}{{{label_text}}} {_format_value(value)}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _sort_key(sample: Tuple[str, Labels, float]) -> Tuple:
+    name, labels, _ = sample
+    # One series at a time, with histogram buckets in ascending ``le`` order
+    le = dict(labels).get("le")
+    bound = float("inf") if le == "+Inf" else float(le) if le else 0.0
+    return (tuple(pair for pair in labels if pair[0] != "le"), name, bound)
+
+
+def parse(text: str) -> Dict[SampleKey, float]:
+    """Parse samples of our own families back out of a text exposition."""
+    samples: Dict[SampleKey, float] = {}
+    for line in text.splitlines():
+        match = _SAMPLE.match(line.strip())
+        if not match or _family(match.group(1)) not in FAMILIES:
+            continue
+        labels = tuple(
+            (key, _unescape(value)) for key, value in _LABEL.findall(match.group(2) or "")
+        )
+        try:
+            samples[match.group(1), labels] = float(match.group(3))
+        except ValueError:
+            continue
+    return samples
+
+
+def export_textfile(path: Path, samples: Dict[SampleKey, float]) -> None:
+    """Add samples to the counters already in path and replace it atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with locked_file(path.with_name(path.name + ".lock")):
+        merged = parse(path.read_text()) if path.exists() else {}
+        for key, value in samples.items():
+            merged[key] = merged.get(key, 0.0) + value
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(render(merged))
+        os.replace(tmp, path)
+
+
+def push(url: str, samples: Dict[SampleKey, float]) -> None:
+    """POST samples in the text format to a metrics endpoint."""
+    response = httpx.post(
+        url,
+        content=render(samples),
+        headers={"Content-Type": "text/plain; version=0.0.4"},
+        timeout=5.0,
+    )
+    response.raise_for_status()
+
+
+_registry: Optional[Metrics] = None
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def get_registry() -> Optional[Metrics]:
+    """The process-wide Metrics, or None when no export target is configured."""
+    global _registry, _configured
+    if not _configured:
+        with _configure_lock:
+            if not _configured:
+                if os.getenv("KANBN_METRICS_FILE") or os.getenv("KANBN_METRICS_URL"):
+                    _registry = Metrics(os.getenv("KANBN_METRICS_JOB") or "kanbn")
+                    atexit.register(flush)
+                _configured = True
+    return _registry
+
+
+def flush() -> None:
+    """Export this process's samples to the configured targets."""
+    if _registry is None:
+        return
+    samples = _registry.snapshot()
+    if not samples:
+        return
+    path = os.getenv("KANBN_METRICS_FILE")
+    url = os.getenv("KANBN_METRICS_URL")
+    try:
+        if path:
+            export_textfile(Path(path).expanduser(), samples)
+        if url:
+            push(url, samples)
+    except (OSError, httpx.HTTPError) as e:
+        print(f"kanbn: could not export metrics: {e}", file=sys.stderr)
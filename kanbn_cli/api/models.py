@@ -1,7 +1,7 @@
 """Pydantic models for Kan.bn API entities."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
 
@@ -71,7 +71,7 @@ class Checklist(BaseModel):
     id: Optional[str] = None
     public_id: Optional[str] = None
     title: str
-    items: List[ChecklistItem] = Field(default_factory=list)
+    items: list[ChecklistItem] = Field(default_factory=list)
 
 
 class Comment(BaseModel):
@@ -96,9 +96,9 @@ class Card(BaseModel):
     description: Optional[str] = None
     position: Optional[int] = None
     due_date: Optional[datetime] = None
-    labels: List[Label] = Field(default_factory=list)
-    checklists: List[Checklist] = Field(default_factory=list)
-    comments: List[Comment] = Field(default_factory=list)
+    labels: list[Label] = Field(default_factory=list)
+    checklists: list[Checklist] = Field(default_factory=list)
+    comments: list[Comment] = Field(default_factory=list)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
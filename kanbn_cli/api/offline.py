@@ -0,0 +1,303 @@
+"""Durable queue for writes made while the API is unreachable.
+
+When enabled, a write that could not be sent at all (connection refused,
+DNS failure, connect timeout) is appended to ``<data dir>/queue.jsonl`` and the
+caller gets a placeholder entity whose ID is ``@local:<id>``. Placeholders can
+be passed to later commands; any write that references an unresolved one is
+queued behind it instead of being sent. ``replay`` sends the queue in
+dependency levels: operations touching the same resource keep their journal
+order, unrelated ones run concurrently, and each result is journaled so a
+placeholder resolves to the real public ID.
+
+The journal is append-only; its current state is the fold of its records:
+``queued`` (the request), ``done`` (with the real ID), ``failed`` and
+``retry`` (puts a failed operation back in the queue).
+"""
+
+import json
+import os
+import re
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import httpx
+
+from kanbn_cli.api.idempotency import KEY_HEADER, IdempotencyStore
+from kanbn_cli.api.records import entity_id
+from kanbn_cli.config import KanbnConfig, get_data_dir
+from kanbn_cli.utils.concurrency import run_bounded
+from kanbn_cli.utils.filelock import locked_file
+
+LOCAL_PREFIX = "@local:"
+LOCAL_ID = re.compile(r"@local:[0-9a-f]{8}")
+
+# Errors raised before the request left this machine. Anything later (a read
+# timeout, a dropped connection) may come after the server applied the write,
+# so queueing it would create a duplicate on replay.
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+_enabled = False
+# Operations queued by this process, for the end-of-run notice
+queued_here: List[Dict[str, Any]] = []
+
+
+def set_enabled(enabled: bool = True) -> None:
+    """Turn the offline queue on for this process."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled(config: KanbnConfig) -> bool:
+    """Whether writes are queued (--offline-queue, ``offline_queue`` or KANBN_OFFLINE_QUEUE)."""
+    env = os.getenv("KANBN_OFFLINE_QUEUE", "").lower() in ("1", "true", "yes")
+    return _enabled or config.offline_queue or env
+
+
+def has_placeholders(value: Any) -> bool:
+    """Whether value (a string or nested JSON data) mentions any ``@local:`` ID."""
+    return bool(_local_ids(value))
+
+
+def _local_ids(value: Any) -> Set[str]:
+    if isinstance(value, str):
+        return set(LOCAL_ID.findall(value))
+    if isinstance(value, dict):
+        return set().union(*map(_local_ids, value.values())) if value else set()
+    if isinstance(value, (list, tuple)):
+        return set().union(*map(_local_ids, value)) if value else set()
+    return set()
+
+
+def _substitute(value: Any, mapping: Dict[str, str]) -> Any:
+    if isinstance(value, str):
+        return LOCAL_ID.sub(lambda m: mapping.get(m.group(0), m.group(0)), value)
+    if isinstance(value, dict):
+        return {key: _substitute(item, mapping) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, mapping) for item in value]
+    return value
+
+
+def _resources(entry: Dict[str, Any]) -> Set[str]:
+    """IDs an operation touches: path IDs plus ``*PublicId(s)``/``*_id`` body fields."""
+    segments = entry["endpoint"].strip("/").split("/")
+    found = set(segments[1::2])
+    for key, value in (entry.get("json") or {}).items():
+        if key.endswith(("PublicId", "_id", "Id")) and isinstance(value, str):
+            found.add(value)
+        elif key.endswith(("PublicIds", "_ids")) and isinstance(value, list):
+            found.update(v for v in value if isinstance(v, str))
+    return found
+
+
+class OfflineQueue:
+    """Append-only journal of queued writes."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_data_dir() / "queue.jsonl"
+
+    def _append(self, *records: Dict[str, Any]) -> None:
+        with locked_file(self.path) as f:
+            f.seek(0, 2)
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+
+    def _records(self) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        with locked_file(self.path) as f:
+            lines = f.read().splitlines()
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue  # a torn final line from an interrupted write
+        return records
+
+    def state(self) -> Dict[str, Dict[str, Any]]:
+        """Fold the journal into one entry per operation, in journal order."""
+        entries: Dict[str, Dict[str, Any]] = {}
+        for record in self._records():
+            op = record.pop("op", None)
+            if op == "queued":
+                entries[record["id"]] = {**record, "status": "pending"}
+            elif op in ("done", "failed") and record.get("id") in entries:
+                entries[record["id"]].update(status=op, **record)
+            elif op == "retry" and record.get("id") in entries:
+                entries[record["id"]].update(status="pending", error=None)
+        return entries
+
+    def mapping(self) -> Dict[str, str]:
+        """Placeholder -> public ID for every replayed create."""
+        return {
+            entry["localId"]: entry["publicId"]
+            for entry in self.state().values()
+            if entry["status"] == "done" and entry.get("publicId")
+        }
+
+    def pending(self) -> List[Dict[str, Any]]:
+        return [entry for entry in self.state().values() if entry["status"] == "pending"]
+
+    def unresolved(self, value: Any) -> Set[str]:
+        """Placeholders referenced by value that have not been replayed yet."""
+        local = _local_ids(value)
+        return local - set(self.mapping()) if local else set()
+
+    def resolve(self, value: Any) -> Any:
+        """Replace replayed placeholders in value with their public IDs."""
+        return _substitute(value, self.mapping()) if _local_ids(value) else value
+
+    def enqueue(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_body: Any,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Journal a write and return the placeholder entity handed back to the caller."""
+        op_id = uuid.uuid4().hex[:8]
+        entry = {
+            "op": "queued",
+            "id": op_id,
+            "localId": f"{LOCAL_PREFIX}{op_id}",
+            "method": method,
+            "endpoint": endpoint,
+            "params": params,
+            "json": json_body,
+            "headers": headers,
+        }
+        self._append(entry)
+        queued_here.append(entry)
+        placeholder = dict(json_body) if isinstance(json_body, dict) else {}
+        placeholder.update(publicId=entry["localId"], queued=True)
+        return placeholder
+
+    def retry_failed(self) -> int:
+        """Put every failed operation back in the queue; return how many."""
+        failed = [entry["id"] for entry in self.state().values() if entry["status"] == "failed"]
+        if failed:
+            self._append(*({"op": "retry", "id": op_id} for op_id in failed))
+        return len(failed)
+
+    def clear(self) -> int:
+        """Drop the whole journal and return how many operations were still pending."""
+        count = len(self.pending())
+        with locked_file(self.path) as f:
+            f.truncate(0)
+        return count
+
+    def compact(self) -> None:
+        """Rewrite the journal keeping unfinished entries and placeholder mappings only."""
+        with locked_file(self.path) as f:
+            records = []
+            for line in f.read().splitlines():
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+            finished = {r["id"]: r for r in records if r.get("op") == "done"}
+            keep = []
+            for record in records:
+                done = finished.get(record.get("id"))
+                if done is None:
+                    keep.append(record)
+                elif record.get("op") == "queued" and done.get("publicId"):
+                    # Later placeholders may still reference this create
+                    keep.append({**record, "json": None, "params": None, "headers": None})
+                    keep.append(done)
+            f.seek(0)
+            f.truncate()
+            f.write("".join(json.dumps(record) + "\n" for record in keep))
+
+    def replay(
+        self,
+        send: Callable[..., Any],
+        concurrency: int = 8,
+        on_result: Optional[Callable[[Dict[str, Any], Any, Optional[BaseException]], None]] = None,
+        is_offline: Callable[[BaseException], bool] = lambda e: False,
+    ) -> Dict[str, int]:
+        """Send pending operations level by level and journal each result.
+
+        An operation waits for every earlier pending operation that creates
+        a placeholder it references or touches one of its resources. Levels
+        run with bounded concurrency; dependents of a failed operation stay
+        pending, and replay stops early if ``is_offline`` says the API is
+        still unreachable.
+        """
+        pending = self.pending()
+        levels: Dict[str, int] = {}
+        depends: Dict[str, Set[str]] = {}
+        last_touch: Dict[str, str] = {}
+        producers = {entry["localId"]: entry["id"] for entry in pending}
+        for entry in pending:
+            deps = {
+                producers[local]
+                for local in _local_ids([entry["endpoint"], entry.get("json")])
+                if local in producers
+            }
+            resources = _resources(entry)
+            deps.update(last_touch[r] for r in resources if r in last_touch)
+            deps.discard(entry["id"])
+            depends[entry["id"]] = deps
+            levels[entry["id"]] = 1 + max((levels[d] for d in deps), default=-1)
+            for resource in resources | {entry["localId"]}:
+                last_touch[resource] = entry["id"]
+
+        counts = {"done": 0, "failed": 0, "skipped": 0}
+        blocked: Set[str] = set()
+        keys = IdempotencyStore()
+        for level in range(max(levels.values(), default=-1) + 1):
+            batch = [
+                entry
+                for entry in pending
+                if levels[entry["id"]] == level and not depends[entry["id"]] & blocked
+            ]
+            skipped = [e for e in pending if levels[e["id"]] == level and e not in batch]
+            blocked.update(entry["id"] for entry in skipped)
+            counts["skipped"] += len(skipped)
+            if not batch:
+                continue
+
+            mapping = self.mapping()
+
+            def run(entry: Dict[str, Any]) -> Any:
+                return send(
+                    entry["method"],
+                    _substitute(entry["endpoint"], mapping),
+                    _substitute(entry.get("params"), mapping),
+                    _substitute(entry.get("json"), mapping),
+                    entry.get("headers"),
+                )
+
+            records = []
+            offline = False
+            for outcome in run_bounded(run, batch, concurrency):
+                entry = outcome.item
+                if outcome.ok:
+                    public_id = entity_id(outcome.value) if isinstance(outcome.value, dict) else ""
+                    records.append({"op": "done", "id": entry["id"], "publicId": public_id})
+                    counts["done"] += 1
+                    key = (entry.get("headers") or {}).get(KEY_HEADER)
+                    if key and public_id:
+                        # A rerun with the same --idempotency-key now gets the real entity
+                        keys.replayed(key, entry["localId"], outcome.value)
+                elif is_offline(outcome.error):
+                    offline = True
+                    blocked.add(entry["id"])
+                    counts["skipped"] += 1
+                else:
+                    records.append({"op": "failed", "id": entry["id"], "error": str(outcome.error)})
+                    blocked.add(entry["id"])
+                    counts["failed"] += 1
+                if on_result:
+                    on_result(entry, outcome.value, outcome.error)
+            if records:
+                self._append(*records)
+            if offline:
+                counts["skipped"] += sum(1 for e in pending if levels[e["id"]] > level)
+                break
+        self.compact()
+        return counts
+
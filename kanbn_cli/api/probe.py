@@ -0,0 +1,121 @@
+"""Latency probes for synthetic monitoring.
+
+Each probe is a GET timed in phases through httpx's ``trace`` extension:
+``connect`` (TCP plus TLS, zero when a pooled connection is reused),
+``ttfb`` (request start until the response headers arrive) and ``total``
+(including the body). Probes are spread over a bounded worker pool and
+summarized per endpoint with percentiles, error rate and throughput.
+"""
+
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import httpx
+
+from kanbn_cli.utils.concurrency import iter_completed
+from kanbn_cli.utils.numeric import summarize
+
+DEFAULT_ENDPOINTS = ("health", "users/me", "workspaces")
+PHASES = ("connect", "ttfb", "total")
+PERCENTILES = (50, 95, 99)
+
+
+class Sample(NamedTuple):
+    """One timed request; timings are seconds, status is None on transport errors."""
+
+    endpoint: str
+    status: Optional[int]
+    connect: float
+    ttfb: float
+    total: float
+    error: str = ""
+    body: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+
+def probe(client: Any, endpoint: str, timeout: float = 15.0) -> Sample:
+    """Time a single GET of endpoint through the client's connection pool."""
+    marks: Dict[str, float] = {}
+
+    def trace(event: str, info: Dict[str, Any]) -> None:
+        marks[event] = time.perf_counter()
+
+    http = client.http  # created outside the timed region
+    if client.rate_limiter is not None:
+        client.rate_limiter.acquire("GET")
+    started = time.perf_counter()
+    try:
+        response = http.get(
+            client._url(endpoint),
+            headers=client._build_headers(),
+            timeout=timeout,
+            extensions={"trace": trace},
+        )
+    except httpx.HTTPError as e:
+        elapsed = time.perf_counter() - started
+        client._observe("GET", endpoint, None, started)
+        return Sample(endpoint, None, 0.0, elapsed, elapsed, f"{type(e).__name__}: {e}")
+    total = time.perf_counter() - started
+    client._observe("GET", endpoint, response, started)
+
+    connect = 0.0
+    for phase in ("connection.connect_tcp", "connection.start_tls"):
+        if f"{phase}.complete" in marks and f"{phase}.started" in marks:
+            connect += marks[f"{phase}.complete"] - marks[f"{phase}.started"]
+    headers_done = next(
+        (marks[event] for event in marks if event.endswith("receive_response_headers.complete")),
+        None,
+    )
+    ttfb = headers_done - started if headers_done is not None else total
+
+    error = "" if response.status_code < 400 else f"HTTP {response.status_code}"
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    return Sample(endpoint, response.status_code, connect, ttfb, total, error, body)
+
+
+def run_probes(
+    client: Any,
+    endpoints: Sequence[str] = DEFAULT_ENDPOINTS,
+    samples: int = 1,
+    concurrency: int = 1,
+    timeout: float = 15.0,
+) -> Dict[str, Any]:
+    """Probe every endpoint ``samples`` times and summarize the results.
+
+    Returns ``{"samples": [...], "wall": seconds, "endpoints": {endpoint:
+    {"count", "errors", "error_rate", "connect": {...}, "ttfb": {...},
+    "total": {...}}}}`` where the phase dicts hold avg/max/p50/p95/p99.
+    """
+    jobs = [endpoint for _ in range(samples) for endpoint in endpoints]
+    started = time.perf_counter()
+    results: List[Sample] = []
+    for outcome in iter_completed(lambda e: probe(client, e, timeout), jobs, concurrency):
+        if not outcome.ok:
+            raise outcome.error  # e.g. missing credentials; request errors are samples
+        results.append(outcome.value)
+    wall = time.perf_counter() - started
+    return {"samples": results, "wall": wall, "endpoints": summarize_samples(results, endpoints)}
+
+
+def summarize_samples(results: Sequence[Sample], endpoints: Sequence[str]) -> Dict[str, Any]:
+    """Per-endpoint error rate and phase percentiles (over successful samples only)."""
+    summary = {}
+    for endpoint in endpoints:
+        mine = [s for s in results if s.endpoint == endpoint]
+        ok = [s for s in mine if s.ok]
+        errors = len(mine) - len(ok)
+        entry: Dict[str, Any] = {
+            "count": len(mine),
+            "errors": errors,
+            "error_rate": errors / len(mine) if mine else 0.0,
+        }
+        for phase in PHASES:
+            entry[phase] = summarize([getattr(s, phase) for s in ok], PERCENTILES)
+        summary[endpoint] = entry
+    return summary
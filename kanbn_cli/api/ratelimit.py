@@ -0,0 +1,189 @@
+"""Client-side rate limiting shared by every CLI process on the machine.
+
+Each API host has a read budget (GET) and a write budget (everything else),
+each a token bucket whose state lives in ``<data dir>/ratelimit.json``.
+Taking a token locks the file, refills the bucket for the elapsed time and
+reserves one token; the bucket may go negative, which queues the caller
+behind earlier reservations. The lock is released before sleeping, so
+overlapping cron jobs share the budget fairly without ever holding the lock
+while they wait.
+
+Budgets come from ``rate_limits`` in ``~/.kanbnrc``, keyed by host (``*``
+for any host), or from ``KANBN_RATE_LIMIT`` such as ``read=20,write=5``
+(requests per second, plus an optional ``burst``). Without a budget the
+limiter is disabled and costs nothing.
+"""
+
+import json
+import os
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from kanbn_cli.config import KanbnConfig, get_data_dir
+from kanbn_cli.utils.errors import ConfigurationError
+from kanbn_cli.utils.filelock import locked_file
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Retries after a 429 when a limiter is active
+MAX_RETRIES = 3
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class Budget(NamedTuple):
+    """Sustained requests per second and the burst allowed on top of it."""
+
+    rate: float
+    burst: float
+
+
+def parse_budgets(spec: Any) -> Dict[str, Budget]:
+    """Parse ``"read=20,write=5,burst=10"`` or the equivalent mapping into budgets."""
+    if isinstance(spec, str):
+        try:
+            spec = dict(
+                (key.strip(), float(value))
+                for key, value in (part.split("=", 1) for part in spec.split(",") if part.strip())
+            )
+        except ValueError:
+            raise ConfigurationError(f"Invalid rate limit: {spec!r} (expected read=N,write=N)")
+    if not isinstance(spec, Mapping):
+        raise ConfigurationError(f"Invalid rate limit: {spec!r}")
+
+    budgets = {}
+    for kind in ("read", "write"):
+        rate = spec.get(kind)
+        if rate:
+            burst = spec.get(f"{kind}_burst") or spec.get("burst") or max(1.0, float(rate))
+            budgets[kind] = Budget(float(rate), float(burst))
+    return budgets
+
+
+def retry_after(response: httpx.Response) -> float:
+    """Seconds to wait according to a 429 response's Retry-After header."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+class RateLimiter:
+    """Token buckets for one host, shared across processes through a state file."""
+
+    def __init__(self, host: str, budgets: Dict[str, Budget], state_path: Optional[Path] = None):
+        self.host = host
+        self.budgets = budgets
+        self.state_path = state_path or get_data_dir() / "ratelimit.json"
+        # Wait-time metrics for this process; the state file holds the totals
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config: KanbnConfig) -> Optional["RateLimiter"]:
+        """Build the limiter for the configured host, or None if no budget applies."""
+        host = urlparse(config.api_url).netloc or config.api_url
+        env = os.getenv("KANBN_RATE_LIMIT")
+        limits = config.rate_limits or {}
+        spec = env if env else limits.get(host, limits.get("*"))
+        if not spec:
+            return None
+        budgets = parse_budgets(spec)
+        return cls(host, budgets) if budgets else None
+
+    @staticmethod
+    def kind(method: str) -> str:
+        return "read" if method.upper() in READ_METHODS else "write"
+
+    def _update(self, fn) -> Any:
+        """Apply fn to the shared state under the file lock and persist it."""
+        with locked_file(self.state_path) as f:
+            try:
+                state = json.loads(f.read() or "{}")
+            except ValueError:
+                state = {}
+            result = fn(state, time.time())
+            f.seek(0)
+            f.truncate()
+            json.dump(state, f)
+        return result
+
+    def reserve(self, method: str) -> float:
+        """Take one token for method and return how long to wait before sending."""
+        kind = self.kind(method)
+        budget = self.budgets.get(kind)
+        if budget is None:
+            return 0.0
+
+        def take(state: Dict[str, Any], now: float) -> float:
+            bucket = state.setdefault(
+                f"{self.host}:{kind}", {"tokens": budget.burst, "updated": now}
+            )
+            elapsed = max(0.0, now - bucket["updated"])
+            tokens = min(budget.burst, bucket["tokens"] + elapsed * budget.rate) - 1
+            bucket.update(tokens=tokens, updated=now, rate=budget.rate, burst=budget.burst)
+            wait = max(0.0, -tokens / budget.rate)
+            bucket["requests"] = bucket.get("requests", 0) + 1
+            if wait:
+                bucket["waits"] = bucket.get("waits", 0) + 1
+                bucket["waitSeconds"] = bucket.get("waitSeconds", 0.0) + wait
+                bucket["maxWait"] = max(bucket.get("maxWait", 0.0), wait)
+            return wait
+
+        wait = self._update(take)
+        if wait:
+            self.waits += 1
+            self.wait_seconds += wait
+        return wait
+
+    def acquire(self, method: str) -> None:
+        """Block until a request with method may be sent."""
+        wait = self.reserve(method)
+        if wait:
+            time.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """Hold back every process's requests to this host for ``seconds`` (after a 429)."""
+
+        def drain(state: Dict[str, Any], now: float) -> None:
+            for kind, budget in self.budgets.items():
+                bucket = state.setdefault(
+                    f"{self.host}:{kind}", {"tokens": budget.burst, "updated": now}
+                )
+                elapsed = max(0.0, now - bucket["updated"])
+                tokens = min(budget.burst, bucket["tokens"] + elapsed * budget.rate)
+                bucket.update(tokens=min(tokens, -seconds * budget.rate), updated=now)
+                bucket["throttled"] = bucket.get("throttled", 0) + 1
+
+        self._update(drain)
+
+
+def read_state(state_path: Optional[Path] = None, reset: bool = False) -> Dict[str, Any]:
+    """Return the shared bucket state and wait metrics for all hosts.
+
+    With ``reset`` the state file is cleared after reading, refilling every
+    bucket and zeroing the metrics.
+    """
+    path = state_path or get_data_dir() / "ratelimit.json"
+    if not path.exists():
+        return {}
+    with locked_file(path) as f:
+        try:
+            state = json.loads(f.read() or "{}")
+        except ValueError:
+            state = {}
+        if reset:
+            f.seek(0)
+            f.truncate()
+    return state
@@ -0,0 +1,341 @@
+"""Compact typed records for decoding large API payloads.
+
+The pydantic models in ``models.py`` validate every field, which is too slow
+and memory-hungry for boards with thousands of cards. These records use
+``__slots__``, normalize ID and field aliases once at decode time, and keep
+nested checklists and comments as raw payloads until they are accessed.
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+ID_KEYS = ("publicId", "public_id", "id")
+
+
+def entity_id(data: Optional[Mapping[str, Any]]) -> str:
+    """Return the public ID of an API entity, whichever alias the payload uses."""
+    if not data:
+        return ""
+    for key in ID_KEYS:
+        value = data.get(key)
+        if value:
+            return str(value)
+    return ""
+
+
+def _field(data: Mapping[str, Any], *names: str, default: Any = None) -> Any:
+    for name in names:
+        value = data.get(name)
+        if value is not None:
+            return value
+    return default
+
+
+class Record:
+    """Base class for slotted API records."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the public fields as a plain dict (nested records included)."""
+        result = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name.startswith("_"):
+                    continue
+                value = getattr(self, name)
+                if isinstance(value, Record):
+                    value = value.to_dict()
+                elif isinstance(value, tuple):
+                    value = [v.to_dict() if isinstance(v, Record) else v for v in value]
+                result[name] = value
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        public_id = getattr(self, "public_id", "")
+        name = getattr(self, "name", None) or getattr(self, "title", "")
+        return f"{type(self).__name__}({public_id!r}, {name!r})"
+
+
+class Label(Record):
+    """Board label."""
+
+    __slots__ = ("public_id", "name", "color")
+
+    def __init__(self, public_id: str, name: str, color: str = ""):
+        self.public_id = public_id
+        self.name = name
+        self.color = color
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "Label":
+        color = _field(data, "colourCode", "color", default="")
+        return cls(entity_id(data), data.get("name", ""), color)
+
+
+class ChecklistItem(Record):
+    """Checklist item."""
+
+    __slots__ = ("public_id", "title", "completed", "index")
+
+    def __init__(self, public_id: str, title: str, completed: bool = False, index: int = 0):
+        self.public_id = public_id
+        self.title = title
+        self.completed = completed
+        self.index = index
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "ChecklistItem":
+        return cls(
+            entity_id(data),
+            data.get("title", ""),
+            bool(data.get("completed")),
+            _field(data, "index", "position", default=0),
+        )
+
+
+class Checklist(Record):
+    """Checklist with its items."""
+
+    __slots__ = ("public_id", "name", "items")
+
+    def __init__(self, public_id: str, name: str, items: Tuple[ChecklistItem, ...] = ()):
+        self.public_id = public_id
+        self.name = name
+        self.items = items
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "Checklist":
+        return cls(
+            entity_id(data),
+            _field(data, "name", "title", default="Untitled"),
+            tuple(ChecklistItem.from_api(item) for item in data.get("items", ())),
+        )
+
+
+class Comment(Record):
+    """Card comment."""
+
+    __slots__ = ("public_id", "comment", "author", "created_at")
+
+    def __init__(
+        self, public_id: str, comment: str, author: str = "", created_at: Optional[str] = None
+    ):
+        self.public_id = public_id
+        self.comment = comment
+        self.author = author
+        self.created_at = created_at
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "Comment":
+        author = data.get("createdBy") or data.get("user") or {}
+        return cls(
+            entity_id(data),
+            _field(data, "comment", "content", default=""),
+            author.get("name", "") if isinstance(author, Mapping) else str(author),
+            _field(data, "createdAt", "created_at"),
+        )
+
+
+class Card(Record):
+    """Card; checklists and comments are decoded on first access."""
+
+    __slots__ = (
+        "public_id",
+        "title",
+        "description",
+        "list_id",
+        "list_name",
+        "index",
+        "due_date",
+        "created_at",
+        "updated_at",
+        "labels",
+        "members",
+        "_raw_checklists",
+        "_checklists",
+        "_raw_comments",
+        "_comments",
+    )
+
+    def __init__(
+        self,
+        public_id: str,
+        title: str,
+        description: str = "",
+        list_id: str = "",
+        list_name: str = "",
+        index: int = 0,
+        due_date: Optional[str] = None,
+        created_at: Optional[str] = None,
+        updated_at: Optional[str] = None,
+        labels: Tuple[Label, ...] = (),
+        members: Tuple[str, ...] = (),
+        raw_checklists: Any = (),
+        raw_comments: Any = (),
+    ):
+        self.public_id = public_id
+        self.title = title
+        self.description = description
+        self.list_id = list_id
+        self.list_name = list_name
+        self.index = index
+        self.due_date = due_date
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.labels = labels
+        self.members = members
+        self._raw_checklists = raw_checklists
+        self._checklists: Optional[Tuple[Checklist, ...]] = None
+        self._raw_comments = raw_comments
+        self._comments: Optional[Tuple[Comment, ...]] = None
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any], list_id: str = "", list_name: str = "") -> "Card":
+        members = []
+        for member in data.get("members", ()):
+            user = member.get("user") or member
+            members.append(user.get("name") or user.get("email") or entity_id(member))
+        return cls(
+            entity_id(data),
+            data.get("title", ""),
+            data.get("description") or "",
+            list_id or _field(data, "listPublicId", "list_id", default=""),
+            list_name,
+            _field(data, "index", "position", default=0),
+            _field(data, "dueDate", "due_date"),
+            _field(data, "createdAt", "created_at"),
+            _field(data, "updatedAt", "updated_at"),
+            tuple(Label.from_api(label) for label in data.get("labels", ())),
+            tuple(members),
+            data.get("checklists") or (),
+            data.get("comments") or (),
+        )
+
+    @property
+    def checklists(self) -> Tuple[Checklist, ...]:
+        if self._checklists is None:
+            self._checklists = tuple(Checklist.from_api(c) for c in self._raw_checklists)
+            self._raw_checklists = ()
+        return self._checklists
+
+    @property
+    def comments(self) -> Tuple[Comment, ...]:
+        if self._comments is None:
+            self._comments = tuple(Comment.from_api(c) for c in self._raw_comments)
+            self._raw_comments = ()
+        return self._comments
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = super().to_dict()
+        result["checklists"] = [c.to_dict() for c in self.checklists]
+        result["comments"] = [c.to_dict() for c in self.comments]
+        return result
+
+
+class CardList(Record):
+    """List (column) on a board with its cards."""
+
+    __slots__ = ("public_id", "name", "index", "cards")
+
+    def __init__(self, public_id: str, name: str, index: int = 0, cards: Tuple[Card, ...] = ()):
+        self.public_id = public_id
+        self.name = name
+        self.index = index
+        self.cards = cards
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "CardList":
+        public_id = entity_id(data)
+        name = data.get("name", "")
+        return cls(
+            public_id,
+            name,
+            _field(data, "index", "position", default=0),
+            tuple(Card.from_api(card, public_id, name) for card in data.get("cards", ())),
+        )
+
+
+class Board(Record):
+    """Board with lists, cards and labels."""
+
+    __slots__ = ("public_id", "name", "slug", "description", "workspace_id", "lists", "labels")
+
+    def __init__(
+        self,
+        public_id: str,
+        name: str,
+        slug: str = "",
+        description: str = "",
+        workspace_id: str = "",
+        lists: Tuple[CardList, ...] = (),
+        labels: Tuple[Label, ...] = (),
+    ):
+        self.public_id = public_id
+        self.name = name
+        self.slug = slug
+        self.description = description
+        self.workspace_id = workspace_id
+        self.lists = lists
+        self.labels = labels
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "Board":
+        workspace = data.get("workspace")
+        if isinstance(workspace, Mapping):
+            workspace_id = entity_id(workspace)
+        else:
+            workspace_id = _field(data, "workspacePublicId", "workspace_id", default="")
+        return cls(
+            entity_id(data),
+            data.get("name", ""),
+            data.get("slug") or "",
+            data.get("description") or "",
+            workspace_id,
+            tuple(CardList.from_api(lst) for lst in data.get("lists", ())),
+            tuple(Label.from_api(label) for label in data.get("labels", ())),
+        )
+
+    def iter_cards(self) -> Iterator[Card]:
+        """Iterate over all cards, list by list."""
+        for lst in self.lists:
+            yield from lst.cards
+
+
+class Workspace(Record):
+    """Workspace."""
+
+    __slots__ = ("public_id", "name", "slug", "description", "role")
+
+    def __init__(
+        self, public_id: str, name: str, slug: str = "", description: str = "", role: str = ""
+    ):
+        self.public_id = public_id
+        self.name = name
+        self.slug = slug
+        self.description = description
+        self.role = role
+
+    @classmethod
+    def from_api(cls, data: Mapping[str, Any]) -> "Workspace":
+        # Membership listings wrap the workspace as {role, workspace}
+        inner = data.get("workspace") if isinstance(data.get("workspace"), Mapping) else data
+        return cls(
+            entity_id(inner),
+            inner.get("name", ""),
+            inner.get("slug") or "",
+            inner.get("description") or "",
+            data.get("role") or "",
+        )
+
+
+def decode_board(data: Mapping[str, Any]) -> Board:
+    """Decode a ``boards/{id}`` response into a Board record."""
+    return Board.from_api(data)
+
+
+def decode_workspaces(data: List[Mapping[str, Any]]) -> List[Workspace]:
+    """Decode a ``workspaces`` response into Workspace records."""
+    return [Workspace.from_api(ws) for ws in data or ()]
@@ -0,0 +1,186 @@
+"""Incremental JSON parsing of streamed API responses.
+
+The parser walks the JSON structure as text chunks arrive and only
+materializes values at the requested paths (e.g. every card of every list),
+so peak memory is bounded by the largest single item instead of the whole
+response. Paths are dot-joined object keys with ``item`` standing for any
+array element, e.g. ``lists.item.cards.item``.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from kanbn_cli.utils.errors import APIError
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+Event = Tuple[str, str, Any]
+
+
+class _Reader:
+    """Buffered cursor over an iterator of text chunks."""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, min_size: int = 1) -> bool:
+        """Append chunks until at least min_size unread characters are buffered."""
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        parts = [self.buf]
+        size = len(self.buf)
+        while size < min_size:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self.eof = True
+                break
+            parts.append(chunk)
+            size += len(chunk)
+        self.buf = "".join(parts)
+        return size > 0
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if self.eof or not self._fill():
+                return ""
+
+    def consume(self, char: str) -> None:
+        if self.peek() != char:
+            raise APIError(f"Malformed JSON stream: expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def _number_cut(self, end: int) -> bool:
+        """Whether a number decoded up to end may continue in the next chunk.
+
+        ``raw_decode`` stops a number early at a split such as ``1.|5`` or
+        ``2e|3``, so anything that still looks like number text running up
+        to the end of the buffer means more input is needed.
+        """
+        buf = self.buf
+        while end < len(buf) and buf[end] in _NUMBER_CHARS:
+            end += 1
+        return end == len(buf)
+
+    def value(self) -> Any:
+        """Decode one complete JSON value at the cursor, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise APIError("Malformed or truncated JSON stream")
+                # Grow geometrically so very large values are not re-parsed per chunk
+                self._fill(max(2 * (len(self.buf) - self.pos), 4096))
+                continue
+            if not self.eof and isinstance(value, (int, float)) and self._number_cut(end):
+                self._fill(len(self.buf) - self.pos + 1)
+                continue
+            self.pos = end
+            return value
+
+
+def _walk(reader: _Reader, path: str, targets: Set[str]) -> Iterator[Event]:
+    if path in targets:
+        yield "value", path, reader.value()
+        return
+
+    char = reader.peek()
+    if char == "{":
+        reader.consume("{")
+        yield "start_map", path, None
+        if reader.peek() == "}":
+            reader.consume("}")
+        else:
+            while True:
+                key = reader.value()
+                reader.consume(":")
+                yield from _walk(reader, f"{path}.{key}" if path else key, targets)
+                if reader.peek() == ",":
+                    reader.consume(",")
+                    continue
+                reader.consume("}")
+                break
+        yield "end_map", path, None
+    elif char == "[":
+        reader.consume("[")
+        yield "start_array", path, None
+        item_path = f"{path}.item" if path else "item"
+        if reader.peek() == "]":
+            reader.consume("]")
+        else:
+            while True:
+                yield from _walk(reader, item_path, targets)
+                if reader.peek() == ",":
+                    reader.consume(",")
+                    continue
+                reader.consume("]")
+                break
+        yield "end_array", path, None
+    elif char:
+        yield "value", path, reader.value()
+    else:
+        raise APIError("Unexpected end of JSON stream")
+
+
+def iter_events(chunks: Iterable[str], targets: Iterable[str] = ()) -> Iterator[Event]:
+    """Yield ``(event, path, value)`` tuples while parsing a JSON text stream.
+
+    Events are ``start_map``/``end_map``/``start_array``/``end_array`` and
+    ``value``. Values at ``targets`` paths are materialized whole and their
+    contents produce no further events; every other scalar is reported as a
+    ``value`` event.
+    """
+    return _walk(_Reader(chunks), "", set(targets))
+
+
+def iter_items(chunks: Iterable[str], prefix: str = "item") -> Iterator[Any]:
+    """Yield each value found at ``prefix`` (default: elements of a top-level array)."""
+    for event, path, value in iter_events(chunks, (prefix,)):
+        if event == "value" and path == prefix:
+            yield value
+
+
+class BoardStream:
+    """Stream the cards of a ``boards/{id}`` response as they are parsed.
+
+    Iterating yields ``(list_info, card)`` pairs, where ``list_info`` holds
+    the scalar fields of the enclosing list seen so far (the API serializes
+    them before the nested cards). Board-level scalars accumulate in
+    ``board`` while iterating.
+    """
+
+    CARD_PATH = "lists.item.cards.item"
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = chunks
+        self.board: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        current: Optional[Dict[str, Any]] = None
+        for event, path, value in iter_events(self._chunks, (self.CARD_PATH,)):
+            if path == self.CARD_PATH:
+                yield current or {}, value
+            elif path == "lists.item":
+                if event == "start_map":
+                    current = {}
+            elif event == "value":
+                parent, _, key = path.rpartition(".")
+                if not parent:
+                    self.board[key] = value
+                elif parent == "lists.item" and current is not None:
+                    current[key] = value
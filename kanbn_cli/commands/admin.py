@@ -1,40 +1,203 @@
 """Admin/System commands."""
 
+import json
+import time
+from typing import Any, Dict, List, Optional
+
 import typer
 
 from kanbn_cli.api.client import KanbnClient
-from kanbn_cli.config import load_config
-from kanbn_cli.utils.display import print_error, print_info, print_success
+from kanbn_cli.api.probe import DEFAULT_ENDPOINTS, run_probes
+from kanbn_cli.api.ratelimit import read_state
+from kanbn_cli.config import list_profiles, load_config
+from kanbn_cli.utils.display import (
+    display_health_report,
+    display_rate_limits,
+    get_console,
+    is_quiet,
+    print_data,
+    print_error,
+    print_info,
+    print_success,
+)
 from kanbn_cli.utils.errors import KanbnError, AuthenticationError
-from rich.console import Console
-from rich.panel import Panel
+from kanbn_cli.utils.instances import each_profile, fan_out_requested
 
 app = typer.Typer(help="System commands")
-console = Console()
+
+
+def _slo_breaches(
+    report: Dict[str, Any],
+    max_p95: Optional[float],
+    max_p99: Optional[float],
+    max_error_rate: Optional[float],
+) -> List[str]:
+    """Describe every endpoint that misses a latency (ms) or error-rate (%) objective."""
+    breaches = []
+    for endpoint, entry in report["endpoints"].items():
+        total = entry["total"]
+        for name, limit in (("p95", max_p95), ("p99", max_p99)):
+            value = total[name]
+            if limit is not None and value is not None and value * 1000 > limit:
+                breaches.append(f"{endpoint}: {name} {value * 1000:.1f}ms > {limit:g}ms")
+        rate = entry["error_rate"] * 100
+        if max_error_rate is not None and rate > max_error_rate:
+            breaches.append(f"{endpoint}: error rate {rate:.1f}% > {max_error_rate:g}%")
+    return breaches
 
 
 @app.command("health")
-def health_check():
-    """Check API health status."""
+def health_check(
+    samples: int = typer.Option(1, "--samples", "-n", min=1, help="Probes per endpoint"),
+    concurrency: int = typer.Option(1, "--concurrency", "-j", min=1, help="Probes in flight"),
+    endpoints: Optional[List[str]] = typer.Option(
+        None,
+        "--endpoint",
+        "-e",
+        help="Endpoint to probe (repeatable, default: health, users/me, workspaces)",
+    ),
+    timeout: float = typer.Option(15.0, "--timeout", help="Per-request timeout in seconds"),
+    max_p95: Optional[float] = typer.Option(
+        None, "--max-p95", help="SLO: highest acceptable p95 total latency in ms"
+    ),
+    max_p99: Optional[float] = typer.Option(
+        None, "--max-p99", help="SLO: highest acceptable p99 total latency in ms"
+    ),
+    max_error_rate: Optional[float] = typer.Option(
+        None, "--max-error-rate", help="SLO: highest acceptable error rate in percent"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the summary as JSON"),
+):
+    """Check API health and probe latency (exit 1 if unhealthy, 2 on an SLO breach)."""
     try:
+        targets = list(dict.fromkeys(endpoints or DEFAULT_ENDPOINTS))
+        if fan_out_requested():
+            _health_all(
+                targets, samples, concurrency, timeout, max_p95, max_p99, max_error_rate, as_json
+            )
+            return
+
         config = load_config()
         client = KanbnClient(config)
 
-        # Increase timeout for health check as it might take longer
-        health = client.get("health", timeout=15.0)
-        status = health.get("status", "unknown")
-        if status == "ok":
-            print_success(f"System Health: {status}")
+        report = run_probes(client, targets, samples, concurrency, timeout)
+        status = _health_status(report, targets)
+        breaches = _slo_breaches(report, max_p95, max_p99, max_error_rate)
+
+        if as_json:
+            typer.echo(json.dumps(_health_summary(report, status, breaches), indent=2))
         else:
-            print_error(f"System Health: {status}")
-        
-        console.print(health)
+            if status == "ok":
+                print_success(f"System Health: {status}")
+            elif status is not None:
+                print_error(f"System Health: {status}")
+            display_health_report(report)
+            _print_probe_errors(report)
+            for breach in breaches:
+                print_error(f"SLO breach: {breach}")
+
+        if status not in (None, "ok"):
+            raise typer.Exit(1)
+        if breaches:
+            raise typer.Exit(2)
 
     except KanbnError as e:
         print_error(str(e))
         raise typer.Exit(1)
 
 
+def _health_status(report: Dict[str, Any], targets: List[str]) -> Optional[str]:
+    """Status reported by the health endpoint, or None when it was not probed."""
+    health = next((s for s in report["samples"] if s.endpoint == "health" and s.ok), None)
+    if health is not None:
+        return health.body.get("status", "unknown") if isinstance(health.body, dict) else "ok"
+    return "unreachable" if "health" in targets else None
+
+
+def _health_summary(
+    report: Dict[str, Any], status: Optional[str], breaches: List[str]
+) -> Dict[str, Any]:
+    return {
+        "status": status,
+        "requests": len(report["samples"]),
+        "wall": report["wall"],
+        "throughput": len(report["samples"]) / report["wall"] if report["wall"] else 0.0,
+        "endpoints": report["endpoints"],
+        "breaches": breaches,
+    }
+
+
+def _print_probe_errors(report: Dict[str, Any], prefix: str = "") -> None:
+    errors = dict.fromkeys(f"{s.endpoint}: {s.error}" for s in report["samples"] if s.error)
+    for error in list(errors)[:5]:
+        print_error(prefix + error)
+
+
+def _health_all(
+    targets: List[str],
+    samples: int,
+    concurrency: int,
+    timeout: float,
+    max_p95: Optional[float],
+    max_p99: Optional[float],
+    max_error_rate: Optional[float],
+    as_json: bool,
+) -> None:
+    """Probe every profile's instance at once and report them side by side."""
+    reports: Dict[str, Dict[str, Any]] = {}
+    failures: Dict[str, str] = {}
+    for outcome in each_profile(
+        lambda config: run_probes(KanbnClient(config), targets, samples, concurrency, timeout)
+    ):
+        if outcome.ok:
+            reports[outcome.item] = outcome.value
+        else:
+            failures[outcome.item] = str(outcome.error)
+
+    names = [name for name in list_profiles() if name in reports or name in failures]
+    statuses = {name: _health_status(reports[name], targets) for name in reports}
+    breaches = {
+        name: _slo_breaches(reports[name], max_p95, max_p99, max_error_rate) for name in reports
+    }
+
+    if as_json:
+        summary = {
+            name: _health_summary(reports[name], statuses[name], breaches[name])
+            if name in reports
+            else {"status": "error", "error": failures[name]}
+            for name in names
+        }
+        typer.echo(json.dumps({"profiles": summary}, indent=2))
+    else:
+        for name in names:
+            status = statuses.get(name, "error")
+            if status in ("ok", None):
+                print_success(f"{name}: {status or 'reachable'}")
+            else:
+                print_error(f"{name}: {failures.get(name) or status}")
+        merged = {
+            "samples": [sample for report in reports.values() for sample in report["samples"]],
+            "wall": max((report["wall"] for report in reports.values()), default=0.0),
+            "endpoints": {
+                f"{name}: {endpoint}": entry
+                for name in names
+                if name in reports
+                for endpoint, entry in reports[name]["endpoints"].items()
+            },
+        }
+        display_health_report(merged)
+        for name in names:
+            if name in reports:
+                _print_probe_errors(reports[name], f"{name}: ")
+            for breach in breaches.get(name, ()):
+                print_error(f"SLO breach: {name}: {breach}")
+
+    if failures or any(status not in (None, "ok") for status in statuses.values()):
+        raise typer.Exit(1)
+    if any(breaches.values()):
+        raise typer.Exit(2)
+
+
 @app.command("stats")
 def statistics():
     """View system statistics."""
@@ -43,7 +206,13 @@ def statistics():
         client = KanbnClient(config)
 
         stats = client.get("stats")
-        console.print(Panel.fit(str(stats), title="System Statistics"))
+        if is_quiet():
+            print_data(stats)
+            return
+
+        from rich.panel import Panel
+
+        get_console().print(Panel.fit(str(stats), title="System Statistics"))
 
     except AuthenticationError:
         print_error("Stats endpoint requires admin permissions")
@@ -51,3 +220,25 @@ def statistics():
     except KanbnError as e:
         print_error(str(e))
         raise typer.Exit(1)
+
+
+@app.command("ratelimit")
+def rate_limit_status(
+    reset: bool = typer.Option(False, "--reset", help="Refill all buckets and clear the metrics"),
+):
+    """Show client-side rate-limit buckets and wait-time metrics shared by all processes."""
+    try:
+        config = load_config()
+        limiter = KanbnClient(config).rate_limiter
+        if limiter is None:
+            print_info(
+                "No rate limit configured (set rate_limits in ~/.kanbnrc or KANBN_RATE_LIMIT)"
+            )
+
+        display_rate_limits(read_state(reset=reset), time.time())
+        if reset:
+            print_success("Rate-limit state cleared")
+
+    except (KanbnError, OSError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
@@ -7,6 +7,7 @@ import httpx
 
 from kanbn_cli.api.client import KanbnClient
 from kanbn_cli.config import load_config
+from kanbn_cli.utils.completion import complete_card
 from kanbn_cli.utils.display import print_error, print_success, print_info
 from kanbn_cli.utils.errors import KanbnError
 
@@ -15,7 +16,7 @@ app = typer.Typer(help="Manage attachments")
 
 @app.command("upload")
 def upload_attachment(
-    card_id: str = typer.Argument(..., help="Card ID"),
+    card_id: str = typer.Argument(..., help="Card ID", shell_complete=complete_card),
     file_path: str = typer.Argument(..., help="Path to file"),
 ):
     """Upload an attachment to a card."""
@@ -1,9 +1,17 @@
 """Authentication commands."""
 
 import typer
-from rich.prompt import Prompt
 
-from kanbn_cli.config import clear_config, load_config, save_config
+from kanbn_cli.config import (
+    ALL_PROFILES,
+    DEFAULT_PROFILE,
+    KanbnConfig,
+    clear_config,
+    get_profile,
+    list_profiles,
+    load_config,
+    save_config,
+)
 from kanbn_cli.utils.display import print_error, print_info, print_success
 
 app = typer.Typer(help="Manage authentication")
@@ -19,20 +27,33 @@ def login(
     ),
     token: str = typer.Option(None, "--token", "-t", help="API token"),
 ):
-    """Store API credentials for authentication."""
+    """Store API credentials for authentication (for the profile chosen with --profile)."""
     try:
+        profile = get_profile()
+        if profile == ALL_PROFILES:
+            raise ValueError(f"'{ALL_PROFILES}' is reserved for fanning out read commands")
+
         # Prompt for token if not provided
         if not token:
-            token = Prompt.ask("Enter your API token", password=True)
+            try:
+                from rich.prompt import Prompt
+            except ImportError:  # quiet runs keep rich out
+                token = typer.prompt("Enter your API token", hide_input=True)
+            else:
+                token = Prompt.ask("Enter your API token", password=True)
 
-        # Load existing config
-        config = load_config()
+        # Load existing config; a named profile that does not exist yet starts empty
+        if profile == DEFAULT_PROFILE or profile in list_profiles():
+            config = load_config()
+        else:
+            config = KanbnConfig(profile=profile)
         config.api_url = api_url
         config.api_token = token
 
         # Save configuration
         save_config(config)
-        print_success(f"Authentication configured for {api_url}")
+        suffix = "" if profile == DEFAULT_PROFILE else f" (profile '{profile}')"
+        print_success(f"Authentication configured for {api_url}{suffix}")
 
     except Exception as e:
         print_error(f"Failed to save configuration: {str(e)}")
@@ -55,7 +76,9 @@ def status():
     """Show current authentication status."""
     try:
         config = load_config()
-        
+
+        if config.profile != DEFAULT_PROFILE:
+            print_info(f"Profile: {config.profile}")
         print_info(f"API URL: {config.api_url}")
         
         if config.api_token:
@@ -70,3 +93,17 @@ def status():
     except Exception as e:
         print_error(f"Failed to check status: {str(e)}")
         raise typer.Exit(1)
+
+
+@app.command("profiles")
+def profiles():
+    """List configured profiles and the instance each one points at."""
+    active = get_profile()
+    names = list_profiles()
+    if not names:
+        print_error("No profiles configured. Run 'kanbn auth login' to authenticate.")
+        raise typer.Exit(1)
+    for name in names:
+        config = load_config(name)
+        marker = "*" if name == active else " "
+        print_info(f"{marker} {name}: {config.api_url}")
@@ -1,28 +1,42 @@
 """Board commands."""
 
-from typing import Optional
+import json
+from pathlib import Path
+from typing import List, Optional
 
 import typer
 
 from kanbn_cli.api.client import KanbnClient
 from kanbn_cli.config import load_config
-from kanbn_cli.utils.display import display_boards, print_error, print_success
+from kanbn_cli.utils.activity import ActivityCache, fetch_activity
+from kanbn_cli.utils.board_resolver import resolve_board_name
+from kanbn_cli.utils.completion import complete_board, complete_workspace
+from kanbn_cli.utils.concurrency import run_bounded
+from kanbn_cli.utils.display import (
+    display_boards,
+    display_flow_metrics,
+    print_created,
+    print_error,
+    print_success,
+    print_warning,
+    set_quiet,
+)
 from kanbn_cli.utils.errors import KanbnError
+from kanbn_cli.utils.flow import BoardColumns, compute_flow_metrics
 
 app = typer.Typer(help="Manage boards")
 
 
 @app.command("list")
 def list_boards(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
 ):
     """List all boards in a workspace."""
     try:
         config = load_config()
         client = KanbnClient(config)
 
-        boards = client.get(f"workspaces/{workspace_id}/boards")
-        display_boards(boards)
+        display_boards(client.paginate(f"workspaces/{workspace_id}/boards"))
 
     except KanbnError as e:
         print_error(str(e))
@@ -31,13 +45,16 @@ def list_boards(
 
 @app.command("create")
 def create_board(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
     name: str = typer.Argument(..., help="Board name"),
     slug: Optional[str] = typer.Option(None, "--slug", "-s", help="Board slug"),
     description: Optional[str] = typer.Option(None, "--description", "-d", help="Description"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new ID"),
 ):
     """Create a new board."""
     try:
+        if quiet:
+            set_quiet()
         config = load_config()
         client = KanbnClient(config)
 
@@ -48,7 +65,7 @@ def create_board(
             data["description"] = description
 
         board = client.post("boards", json=data)
-        print_success(f"Created board: {board.get('name')}")
+        print_created(f"Created board: {board.get('name')}", board)
 
     except KanbnError as e:
         print_error(str(e))
@@ -57,8 +74,14 @@ def create_board(
 
 @app.command("get")
 def get_board(
-    identifier: str = typer.Argument(..., help="Board ID or slug"),
-    workspace_id: Optional[str] = typer.Option(None, "--workspace", "-w", help="Workspace ID (required if using slug)"),
+    identifier: str = typer.Argument(..., help="Board ID or slug", shell_complete=complete_board),
+    workspace_id: Optional[str] = typer.Option(
+        None,
+        "--workspace",
+        "-w",
+        help="Workspace ID (required if using slug)",
+        shell_complete=complete_workspace,
+    ),
     by_slug: bool = typer.Option(False, "--slug", "-s", help="Use slug instead of ID"),
 ):
     """Get board details."""
@@ -74,8 +97,8 @@ def get_board(
         else:
             board = client.get(f"boards/{identifier}")
 
-        from kanbn_cli.utils.display import console
-        console.print(board)
+        from kanbn_cli.utils.display import get_console
+        get_console().print(board)
 
     except KanbnError as e:
         print_error(str(e))
@@ -84,7 +107,7 @@ def get_board(
 
 @app.command("update")
 def update_board(
-    board_id: str = typer.Argument(..., help="Board ID"),
+    board_id: str = typer.Argument(..., help="Board ID", shell_complete=complete_board),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="New name"),
     slug: Optional[str] = typer.Option(None, "--slug", "-s", help="New slug"),
     description: Optional[str] = typer.Option(None, "--description", "-d", help="New description"),
@@ -116,7 +139,7 @@ def update_board(
 
 @app.command("delete")
 def delete_board(
-    board_id: str = typer.Argument(..., help="Board ID"),
+    board_id: str = typer.Argument(..., help="Board ID", shell_complete=complete_board),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
     """Delete a board."""
@@ -138,3 +161,65 @@ def delete_board(
     except KanbnError as e:
         print_error(str(e))
         raise typer.Exit(1)
+
+
+@app.command("metrics")
+def board_metrics(
+    board_id: str = typer.Argument(..., help="Board ID or Name", shell_complete=complete_board),
+    done_lists: Optional[List[str]] = typer.Option(
+        None, "--done-list", "-d", help="List counted as done (repeatable, default: last list)"
+    ),
+    backlog_lists: Optional[List[str]] = typer.Option(
+        None,
+        "--backlog-list",
+        "-b",
+        help="List whose cards have not started (repeatable, default: first list)",
+    ),
+    weeks: int = typer.Option(8, "--weeks", "-w", help="Throughput window in weeks"),
+    history: bool = typer.Option(
+        True, "--history/--no-history", help="Fetch card activity for age, throughput and cycle time"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-c", help="Parallel activity requests"),
+    as_json: bool = typer.Option(False, "--json", help="Output metrics as JSON"),
+):
+    """Show flow metrics (WIP, age in list, throughput, cycle time) for a board."""
+    try:
+        config = load_config()
+        client = KanbnClient(config)
+
+        resolved_id = resolve_board_name(board_id, Path.cwd())
+        board = client.get(f"boards/{resolved_id}")
+
+        activities = {}
+        if history:
+            card_ids = [
+                card.get("publicId")
+                for lst in board.get("lists", [])
+                for card in lst.get("cards", [])
+                if card.get("publicId")
+            ]
+            cache = ActivityCache()
+            outcomes = run_bounded(
+                lambda card_id: fetch_activity(client, card_id, cache), card_ids, concurrency
+            )
+            failed = 0
+            for outcome in outcomes:
+                if not outcome.ok:
+                    failed += 1
+                    continue
+                activities[outcome.item] = outcome.value
+            if failed:
+                print_warning(f"Could not fetch activity for {failed} card(s)")
+
+        metrics = compute_flow_metrics(
+            BoardColumns(board, activities), done_lists, weeks=weeks, backlog_lists=backlog_lists
+        )
+
+        if as_json:
+            typer.echo(json.dumps({"board": board.get("name", resolved_id), **metrics}, indent=2))
+        else:
+            display_flow_metrics(board.get("name", resolved_id), metrics)
+
+    except KanbnError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
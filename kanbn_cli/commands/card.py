@@ -1,30 +1,239 @@
 """Card commands."""
 
+import json
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import typer
-from rich.table import Table
-from rich.console import Console
 
 from kanbn_cli.api.client import KanbnClient
-from kanbn_cli.config import load_config
-from kanbn_cli.utils.display import display_card, display_cards, print_error, print_success, print_info
-from kanbn_cli.utils.errors import KanbnError
+from kanbn_cli.api.idempotency import Lookup, create_once
+from kanbn_cli.api.records import Board, Card, decode_board, entity_id
+from kanbn_cli.api.streaming import BoardStream
+from kanbn_cli.config import KanbnConfig, load_config
+from kanbn_cli.utils.activity import ActivityCache, fetch_activity
+from kanbn_cli.utils.completion import (
+    complete_board,
+    complete_card,
+    complete_label,
+    complete_list,
+    complete_workspace,
+)
+from kanbn_cli.utils.concurrency import iter_completed
+from kanbn_cli.utils.display import (
+    display_activities,
+    display_card,
+    print_created,
+    print_error,
+    print_success,
+    render_rows,
+    set_quiet,
+)
+from kanbn_cli.utils.errors import KanbnError, NotFoundError, ValidationError
+from kanbn_cli.utils.filters import (
+    CardFilter,
+    Predicate,
+    compile_filter,
+    filter_cards,
+)
+from kanbn_cli.utils.sorting import CardOrder, order_items
+from kanbn_cli.utils.instances import each_profile, fan_out_requested
 from kanbn_cli.utils.board_resolver import resolve_board_name
 
 app = typer.Typer(help="Manage cards")
-console = Console()
+
+
+def _decode_cards(
+    pairs: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]], order: Optional[CardOrder] = None
+) -> Iterator[Card]:
+    """Decode streamed ``(list_info, card)`` pairs into Card records one at a time."""
+    for lst, data in pairs:
+        list_id = entity_id(lst)
+        if order is not None:
+            order.note_list(list_id, lst.get("index", 0))
+        yield Card.from_api(data, list_id, lst.get("name", ""))
+
+
+def _stream_cards(
+    client: KanbnClient, board_id: str, predicate: Predicate, limit: Optional[int] = None
+) -> None:
+    """Print one tab-separated row per card while the board response is still downloading."""
+    with client.stream(f"boards/{board_id}") as chunks:
+        cards = filter_cards(_decode_cards(BoardStream(chunks)), predicate)
+        for card in order_items(cards, limit=limit):
+            labels = ",".join(label.name for label in card.labels)
+            typer.echo(f"{card.public_id}\t{card.list_name}\t{card.title}\t{labels}")
+
+
+CARD_COLUMNS = [
+    ("Title", {"style": "cyan", "no_wrap": False}),
+    ("ID", {"style": "dim"}),
+    ("List", {"style": "green"}),
+    ("Labels", {"style": "yellow"}),
+]
+
+
+def _card_row(card: Card) -> Tuple[str, str, str, str]:
+    return (
+        card.title[:50],  # Truncate long titles
+        card.public_id,
+        card.list_name,
+        ", ".join(label.name for label in card.labels)[:30] or "-",
+    )
+
+
+def _list_workspace_cards(
+    client: KanbnClient,
+    workspace_id: str,
+    spec: CardFilter,
+    concurrency: int,
+    order: Optional[CardOrder] = None,
+    limit: Optional[int] = None,
+) -> None:
+    """List cards of every board in a workspace, printing each board as soon as it arrives."""
+    boards = list(client.paginate(f"workspaces/{workspace_id}/boards"))
+    predicate = compile_filter(spec)
+    failed = []
+
+    def cards():
+        for outcome in iter_completed(
+            lambda board: decode_board(client.get(f"boards/{entity_id(board)}")),
+            boards,
+            concurrency,
+        ):
+            if not outcome.ok:
+                # A board that fails is reported at the end instead of aborting the listing
+                name = outcome.item.get("name") or entity_id(outcome.item)
+                failed.append(f"{name}: {outcome.error}")
+                continue
+            board = outcome.value
+            if order is not None:
+                order.note_board(board)
+            for card in filter_cards(board.iter_cards(), predicate):
+                yield board.name, card
+
+    rows = (
+        (board, *_card_row(card))
+        for board, card in order_items(cards(), order, limit, card_of=itemgetter(1))
+    )
+    columns = [("Board", {"style": "magenta"})] + CARD_COLUMNS
+    render_rows(f"Cards in workspace {workspace_id}", columns, rows, "No cards found", id_column=2)
+    for failure in failed:
+        print_error(failure)
+    if failed:
+        raise typer.Exit(1)
+
+
+def _list_cards_all(
+    board_id: str,
+    spec: CardFilter,
+    order: Optional[CardOrder] = None,
+    limit: Optional[int] = None,
+) -> None:
+    """List a board's cards on every profile's instance, streaming each as it arrives."""
+    predicate = compile_filter(spec)
+    failed = []
+    found = []
+
+    def fetch(config: KanbnConfig) -> Board:
+        return decode_board(KanbnClient(config).get(f"boards/{board_id}"))
+
+    def cards():
+        for outcome in each_profile(fetch):
+            if isinstance(outcome.error, NotFoundError):
+                continue  # the board only lives on some instances
+            if not outcome.ok:
+                failed.append(f"{outcome.item}: {outcome.error}")
+                continue
+            found.append(outcome.item)
+            if order is not None:
+                order.note_board(outcome.value)
+            for card in filter_cards(outcome.value.iter_cards(), predicate):
+                yield outcome.item, card
+
+    rows = (
+        (profile, *_card_row(card))
+        for profile, card in order_items(cards(), order, limit, card_of=itemgetter(1))
+    )
+    columns = [("Profile", {"style": "magenta"})] + CARD_COLUMNS
+    render_rows(f"Cards in {board_id}", columns, rows, "No cards found", id_column=2)
+    for failure in failed:
+        print_error(failure)
+    if not found and not failed:
+        raise NotFoundError(f"Board {board_id}")
+    if failed:
+        raise typer.Exit(1)
 
 
 @app.command("list")
 def list_cards(
-    board_id: str = typer.Argument(..., help="Board ID or Name"),
+    board_id: Optional[str] = typer.Argument(
+        None, help="Board ID or Name", shell_complete=complete_board
+    ),
     list_name: Optional[str] = typer.Option(None, "--list", "-l", help="Filter by list name"),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-L", help="Only cards with this label (repeatable; all must match)"
+    ),
+    assignees: Optional[List[str]] = typer.Option(
+        None, "--assignee", "-a", help="Only cards assigned to this member (repeatable)"
+    ),
+    due_after: Optional[str] = typer.Option(
+        None, "--due-after", help="Only cards due at or after this date (2026-11-01, today, -1w)"
+    ),
+    due_before: Optional[str] = typer.Option(
+        None, "--due-before", help="Only cards due at or before this date (2026-11-01, now, +3d)"
+    ),
+    match: Optional[str] = typer.Option(
+        None, "--match", "-m", help="Regex matched against title and description"
+    ),
+    checklist: Optional[str] = typer.Option(
+        None, "--checklist", help="Checklist state: done, open or none"
+    ),
+    sort: Optional[str] = typer.Option(
+        None,
+        "--sort",
+        "-s",
+        help="Order by keys: due, updated, created, position, title (e.g. due,-updated)",
+    ),
+    limit: Optional[int] = typer.Option(
+        None, "--limit", "-n", min=1, help="Show only the first N cards (after sorting)"
+    ),
+    workspace_id: Optional[str] = typer.Option(
+        None,
+        "--workspace",
+        "-w",
+        help="List cards of every board in this workspace instead of one board",
+        shell_complete=complete_workspace,
+    ),
+    concurrency: int = typer.Option(
+        8, "--concurrency", "-j", min=1, help="Boards fetched at once with --workspace"
+    ),
+    stream: bool = typer.Option(
+        False, "--stream", help="Print tab-separated rows as the board response is parsed"
+    ),
 ):
-    """List all cards in a board."""
+    """List all cards in a board, or in every board of a workspace."""
     try:
-        config = load_config()
-        client = KanbnClient(config)
+        if bool(board_id) == bool(workspace_id):
+            raise ValidationError("Pass a board or --workspace (but not both)")
+        spec = CardFilter.from_options(
+            [list_name] if list_name else (),
+            labels or (),
+            assignees or (),
+            due_after,
+            due_before,
+            match,
+            checklist,
+        )
+        order = CardOrder.parse(sort) if sort else None
+
+        if workspace_id:
+            if fan_out_requested() or stream:
+                raise ValidationError("--workspace works without --stream and --profile all")
+            client = KanbnClient(load_config())
+            _list_workspace_cards(client, workspace_id, spec, concurrency, order, limit)
+            return
 
         # Resolve board ID if name provided
         # Assuming boards.md is in the project root or similar. 
@@ -36,39 +245,34 @@ def list_cards(
         # Using Path.cwd() allows users to have boards.md in their working dir.
         resolved_id = resolve_board_name(board_id, Path.cwd())
 
-        # Get board to access cards
-        board = client.get(f"boards/{resolved_id}")
+        if fan_out_requested():
+            _list_cards_all(resolved_id, spec, order, limit)
+            return
 
-        cards = []
-        for lst in board.get("lists", []):
-            if list_name and lst["name"].lower() != list_name.lower():
-                continue
-            for card in lst.get("cards", []):
-                card["_listName"] = lst["name"]
-                cards.append(card)
+        config = load_config()
+        client = KanbnClient(config)
 
-        if not cards:
-            print_info("No cards found")
+        if stream:
+            if order is not None:
+                raise ValidationError("--sort needs the whole board; drop --stream to sort")
+            _stream_cards(client, resolved_id, compile_filter(spec), limit)
             return
 
-        # Create table
-        table = Table(title=f"Cards in {board.get('name', board_id)}")
-        table.add_column("Title", style="cyan", no_wrap=False)
-        table.add_column("ID", style="dim")
-        table.add_column("List", style="green")
-        table.add_column("Labels", style="yellow")
-
-        for card in cards:
-            labels = ", ".join([l.get("name", "") for l in card.get("labels", [])])
-            table.add_row(
-                card.get("title", "")[:50],  # Truncate long titles
-                card.get("publicId", ""),
-                card.get("_listName", ""),
-                labels[:30] or "-"
+        # fetch -> decode -> filter -> order -> project -> render, one card at a time:
+        # the first rows print while later lists are still downloading
+        with client.stream(f"boards/{resolved_id}") as chunks:
+            board = BoardStream(chunks)
+            cards = filter_cards(_decode_cards(board, order), compile_filter(spec))
+            rows = map(_card_row, order_items(cards, order, limit))
+            first = list(islice(rows, 1))  # the board name precedes its lists in the response
+            render_rows(
+                f"Cards in {board.board.get('name') or board_id}",
+                CARD_COLUMNS,
+                chain(first, rows),
+                "No cards found",
+                id_column=1,
             )
 
-        console.print(table)
-
     except KanbnError as e:
         print_error(str(e))
         raise typer.Exit(1)
@@ -76,13 +280,26 @@ def list_cards(
 
 @app.command("create")
 def create_card(
-    list_id: str = typer.Argument(..., help="List ID"),
+    list_id: str = typer.Argument(..., help="List ID", shell_complete=complete_list),
     title: str = typer.Argument(..., help="Card title"),
     description: Optional[str] = typer.Option(None, "--description", "-d", help="Description"),
     position: Optional[int] = typer.Option(None, "--position", "-p", help="Position in the list"),
+    idempotency_key: Optional[str] = typer.Option(
+        None, "--idempotency-key", help="Reruns with the same key return the first result"
+    ),
+    board_id: Optional[str] = typer.Option(
+        None,
+        "--board",
+        "-b",
+        help="Board of the list; lets retries detect an existing card",
+        shell_complete=complete_board,
+    ),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new ID"),
 ):
     """Create a new card."""
     try:
+        if quiet:
+            set_quiet()
         config = load_config()
         client = KanbnClient(config)
 
@@ -95,8 +312,9 @@ def create_card(
             "memberPublicIds": [],
         }
 
-        card = client.post("cards", json=data)
-        print_success(f"Created card: {card.get('title')}")
+        lookup = Lookup(board_id, "cards", title, list_id) if board_id else None
+        card = create_once(client, "cards", data, idempotency_key, lookup)
+        print_created(f"Created card: {card.get('title')}", card)
 
     except KanbnError as e:
         print_error(str(e))
@@ -105,7 +323,7 @@ def create_card(
 
 @app.command("get")
 def get_card(
-    card_id: str = typer.Argument(..., help="Card ID"),
+    card_id: str = typer.Argument(..., help="Card ID", shell_complete=complete_card),
 ):
     """Get card details."""
     try:
@@ -120,12 +338,103 @@ def get_card(
         raise typer.Exit(1)
 
 
+@app.command("activity")
+def card_activity(
+    card_ids: Optional[List[str]] = typer.Argument(
+        None, help="Card IDs", shell_complete=complete_card
+    ),
+    board_id: Optional[str] = typer.Option(
+        None,
+        "--board",
+        "-b",
+        help="Show activity for every card on this board",
+        shell_complete=complete_board,
+    ),
+    labels: Optional[List[str]] = typer.Option(
+        None, "--label", "-L", help="With --board: only cards with this label (repeatable)"
+    ),
+    assignees: Optional[List[str]] = typer.Option(
+        None, "--assignee", "-a", help="With --board: only cards assigned to this member"
+    ),
+    due_after: Optional[str] = typer.Option(
+        None, "--due-after", help="With --board: only cards due at or after this date"
+    ),
+    due_before: Optional[str] = typer.Option(
+        None, "--due-before", help="With --board: only cards due at or before this date"
+    ),
+    match: Optional[str] = typer.Option(
+        None, "--match", "-m", help="With --board: regex matched against title and description"
+    ),
+    checklist: Optional[str] = typer.Option(
+        None, "--checklist", help="With --board: checklist state (done, open or none)"
+    ),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Print one JSON entry per line as each card finishes"
+    ),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse locally cached history and fetch only new entries"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Cards fetched at once"),
+):
+    """Show the activity history of one or more cards."""
+    try:
+        config = load_config()
+        client = KanbnClient(config)
+
+        spec = CardFilter.from_options(
+            (), labels or (), assignees or (), due_after, due_before, match, checklist
+        )
+        if not spec.empty and not board_id:
+            raise ValidationError("Card filters need --board")
+
+        targets = list(card_ids or [])
+        if board_id:
+            board = decode_board(client.get(f"boards/{resolve_board_name(board_id, Path.cwd())}"))
+            targets.extend(
+                card.public_id for card in filter_cards(board.iter_cards(), compile_filter(spec))
+            )
+        targets = list(dict.fromkeys(targets))
+        if not targets:
+            raise ValidationError("Pass card IDs or --board")
+
+        cache = ActivityCache() if use_cache else None
+        histories = {}
+        failed = 0
+        for outcome in iter_completed(
+            lambda card_id: fetch_activity(client, card_id, cache), targets, concurrency
+        ):
+            if not outcome.ok:
+                failed += 1
+                print_error(f"{outcome.item}: {outcome.error}")
+                continue
+            entries = [{"cardPublicId": outcome.item, **entry} for entry in outcome.value]
+            if ndjson:
+                for entry in entries:
+                    typer.echo(json.dumps(entry))
+            else:
+                histories[outcome.item] = entries
+
+        if not ndjson:
+            display_activities(
+                (entry for card_id in targets for entry in histories.get(card_id, ())),
+                show_card=len(targets) > 1,
+            )
+        if failed:
+            raise typer.Exit(1)
+
+    except KanbnError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+
 @app.command("update")
 def update_card(
-    card_id: str = typer.Argument(..., help="Card ID"),
+    card_id: str = typer.Argument(..., help="Card ID", shell_complete=complete_card),
     title: Optional[str] = typer.Option(None, "--title", "-t", help="New title"),
     description: Optional[str] = typer.Option(None, "--description", "-d", help="New description"),
-    list_id: Optional[str] = typer.Option(None, "--list", "-l", help="Move to list"),
+    list_id: Optional[str] = typer.Option(
+        None, "--list", "-l", help="Move to list", shell_complete=complete_list
+    ),
 ):
     """Update a card."""
     try:
@@ -154,7 +463,7 @@ def update_card(
 
 @app.command("delete")
 def delete_card(
-    card_id: str = typer.Argument(..., help="Card ID"),
+    card_id: str = typer.Argument(..., help="Card ID", shell_complete=complete_card),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
     """Delete a card."""
@@ -180,17 +489,20 @@ def delete_card(
 
 @app.command("comment")
 def add_comment(
-    card_id: str = typer.Argument(..., help="Card ID"),
+    card_id: str = typer.Argument(..., help="Card ID", shell_complete=complete_card),
     text: str = typer.Argument(..., help="Comment text"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new ID"),
 ):
     """Add a comment to a card."""
     try:
+        if quiet:
+            set_quiet()
         config = load_config()
         client = KanbnClient(config)
 
         data = {"comment": text}
         comment = client.post(f"cards/{card_id}/comments", json=data)
-        print_success("Comment added")
+        print_created("Comment added", comment)
 
     except KanbnError as e:
         print_error(str(e))
@@ -199,8 +511,8 @@ def add_comment(
 
 @app.command("label")
 def manage_label(
-    card_id: str = typer.Argument(..., help="Card ID"),
-    label_id: str = typer.Argument(..., help="Label ID"),
+    card_id: str = typer.Argument(..., help="Card ID", shell_complete=complete_card),
+    label_id: str = typer.Argument(..., help="Label ID", shell_complete=complete_label),
     remove: bool = typer.Option(False, "--remove", "-r", help="Remove label instead of adding"),
 ):
     """Add or remove a label from a card."""
@@ -1,30 +1,48 @@
 """Checklist commands."""
 
-from typing import Optional
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 
 from kanbn_cli.api.client import KanbnClient
+from kanbn_cli.api.records import Card, entity_id
 from kanbn_cli.config import load_config
-from kanbn_cli.utils.display import print_error, print_success
-from kanbn_cli.utils.errors import KanbnError
+from kanbn_cli.utils.completion import complete_card
+from kanbn_cli.utils.concurrency import iter_completed, run_bounded
+from kanbn_cli.utils.display import (
+    is_quiet,
+    print_created,
+    print_error,
+    print_id,
+    print_info,
+    print_success,
+    set_quiet,
+)
+from kanbn_cli.utils.errors import KanbnError, ValidationError
 
 app = typer.Typer(help="Manage checklists")
 
 
 @app.command("create")
 def create_checklist(
-    card_id: str = typer.Argument(..., help="Card ID"),
+    card_id: str = typer.Argument(..., help="Card ID", shell_complete=complete_card),
     title: str = typer.Argument(..., help="Checklist title"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new ID"),
 ):
     """Add a checklist to a card."""
     try:
+        if quiet:
+            set_quiet()
         config = load_config()
         client = KanbnClient(config)
 
         data = {"name": title}
         checklist = client.post(f"cards/{card_id}/checklists", json=data)
-        print_success(f"Created checklist '{title}'")
+        print_created(f"Created checklist '{title}'", checklist)
         
     except KanbnError as e:
         print_error(str(e))
@@ -61,15 +79,18 @@ def delete_checklist(
 def add_item(
     checklist_id: str = typer.Argument(..., help="Checklist ID"),
     title: str = typer.Argument(..., help="Item title"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new ID"),
 ):
     """Add item to checklist."""
     try:
+        if quiet:
+            set_quiet()
         config = load_config()
         client = KanbnClient(config)
 
         data = {"title": title}
-        client.post(f"checklists/{checklist_id}/items", json=data)
-        print_success(f"Added item '{title}' to checklist")
+        item = client.post(f"checklists/{checklist_id}/items", json=data)
+        print_created(f"Added item '{title}' to checklist", item)
 
     except KanbnError as e:
         print_error(str(e))
@@ -129,3 +150,228 @@ def delete_item(
     except KanbnError as e:
         print_error(str(e))
         raise typer.Exit(1)
+
+
+_TEXT_ITEM = re.compile(r"^(?:[-*+]\s+)?(?:\[(?P<mark>[ xX])\]\s+)?(?P<title>.+?)\s*$")
+
+
+def _read_checklist_spec(source: str) -> Tuple[Optional[str], List[Tuple[str, bool]]]:
+    """Read a checklist from a file or stdin ("-").
+
+    JSON may be ``{"name": ..., "items": [...]}`` or a plain list; items are
+    strings or ``{"title", "completed"}`` objects. Anything else is read as
+    text with one item per line, where Markdown bullets and ``[x]`` marks are
+    understood and blank lines and ``#`` comments are skipped.
+    """
+    text = sys.stdin.read() if source == "-" else Path(source).read_text()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+
+    if isinstance(data, (dict, list)):
+        name = data.get("name") or data.get("title") if isinstance(data, dict) else None
+        raw_items = data.get("items", []) if isinstance(data, dict) else data
+        items = []
+        for item in raw_items:
+            if isinstance(item, dict):
+                items.append((str(item.get("title", "")), bool(item.get("completed"))))
+            else:
+                items.append((str(item), False))
+        return name, [item for item in items if item[0]]
+
+    items = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _TEXT_ITEM.match(line)
+        items.append((match.group("title"), match.group("mark") in ("x", "X")))
+    return None, items
+
+
+def _apply_to_card(
+    client: KanbnClient,
+    card_id: str,
+    name: str,
+    items: List[Tuple[str, bool]],
+    concurrency: int = 8,
+) -> Dict[str, Any]:
+    """Create one checklist on a card, add its items in order, then tick the done ones."""
+    checklist = client.post(f"cards/{card_id}/checklists", json={"name": name})
+    checklist_id = entity_id(checklist)
+    completed = []
+    # Items are added one at a time so the server keeps the file's order
+    for title, done in items:
+        item = client.post(f"checklists/{checklist_id}/items", json={"title": title})
+        if done:
+            completed.append(entity_id(item))
+    # Completion order does not matter, so those writes run concurrently
+    for outcome in run_bounded(
+        lambda item_id: client.put(f"checklist-items/{item_id}", json={"completed": True}),
+        completed,
+        concurrency,
+    ):
+        if not outcome.ok:
+            raise outcome.error
+    return {"checklist": checklist_id, "items": len(items)}
+
+
+@app.command("apply")
+def apply_checklist(
+    source: str = typer.Argument(
+        ..., help="Checklist file (JSON or one item per line), or - for stdin"
+    ),
+    card_ids: List[str] = typer.Option(
+        ..., "--card", "-c", help="Card ID (repeatable)", shell_complete=complete_card
+    ),
+    title: Optional[str] = typer.Option(None, "--title", "-t", help="Checklist title"),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Cards processed at once"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new checklist IDs"),
+):
+    """Create a checklist with many items on one or more cards."""
+    try:
+        if quiet:
+            set_quiet()
+        name, items = _read_checklist_spec(source)
+        name = title or name
+        if not name:
+            raise ValidationError("Checklist title is required (--title or a 'name' in the file)")
+        if not items:
+            raise ValidationError("No checklist items found")
+
+        config = load_config()
+        client = KanbnClient(config)
+
+        failed = 0
+        for outcome in iter_completed(
+            lambda card_id: _apply_to_card(client, card_id, name, items, concurrency),
+            card_ids,
+            concurrency,
+        ):
+            if not outcome.ok:
+                failed += 1
+                print_error(f"{outcome.item}: {outcome.error}")
+            elif is_quiet():
+                print_id(outcome.value["checklist"])
+            else:
+                count = outcome.value["items"]
+                print_success(f"{outcome.item}: created checklist '{name}' with {count} items")
+
+        if failed:
+            raise typer.Exit(1)
+
+    except (KanbnError, OSError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+
+def _matching_items(
+    client: KanbnClient, card_id: str, pattern: re.Pattern, checklist_name: Optional[str]
+) -> List[str]:
+    card = Card.from_api(client.get(f"cards/{card_id}"))
+    return [
+        item.public_id
+        for checklist in card.checklists
+        if not checklist_name or checklist.name.lower() == checklist_name.lower()
+        for item in checklist.items
+        if pattern.search(item.title)
+    ]
+
+
+def _set_items_completed(
+    item_ids: List[str],
+    card_ids: List[str],
+    match: Optional[str],
+    checklist_name: Optional[str],
+    completed: bool,
+    concurrency: int,
+) -> None:
+    """Resolve items by ID or title pattern and set their completed state concurrently."""
+    if card_ids and not match:
+        raise ValidationError("--match is required with --card")
+    if match and not card_ids:
+        raise ValidationError("--card is required with --match")
+    if not item_ids and not card_ids:
+        raise ValidationError("Pass item IDs, or --card with --match")
+
+    config = load_config()
+    client = KanbnClient(config)
+
+    targets = list(item_ids)
+    if match:
+        pattern = re.compile(match, re.IGNORECASE)
+        for outcome in run_bounded(
+            lambda card_id: _matching_items(client, card_id, pattern, checklist_name),
+            card_ids,
+            concurrency,
+        ):
+            if outcome.ok:
+                targets.extend(outcome.value)
+            else:
+                print_error(f"{outcome.item}: {outcome.error}")
+    targets = list(dict.fromkeys(targets))
+    if not targets:
+        print_info("No matching checklist items")
+        return
+
+    outcomes = run_bounded(
+        lambda item_id: client.put(f"checklist-items/{item_id}", json={"completed": completed}),
+        targets,
+        concurrency,
+    )
+    failed = [outcome for outcome in outcomes if not outcome.ok]
+    for outcome in failed:
+        print_error(f"{outcome.item}: {outcome.error}")
+    state = "completed" if completed else "not completed"
+    print_success(f"Marked {len(outcomes) - len(failed)} item(s) as {state}")
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command("complete")
+def complete_items(
+    item_ids: Optional[List[str]] = typer.Argument(None, help="Item IDs"),
+    card_ids: Optional[List[str]] = typer.Option(
+        None, "--card", "-c", help="Card ID (repeatable)", shell_complete=complete_card
+    ),
+    match: Optional[str] = typer.Option(
+        None, "--match", "-m", help="Regex matched against item titles"
+    ),
+    checklist_name: Optional[str] = typer.Option(
+        None, "--checklist", help="Only items in this checklist"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Requests in flight"),
+):
+    """Mark many checklist items as completed."""
+    try:
+        _set_items_completed(
+            item_ids or [], card_ids or [], match, checklist_name, True, concurrency
+        )
+    except (KanbnError, re.error) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+
+@app.command("uncomplete")
+def uncomplete_items(
+    item_ids: Optional[List[str]] = typer.Argument(None, help="Item IDs"),
+    card_ids: Optional[List[str]] = typer.Option(
+        None, "--card", "-c", help="Card ID (repeatable)", shell_complete=complete_card
+    ),
+    match: Optional[str] = typer.Option(
+        None, "--match", "-m", help="Regex matched against item titles"
+    ),
+    checklist_name: Optional[str] = typer.Option(
+        None, "--checklist", help="Only items in this checklist"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Requests in flight"),
+):
+    """Mark many checklist items as not completed."""
+    try:
+        _set_items_completed(
+            item_ids or [], card_ids or [], match, checklist_name, False, concurrency
+        )
+    except (KanbnError, re.error) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
@@ -0,0 +1,94 @@
+"""Shell completion index commands."""
+
+from typing import Any, Dict, List, Tuple
+
+import click
+import typer
+
+from kanbn_cli.api.client import KanbnClient
+from kanbn_cli.api.records import decode_board, entity_id
+from kanbn_cli.config import get_data_dir, load_config
+from kanbn_cli.utils.completion import INDEX_NAME, write_index
+from kanbn_cli.utils.concurrency import run_bounded
+from kanbn_cli.utils.display import print_error, print_success, print_warning
+from kanbn_cli.utils.errors import KanbnError
+
+app = typer.Typer(help="Manage the local index behind shell completion")
+
+
+def _command_spec(command: click.Command) -> Dict[str, Any]:
+    """Which option takes a value and which argument or option completes which kind of ID."""
+    options: Dict[str, Any] = {"--help": None}
+    args: List[str] = []
+    variadic = False
+    for param in command.params:
+        kind = getattr(getattr(param, "_custom_shell_complete", None), "kind", "")
+        if isinstance(param, click.Argument):
+            args.append(kind)
+            variadic = param.nargs == -1
+        elif isinstance(param, click.Option):
+            takes_value = not (param.is_flag or param.count)
+            for name in param.opts + param.secondary_opts:
+                options[name] = kind if takes_value else None
+    spec: Dict[str, Any] = {"options": options, "args": args, "variadic": variadic}
+    if isinstance(command, click.Group):
+        spec["commands"] = {
+            name: _command_spec(sub) for name, sub in command.commands.items() if not sub.hidden
+        }
+    return spec
+
+
+def _board_items(board: Any) -> Dict[str, List[Tuple[str, str]]]:
+    items: Dict[str, List[Tuple[str, str]]] = {"list": [], "label": [], "card": []}
+    for label in board.labels:
+        items["label"].append((label.public_id, f"{label.name} ({board.name})"))
+    for lst in board.lists:
+        items["list"].append((lst.public_id, f"{lst.name} ({board.name})"))
+        for card in lst.cards:
+            items["card"].append((card.public_id, f"{card.title} ({board.name}/{lst.name})"))
+    return items
+
+
+@app.command("refresh")
+def refresh(
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Boards fetched at once"),
+):
+    """Rebuild the completion index (runs in the background when the index is stale)."""
+    try:
+        config = load_config()
+        client = KanbnClient(config)
+
+        items: Dict[str, List[Tuple[str, str]]] = {
+            "workspace": [], "board": [], "list": [], "label": [], "card": []
+        }
+        boards = []
+        for entry in client.paginate("workspaces"):
+            # Handle API response structure that may wrap workspace in {role, workspace}
+            workspace = entry.get("workspace", entry)
+            items["workspace"].append((entity_id(workspace), workspace.get("name", "")))
+            for board in client.paginate(f"workspaces/{entity_id(workspace)}/boards"):
+                items["board"].append((entity_id(board), board.get("name", "")))
+                boards.append(entity_id(board))
+
+        failed = 0
+        for outcome in run_bounded(
+            lambda board_id: decode_board(client.get(f"boards/{board_id}")), boards, concurrency
+        ):
+            if not outcome.ok:
+                failed += 1
+                continue
+            for kind, found in _board_items(outcome.value).items():
+                items[kind].extend(found)
+
+        root = click.get_current_context().find_root().command
+        write_index(get_data_dir() / INDEX_NAME, items, _command_spec(root))
+        if failed:
+            print_warning(f"{failed} board(s) could not be fetched and are missing from the index")
+        print_success(
+            f"Indexed {len(items['board'])} board(s), {len(items['list'])} list(s), "
+            f"{len(items['label'])} label(s) and {len(items['card'])} card(s)"
+        )
+
+    except (KanbnError, OSError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
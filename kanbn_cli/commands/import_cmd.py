@@ -1,14 +1,91 @@
 """Import commands."""
 
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
 import typer
 
 from kanbn_cli.api.client import KanbnClient
-from kanbn_cli.config import load_config
-from kanbn_cli.utils.display import display_trello_boards, print_error, print_success
-from kanbn_cli.utils.errors import KanbnError
+from kanbn_cli.config import get_data_dir, load_config
+from kanbn_cli.utils.concurrency import iter_completed, poll_with_backoff
+from kanbn_cli.utils.display import (
+    display_import_results,
+    display_trello_boards,
+    print_error,
+    print_info,
+    print_success,
+)
+from kanbn_cli.utils.errors import KanbnError, ValidationError
 
 app = typer.Typer(help="Import data from other services")
 
+PENDING_STATUSES = {
+    "pending", "queued", "started", "running", "processing", "in_progress", "importing"
+}
+FAILED_STATUSES = {"failed", "error", "errored", "cancelled"}
+
+
+def _failed_file() -> Path:
+    return get_data_dir() / "trello-import-failed.json"
+
+
+def _load_failed(path: Path) -> Dict[str, Any]:
+    """Read the last batch's failures, reporting a corrupt record instead of crashing."""
+    try:
+        previous = json.loads(path.read_text())
+        boards = previous.get("boards", [])
+        if not isinstance(boards, list):
+            raise ValueError("'boards' is not a list")
+    except (ValueError, AttributeError) as e:
+        raise ValidationError(
+            f"Failed-import record {path} is unreadable ({e}). "
+            "Delete it and pass the board IDs instead."
+        )
+    return {"workspace": previous.get("workspace"), "boards": boards}
+
+
+def _save_failed(path: Path, workspace_id: str, boards: List[str]) -> None:
+    """Replace the failed-import record atomically, so an interrupted write can't corrupt it."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"workspace": workspace_id, "boards": boards}, indent=2))
+    os.replace(tmp, path)
+
+
+def _import_id(result: Any) -> Optional[str]:
+    if not isinstance(result, dict):
+        return None
+    return result.get("publicId") or result.get("importId") or result.get("id")
+
+
+def _status(result: Any) -> str:
+    if not isinstance(result, dict):
+        return "unknown"
+    return str(result.get("status") or "unknown").lower()
+
+
+def _run_import(
+    client: KanbnClient, board_id: str, workspace_id: str, timeout: float
+) -> Dict[str, Any]:
+    """Submit one Trello import and poll it until it finishes."""
+    started = time.monotonic()
+    data = {"boardId": board_id, "workspacePublicId": workspace_id}
+    result = client.post("imports/trello", json=data)
+    import_id = _import_id(result)
+    if import_id and _status(result) in PENDING_STATUSES | {"unknown"}:
+        result = poll_with_backoff(
+            lambda: client.get(f"imports/{import_id}"),
+            lambda r: _status(r) not in PENDING_STATUSES,
+            timeout=timeout,
+        )
+    status = _status(result)
+    outcome = {"status": status, "duration": time.monotonic() - started}
+    if status in FAILED_STATUSES:
+        outcome["error"] = result.get("error") or result.get("message") or f"Import {status}"
+    return outcome
+
 
 @app.command("trello-list")
 def list_trello_boards():
@@ -45,3 +122,76 @@ def import_trello(
     except KanbnError as e:
         print_error(str(e))
         raise typer.Exit(1)
+
+
+@app.command("trello-batch")
+def import_trello_batch(
+    board_ids: Optional[List[str]] = typer.Argument(None, help="Trello Board IDs"),
+    workspace_id: Optional[str] = typer.Option(
+        None, "--workspace", "-w", help="Target Workspace ID"
+    ),
+    all_boards: bool = typer.Option(False, "--all", help="Import every board from trello-list"),
+    retry_failed: bool = typer.Option(
+        False, "--retry-failed", help="Resubmit the boards that failed in the last batch"
+    ),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", help="Imports running at once"),
+    timeout: float = typer.Option(1800.0, "--timeout", help="Seconds to wait for each import"),
+):
+    """Import many Trello boards, polling each import until it completes."""
+    try:
+        config = load_config()
+        client = KanbnClient(config)
+
+        names: Dict[str, str] = {}
+        ids = list(board_ids or [])
+        if retry_failed:
+            failed_file = _failed_file()
+            if not failed_file.exists():
+                print_info("No failed imports recorded")
+                return
+            previous = _load_failed(failed_file)
+            ids.extend(previous["boards"])
+            workspace_id = workspace_id or previous["workspace"]
+        if all_boards:
+            for board in client.get("integration/trello/boards") or []:
+                ids.append(board.get("id"))
+                names[board.get("id")] = board.get("name", "")
+
+        ids = list(dict.fromkeys(i for i in ids if i))
+        if not ids:
+            raise ValidationError("No boards to import. Pass board IDs, --all or --retry-failed.")
+        if not workspace_id:
+            raise ValidationError("Target workspace is required (--workspace).")
+
+        print_info(f"Importing {len(ids)} board(s) with concurrency {concurrency}...")
+        results = []
+        for outcome in iter_completed(
+            lambda board_id: _run_import(client, board_id, workspace_id, timeout), ids, concurrency
+        ):
+            row = {"board": outcome.item, "name": names.get(outcome.item, "")}
+            if outcome.ok:
+                row.update(outcome.value)
+            else:
+                row.update({"status": "failed", "error": str(outcome.error)})
+            if row.get("error"):
+                print_error(f"{outcome.item}: {row['error']}")
+            else:
+                print_success(f"{outcome.item}: {row['status']} ({row['duration']:.1f}s)")
+            results.append(row)
+
+        display_import_results(results)
+
+        failed = [row["board"] for row in results if row.get("error")]
+        if failed:
+            _save_failed(_failed_file(), workspace_id, failed)
+            print_error(
+                f"{len(failed)} import(s) failed. "
+                "Resubmit with: kanbn import trello-batch --retry-failed"
+            )
+            raise typer.Exit(1)
+        if _failed_file().exists():
+            _failed_file().unlink()
+
+    except KanbnError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
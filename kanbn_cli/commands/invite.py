@@ -4,17 +4,23 @@ import typer
 
 from kanbn_cli.api.client import KanbnClient
 from kanbn_cli.config import load_config
-from kanbn_cli.utils.display import print_error, print_success, print_info
+from kanbn_cli.utils.completion import complete_workspace
+from kanbn_cli.utils.display import (
+    get_console,
+    is_quiet,
+    print_error,
+    print_id,
+    print_info,
+    print_success,
+)
 from kanbn_cli.utils.errors import KanbnError
-from rich.panel import Panel
-from kanbn_cli.utils.display import console
 
 app = typer.Typer(help="Manage invites")
 
 
 @app.command("create")
 def create_invite(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
 ):
     """Generate workspace invite link."""
     try:
@@ -31,7 +37,7 @@ def create_invite(
 
 @app.command("get")
 def get_invite(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
 ):
     """Get active invite link."""
     try:
@@ -52,7 +58,7 @@ def get_invite(
 
 @app.command("revoke")
 def revoke_invite(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
     """Revoke active invite link."""
@@ -103,8 +109,13 @@ def get_invite_info(
         client = KanbnClient(config)
 
         invite = client.get(f"invites/{code}")
-        
-        console.print(Panel.fit(
+        if is_quiet():
+            print_id(invite.get("workspace") or {})
+            return
+
+        from rich.panel import Panel
+
+        get_console().print(Panel.fit(
             f"Workspace: {invite.get('workspace', {}).get('name')}\n"
             f"Inviter: {invite.get('inviter', {}).get('name')}\n"
             f"Expires: {invite.get('expiresAt')}",
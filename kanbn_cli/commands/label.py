@@ -1,31 +1,51 @@
 """Label commands."""
 
-from typing import Optional
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 import typer
 
 from kanbn_cli.api.client import KanbnClient
+from kanbn_cli.api.idempotency import Lookup, create_once
+from kanbn_cli.api.records import Label, entity_id
 from kanbn_cli.config import load_config
-from kanbn_cli.utils.display import print_error, print_success
-from kanbn_cli.utils.errors import KanbnError
+from kanbn_cli.utils.completion import complete_board, complete_label
+from kanbn_cli.utils.concurrency import run_bounded
+from kanbn_cli.utils.display import (
+    display_label_plan,
+    print_created,
+    print_error,
+    print_success,
+    set_quiet,
+)
+from kanbn_cli.utils.errors import KanbnError, ValidationError
+from kanbn_cli.utils.labels import CREATE, DELETE, LabelChange, parse_label_specs, plan_label_sync
 
 app = typer.Typer(help="Manage labels")
 
 
 @app.command("create")
 def create_label(
-    board_id: str = typer.Argument(..., help="Board ID"),
+    board_id: str = typer.Argument(..., help="Board ID", shell_complete=complete_board),
     name: str = typer.Argument(..., help="Label name"),
     color: str = typer.Argument(..., help="Label color (hex code)"),
+    idempotency_key: Optional[str] = typer.Option(
+        None, "--idempotency-key", help="Reruns with the same key return the first result"
+    ),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new ID"),
 ):
     """Create a new label."""
     try:
+        if quiet:
+            set_quiet()
         config = load_config()
         client = KanbnClient(config)
 
         data = {"name": name, "color": color, "board_id": board_id}
-        label = client.post("labels", json=data)
-        print_success(f"Created label: {label.get('name')}")
+        lookup = Lookup(board_id, "labels", name)
+        label = create_once(client, "labels", data, idempotency_key, lookup)
+        print_created(f"Created label: {label.get('name')}", label)
 
     except KanbnError as e:
         print_error(str(e))
@@ -34,7 +54,7 @@ def create_label(
 
 @app.command("get")
 def get_label(
-    label_id: str = typer.Argument(..., help="Label ID"),
+    label_id: str = typer.Argument(..., help="Label ID", shell_complete=complete_label),
 ):
     """Get label details."""
     try:
@@ -42,8 +62,8 @@ def get_label(
         client = KanbnClient(config)
 
         label = client.get(f"labels/{label_id}")
-        from kanbn_cli.utils.display import console
-        console.print(label)
+        from kanbn_cli.utils.display import get_console
+        get_console().print(label)
 
     except KanbnError as e:
         print_error(str(e))
@@ -52,7 +72,7 @@ def get_label(
 
 @app.command("update")
 def update_label(
-    label_id: str = typer.Argument(..., help="Label ID"),
+    label_id: str = typer.Argument(..., help="Label ID", shell_complete=complete_label),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="New name"),
     color: Optional[str] = typer.Option(None, "--color", "-c", help="New color"),
 ):
@@ -81,7 +101,7 @@ def update_label(
 
 @app.command("delete")
 def delete_label(
-    label_id: str = typer.Argument(..., help="Label ID"),
+    label_id: str = typer.Argument(..., help="Label ID", shell_complete=complete_label),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
     """Delete a label."""
@@ -103,3 +123,80 @@ def delete_label(
     except KanbnError as e:
         print_error(str(e))
         raise typer.Exit(1)
+
+
+def _apply_label_change(client: KanbnClient, board_id: str, change: LabelChange) -> None:
+    if change.action == CREATE:
+        data = {"name": change.name, "color": change.color, "board_id": board_id}
+        client.post("labels", json=data)
+    elif change.action == DELETE:
+        client.delete(f"labels/{change.label_id}")
+    else:
+        client.put(f"labels/{change.label_id}", json={"name": change.name, "color": change.color})
+
+
+@app.command("sync")
+def sync_labels(
+    spec_file: Path = typer.Argument(..., help="JSON file with [{name, color, aliases}]"),
+    board_ids: Optional[List[str]] = typer.Argument(
+        None, help="Board IDs", shell_complete=complete_board
+    ),
+    workspace_id: Optional[str] = typer.Option(
+        None, "--workspace", "-w", help="Sync every board in this workspace"
+    ),
+    prune: bool = typer.Option(False, "--prune", help="Delete labels not in the label set"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show the plan without applying it"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Requests in flight"),
+):
+    """Make the labels of many boards match a label set."""
+    try:
+        specs = parse_label_specs(json.loads(spec_file.read_text()))
+        config = load_config()
+        client = KanbnClient(config)
+
+        targets = list(board_ids or [])
+        if workspace_id:
+            targets.extend(
+                entity_id(board) for board in client.paginate(f"workspaces/{workspace_id}/boards")
+            )
+        targets = list(dict.fromkeys(targets))
+        if not targets:
+            raise ValidationError("Pass board IDs or --workspace")
+
+        def plan(board_id: str) -> Tuple[str, List[LabelChange]]:
+            board = client.get(f"boards/{board_id}")
+            labels = [Label.from_api(label) for label in board.get("labels", [])]
+            return board.get("name", board_id), plan_label_sync(labels, specs, prune)
+
+        failed = 0
+        plans = []
+        for outcome in run_bounded(plan, targets, concurrency):
+            if outcome.ok:
+                plans.append((outcome.item, *outcome.value))
+            else:
+                failed += 1
+                print_error(f"{outcome.item}: {outcome.error}")
+
+        display_label_plan(plans)
+        writes = [(board_id, change) for board_id, _, changes in plans for change in changes]
+        if dry_run or not writes:
+            raise typer.Exit(1 if failed else 0)
+
+        outcomes = run_bounded(
+            lambda write: _apply_label_change(client, *write), writes, concurrency
+        )
+        for outcome in outcomes:
+            if not outcome.ok:
+                failed += 1
+                board_id, change = outcome.item
+                print_error(f"{board_id}: {change.describe()}: {outcome.error}")
+        done = sum(outcome.ok for outcome in outcomes)
+        print_success(f"Applied {done} of {len(writes)} label change(s) on {len(plans)} board(s)")
+        if failed:
+            raise typer.Exit(1)
+
+    except (KanbnError, OSError, ValueError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
@@ -5,8 +5,16 @@ from typing import Optional
 import typer
 
 from kanbn_cli.api.client import KanbnClient
+from kanbn_cli.api.idempotency import Lookup, create_once
 from kanbn_cli.config import load_config
-from kanbn_cli.utils.display import display_lists, print_error, print_success
+from kanbn_cli.utils.completion import complete_board, complete_list
+from kanbn_cli.utils.display import (
+    display_lists,
+    print_created,
+    print_error,
+    print_success,
+    set_quiet,
+)
 from kanbn_cli.utils.errors import KanbnError
 
 app = typer.Typer(help="Manage lists")
@@ -14,12 +22,18 @@ app = typer.Typer(help="Manage lists")
 
 @app.command("create")
 def create_list(
-    board_id: str = typer.Argument(..., help="Board ID"),
+    board_id: str = typer.Argument(..., help="Board ID", shell_complete=complete_board),
     name: str = typer.Argument(..., help="List name"),
     position: Optional[int] = typer.Option(None, "--position", "-p", help="Position"),
+    idempotency_key: Optional[str] = typer.Option(
+        None, "--idempotency-key", help="Reruns with the same key return the first result"
+    ),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new ID"),
 ):
     """Create a new list."""
     try:
+        if quiet:
+            set_quiet()
         config = load_config()
         client = KanbnClient(config)
 
@@ -27,8 +41,9 @@ def create_list(
         if position is not None:
             data["position"] = position
 
-        lst = client.post("lists", json=data)
-        print_success(f"Created list: {lst.get('name')}")
+        lookup = Lookup(board_id, "lists", name)
+        lst = create_once(client, "lists", data, idempotency_key, lookup)
+        print_created(f"Created list: {lst.get('name')}", lst)
 
     except KanbnError as e:
         print_error(str(e))
@@ -37,7 +52,7 @@ def create_list(
 
 @app.command("update")
 def update_list(
-    list_id: str = typer.Argument(..., help="List ID"),
+    list_id: str = typer.Argument(..., help="List ID", shell_complete=complete_list),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="New name"),
     position: Optional[int] = typer.Option(None, "--position", "-p", help="New position"),
 ):
@@ -66,7 +81,7 @@ def update_list(
 
 @app.command("delete")
 def delete_list(
-    list_id: str = typer.Argument(..., help="List ID"),
+    list_id: str = typer.Argument(..., help="List ID", shell_complete=complete_list),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
     """Delete a list."""
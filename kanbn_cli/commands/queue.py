@@ -0,0 +1,96 @@
+"""Offline write queue commands."""
+
+import typer
+
+from kanbn_cli.api.client import KanbnClient
+from kanbn_cli.api.offline import UNSENT_ERRORS, OfflineQueue
+from kanbn_cli.config import load_config
+from kanbn_cli.utils.display import display_queue, print_error, print_info, print_success
+from kanbn_cli.utils.errors import KanbnError
+
+app = typer.Typer(help="Manage writes queued while offline")
+
+
+@app.command("list")
+def list_queue(
+    show_all: bool = typer.Option(False, "--all", "-a", help="Include replayed operations"),
+):
+    """List queued operations."""
+    try:
+        entries = [
+            entry
+            for entry in OfflineQueue().state().values()
+            if show_all or entry["status"] != "done"
+        ]
+        display_queue(entries)
+
+    except (KanbnError, OSError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+
+@app.command("replay")
+def replay_queue(
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Requests in flight"),
+    retry_failed: bool = typer.Option(
+        False, "--retry-failed", help="Also resend operations that failed on a previous replay"
+    ),
+):
+    """Send queued operations in order, resolving @local IDs as they are created."""
+    try:
+        config = load_config()
+        client = KanbnClient(config)
+        queue = OfflineQueue()
+
+        if retry_failed:
+            queue.retry_failed()
+        if not queue.pending():
+            print_info("Queue is empty")
+            return
+
+        def report(entry, result, error):
+            if error is None:
+                print_success(f"{entry['method']} {entry['endpoint']}")
+            elif not isinstance(error, UNSENT_ERRORS):
+                print_error(f"{entry['method']} {entry['endpoint']}: {error}")
+
+        counts = queue.replay(
+            lambda method, endpoint, params, json, headers: client.send(
+                method, endpoint, params, json, headers=headers
+            ),
+            concurrency,
+            on_result=report,
+            is_offline=lambda e: isinstance(e, UNSENT_ERRORS),
+        )
+        print_info(
+            f"Replayed {counts['done']}, failed {counts['failed']}, "
+            f"still queued {counts['skipped']}"
+        )
+        if counts["failed"] or counts["skipped"]:
+            raise typer.Exit(1)
+
+    except (KanbnError, OSError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+
+@app.command("clear")
+def clear_queue(
+    confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
+):
+    """Discard all queued operations."""
+    try:
+        if not confirm:
+            confirm = typer.confirm("Discard every queued operation?")
+            if not confirm:
+                raise typer.Abort()
+
+        dropped = OfflineQueue().clear()
+        print_success(f"Cleared queue ({dropped} pending operation(s) discarded)")
+
+    except typer.Abort:
+        print_error("Cancelled")
+        raise typer.Exit(1)
+    except (KanbnError, OSError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
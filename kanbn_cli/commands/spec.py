@@ -0,0 +1,85 @@
+"""Declarative board spec commands (plan/apply)."""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import typer
+
+from kanbn_cli.api.client import KanbnClient
+from kanbn_cli.config import load_config
+from kanbn_cli.utils.boardspec import (
+    Change,
+    Ref,
+    apply_changes,
+    fetch_state,
+    load_spec,
+    plan,
+)
+from kanbn_cli.utils.display import display_spec_plan, print_error, print_success
+from kanbn_cli.utils.errors import KanbnError
+
+
+def _plan(
+    spec_file: Path, prune: bool, concurrency: int
+) -> Tuple[KanbnClient, List[Change], Dict[Ref, str]]:
+    specs = load_spec(spec_file)
+    client = KanbnClient(load_config())
+    state = fetch_state(client, specs, concurrency)
+    changes, refs = plan(specs, state, prune)
+    changes.sort(key=lambda change: change.level)
+    return client, changes, refs
+
+
+def plan_spec(
+    spec_file: Path = typer.Argument(..., help="Spec file (JSON or YAML); - reads stdin"),
+    prune: bool = typer.Option(False, "--prune", help="Delete labels not in the spec"),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Requests in flight"),
+    detailed_exitcode: bool = typer.Option(
+        False, "--detailed-exitcode", help="Exit with 2 when there are changes to apply"
+    ),
+):
+    """Show the changes needed to make boards match a spec."""
+    try:
+        _, changes, _ = _plan(spec_file, prune, concurrency)
+        display_spec_plan(changes)
+        if changes and detailed_exitcode:
+            raise typer.Exit(2)
+
+    except (KanbnError, OSError, ValueError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+
+def apply_spec(
+    spec_file: Path = typer.Argument(..., help="Spec file (JSON or YAML); - reads stdin"),
+    prune: bool = typer.Option(False, "--prune", help="Delete labels not in the spec"),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Requests in flight"),
+    confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
+):
+    """Make boards match a spec, applying only the changes shown by plan."""
+    try:
+        client, changes, refs = _plan(spec_file, prune, concurrency)
+        display_spec_plan(changes)
+        if not changes:
+            return
+        if not confirm and not typer.confirm(f"Apply {len(changes)} change(s)?"):
+            raise typer.Abort()
+
+        def report(change: Change, error: Optional[BaseException]) -> None:
+            if error is not None:
+                print_error(f"{change.board_id}: {change.describe()}: {error}")
+
+        counts = apply_changes(client, changes, refs, concurrency, report)
+        message = f"Applied {counts['done']} of {len(changes)} change(s)"
+        if counts["skipped"]:
+            message += f", {counts['skipped']} skipped after failures"
+        print_success(message)
+        if counts["failed"] or counts["skipped"]:
+            raise typer.Exit(1)
+
+    except typer.Abort:
+        print_error("Cancelled")
+        raise typer.Exit(1)
+    except (KanbnError, OSError, ValueError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
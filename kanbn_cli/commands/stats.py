@@ -0,0 +1,122 @@
+"""System statistics commands: snapshot, collector and trend queries."""
+
+import sqlite3
+import time
+from typing import List, Optional
+
+import httpx
+import typer
+
+from kanbn_cli.api.client import KanbnClient
+from kanbn_cli.commands.admin import statistics
+from kanbn_cli.config import load_config
+from kanbn_cli.utils.dates import parse_duration
+from kanbn_cli.utils.display import (
+    display_stats_points,
+    display_stats_summary,
+    print_error,
+    print_info,
+    print_success,
+)
+from kanbn_cli.utils.errors import AuthenticationError, KanbnError, ValidationError
+from kanbn_cli.utils.timeseries import (
+    DAY,
+    HOUR,
+    RAW,
+    RESOLUTIONS,
+    StatsStore,
+    flatten,
+    summarize_store,
+)
+
+app = typer.Typer(
+    help="View system statistics and track them over time", invoke_without_command=True
+)
+
+
+@app.callback()
+def snapshot(ctx: typer.Context):
+    """View system statistics (run without a subcommand for a snapshot)."""
+    if ctx.invoked_subcommand is None:
+        statistics()
+
+
+@app.command("collect")
+def collect(
+    interval: str = typer.Option("5m", "--interval", "-i", help="Time between samples"),
+    count: int = typer.Option(0, "--count", "-n", help="Stop after N samples (0 = run forever)"),
+    keep_raw: str = typer.Option("7d", "--keep-raw", help="How long to keep raw samples"),
+    keep_hourly: str = typer.Option("90d", "--keep-hourly", help="How long to keep hourly rollups"),
+    keep_daily: str = typer.Option("1825d", "--keep-daily", help="How long to keep daily rollups"),
+):
+    """Sample statistics into the local time-series store (use -n 1 from cron)."""
+    try:
+        seconds = parse_duration(interval)
+        retention = {
+            RAW: parse_duration(keep_raw),
+            HOUR: parse_duration(keep_hourly),
+            DAY: parse_duration(keep_daily),
+        }
+        if seconds <= 0:
+            raise ValidationError("--interval must be positive")
+
+        client = KanbnClient(load_config())
+        taken = failed = 0
+        next_at = time.monotonic()
+        with StatsStore() as store:
+            while True:
+                try:
+                    metrics = flatten(client.get("stats"))
+                    store.record(metrics)
+                    store.maintain(retention)
+                    print_info(f"{time.strftime('%H:%M:%S')} recorded {len(metrics)} metric(s)")
+                except AuthenticationError:
+                    raise
+                except (KanbnError, httpx.HTTPError) as e:
+                    # A collector keeps going through blips; the gap shows in the series
+                    failed += 1
+                    print_error(f"{time.strftime('%H:%M:%S')} sample failed: {e}")
+                taken += 1
+                if count and taken >= count:
+                    break
+                next_at += seconds
+                time.sleep(max(0.0, next_at - time.monotonic()))
+        if failed == taken:
+            raise typer.Exit(1)
+
+    except KeyboardInterrupt:
+        print_success("Collector stopped")
+    except AuthenticationError:
+        print_error("Stats endpoint requires admin permissions")
+        raise typer.Exit(1)
+    except (KanbnError, ValueError, sqlite3.Error) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+
+@app.command("query")
+def query(
+    metrics: Optional[List[str]] = typer.Argument(None, help="Metrics to show (default: all)"),
+    since: str = typer.Option("7d", "--since", "-s", help="How far back to look"),
+    resolution: str = typer.Option("auto", "--resolution", "-r", help="auto, raw, 1h or 1d"),
+    points: bool = typer.Option(False, "--points", help="List every point instead of trends"),
+):
+    """Show trends (change, rate per day, extremes) from collected statistics."""
+    try:
+        start = time.time() - parse_duration(since)
+        with StatsStore() as store:
+            if resolution == "auto":
+                step = store.best_resolution(start)
+            elif resolution in RESOLUTIONS:
+                step = RESOLUTIONS[resolution]
+            else:
+                raise ValidationError(f"Unknown resolution '{resolution}' (auto, raw, 1h, 1d)")
+
+            if points:
+                display_stats_points(store.points(step, start, metrics or ()))
+            else:
+                display_stats_summary(summarize_store(store, step, start, metrics or ()))
+
+    except (KanbnError, ValueError, sqlite3.Error) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
@@ -1,18 +1,22 @@
 """Workspace commands."""
 
-from typing import Optional
+from typing import Optional, Tuple
 
 import typer
 
 from kanbn_cli.api.client import KanbnClient
-from kanbn_cli.config import load_config
+from kanbn_cli.config import KanbnConfig, list_profiles, load_config
+from kanbn_cli.utils.completion import complete_workspace
 from kanbn_cli.utils.display import (
+    display_search_results,
     display_workspace,
     display_workspaces,
     print_error,
     print_success,
+    set_quiet,
 )
-from kanbn_cli.utils.errors import KanbnError
+from kanbn_cli.utils.errors import KanbnError, ValidationError
+from kanbn_cli.utils.instances import each_profile, fan_out_requested
 
 app = typer.Typer(help="Manage workspaces")
 
@@ -24,8 +28,7 @@ def list_workspaces():
         config = load_config()
         client = KanbnClient(config)
         
-        workspaces = client.get("workspaces")
-        display_workspaces(workspaces)
+        display_workspaces(client.paginate("workspaces"))
 
     except KanbnError as e:
         print_error(str(e))
@@ -37,9 +40,12 @@ def create_workspace(
     name: str = typer.Argument(..., help="Workspace name"),
     slug: Optional[str] = typer.Option(None, "--slug", "-s", help="Workspace slug"),
     description: Optional[str] = typer.Option(None, "--description", "-d", help="Description"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Print only the new ID"),
 ):
     """Create a new workspace."""
     try:
+        if quiet:
+            set_quiet()
         config = load_config()
         client = KanbnClient(config)
 
@@ -60,7 +66,9 @@ def create_workspace(
 
 @app.command("get")
 def get_workspace(
-    identifier: str = typer.Argument(..., help="Workspace ID or slug"),
+    identifier: str = typer.Argument(
+        ..., help="Workspace ID or slug", shell_complete=complete_workspace
+    ),
     by_slug: bool = typer.Option(False, "--slug", "-s", help="Use slug instead of ID"),
 ):
     """Get workspace details."""
@@ -82,7 +90,7 @@ def get_workspace(
 
 @app.command("update")
 def update_workspace(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="New name"),
     slug: Optional[str] = typer.Option(None, "--slug", "-s", help="New slug"),
     description: Optional[str] = typer.Option(None, "--description", "-d", help="New description"),
@@ -115,7 +123,7 @@ def update_workspace(
 
 @app.command("delete")
 def delete_workspace(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
     """Delete a workspace."""
@@ -139,36 +147,87 @@ def delete_workspace(
         raise typer.Exit(1)
 
 
+def _search(client: KanbnClient, workspace_id: str, query: str) -> Tuple[list, list, list]:
+    """Collect (boards, cards, other) search results across all pages."""
+    boards = []
+    cards = []
+    other = []
+    for page in client.iter_pages(f"workspaces/{workspace_id}/search", params={"query": query}):
+        if isinstance(page, list):
+            other.extend(page)
+        elif isinstance(page, dict):
+            boards.extend(page.get("boards") or [])
+            cards.extend(page.get("cards") or [])
+    return boards, cards, other
+
+
+def _search_all(workspace_id: str, query: str) -> None:
+    """Search every profile's instance concurrently and merge the hits into one table."""
+
+    def search(config: KanbnConfig) -> Tuple[list, list, list]:
+        workspace = config.default_workspace if workspace_id == "-" else workspace_id
+        if not workspace:
+            raise ValidationError("no default_workspace configured")
+        return _search(KanbnClient(config), workspace, query)
+
+    results = {}
+    failed = 0
+    for outcome in each_profile(search):
+        if outcome.ok:
+            results[outcome.item] = outcome.value
+        else:
+            failed += 1
+            print_error(f"{outcome.item}: {outcome.error}")
+
+    hits = (
+        (name, kind, item)
+        for name in list_profiles()
+        if name in results
+        for kind, items in zip(("board", "card", "item"), results[name])
+        for item in items
+    )
+    display_search_results(hits, f"No results found for '{query}'")
+    if failed:
+        raise typer.Exit(1)
+
+
 @app.command("search")
 def search_workspace(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(
+        ...,
+        help="Workspace ID ('-' with --profile all: each profile's default workspace)",
+        shell_complete=complete_workspace,
+    ),
     query: str = typer.Argument(..., help="Search query"),
 ):
     """Search boards and cards in a workspace."""
     try:
+        if fan_out_requested():
+            _search_all(workspace_id, query)
+            return
+
         config = load_config()
         client = KanbnClient(config)
 
-        results = client.get(f"workspaces/{workspace_id}/search", params={"query": query})
-        
-        if isinstance(results, list):
-            if not results:
-                from kanbn_cli.utils.display import print_info
-                print_info(f"No results found for '{query}'")
-                return
-            # If it returns a list of mixed items, we might need a different display logic
-            # For now, let's dump it or try to categorize if possible
-            # But the error showed specifically empty list []
-            console.print(results)
+        boards, cards, other = _search(client, workspace_id, query)
+
+        if not (boards or cards or other):
+            from kanbn_cli.utils.display import print_info
+            print_info(f"No results found for '{query}'")
             return
 
-        if results.get("boards"):
+        if other:
+            # If it returns a list of mixed items, we might need a different display logic
+            from kanbn_cli.utils.display import get_console
+            get_console().print(other)
+
+        if boards:
             from kanbn_cli.utils.display import display_boards
-            display_boards(results["boards"])
-        
-        if results.get("cards"):
+            display_boards(boards)
+
+        if cards:
             from kanbn_cli.utils.display import display_cards
-            display_cards(results["cards"])
+            display_cards(cards)
 
     except KanbnError as e:
         print_error(str(e))
@@ -177,7 +236,7 @@ def search_workspace(
 
 @app.command("invite")
 def invite_member(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
     email: str = typer.Argument(..., help="User email"),
 ):
     """Invite member by email."""
@@ -196,7 +255,7 @@ def invite_member(
 
 @app.command("remove-member")
 def remove_member(
-    workspace_id: str = typer.Argument(..., help="Workspace ID"),
+    workspace_id: str = typer.Argument(..., help="Workspace ID", shell_complete=complete_workspace),
     user_id: str = typer.Argument(..., help="User ID"),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
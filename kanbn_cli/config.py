@@ -1,16 +1,37 @@
-"""Configuration management for Kan.bn CLI."""
+"""Configuration management for Kan.bn CLI.
+
+``~/.kanbnrc`` holds the ``default`` profile at its top level and any number
+of named profiles (one per Kan.bn instance) under ``"profiles"``. The active
+profile comes from ``--profile``, ``KANBN_PROFILE`` or ``"default_profile"``
+in the file; ``use_profile()`` overrides it for the current thread so one
+process can talk to several instances at once. Each named profile keeps its
+local state (rate-limit buckets, caches, queues) in its own data directory.
+"""
 
 import json
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
+from kanbn_cli.utils.errors import ConfigurationError
+
 # Load .env file if it exists
 load_dotenv()
 
+DEFAULT_PROFILE = "default"
+# Reserved name that fans read commands out over every profile
+ALL_PROFILES = "all"
+
+_PROFILE_KEYS = ("api_url", "api_token", "default_workspace", "offline_queue", "rate_limits")
+
+_process_profile: Optional[str] = None
+_thread_profile = threading.local()
+
 
 class KanbnConfig(BaseModel):
     """Configuration for Kan.bn CLI."""
@@ -23,6 +44,14 @@ class KanbnConfig(BaseModel):
     default_workspace: Optional[str] = Field(
         default=None, description="Default workspace ID or slug"
     )
+    offline_queue: bool = Field(
+        default=False, description="Queue writes locally when the API is unreachable"
+    )
+    rate_limits: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Client-side request budgets per API host ('*' for any host)",
+    )
+    profile: str = Field(default=DEFAULT_PROFILE, description="Profile the values came from")
 
 
 def get_config_path() -> Path:
@@ -31,49 +60,147 @@ def get_config_path() -> Path:
     return home / ".kanbnrc"
 
 
-def load_config() -> KanbnConfig:
-    """Load configuration from environment and config file."""
-    # Start with defaults
-    api_url = os.getenv("KANBN_API_URL", "https://kanban.mikkelkrogsholm.dk/api")
-    api_token = os.getenv("KANBN_API_TOKEN")
-    default_workspace = os.getenv("KANBN_DEFAULT_WORKSPACE")
-
-    # Try to load from config file if it exists
+def _read_config_file() -> Dict[str, Any]:
     config_path = get_config_path()
     if config_path.exists():
         try:
             with open(config_path) as f:
                 data = json.load(f)
-                api_url = data.get("api_url", api_url)
-                api_token = data.get("api_token", api_token)
-                default_workspace = data.get("default_workspace", default_workspace)
+                if isinstance(data, dict):
+                    return data
         except Exception:
             pass
-
-    return KanbnConfig(
-        api_url=api_url,
-        api_token=api_token,
-        default_workspace=default_workspace
+    return {}
+
+
+def set_profile(name: Optional[str]) -> None:
+    """Select the profile for the whole process (the global ``--profile`` option)."""
+    global _process_profile
+    _process_profile = name
+
+
+@contextmanager
+def use_profile(name: str) -> Iterator[None]:
+    """Make name the active profile for the current thread only."""
+    previous = getattr(_thread_profile, "name", None)
+    _thread_profile.name = name
+    try:
+        yield
+    finally:
+        _thread_profile.name = previous
+
+
+def get_profile() -> str:
+    """Name of the active profile."""
+    return (
+        getattr(_thread_profile, "name", None)
+        or _process_profile
+        or os.getenv("KANBN_PROFILE")
+        or _read_config_file().get("default_profile")
+        or DEFAULT_PROFILE
     )
 
 
+def list_profiles() -> List[str]:
+    """Names of all configured profiles, ``default`` first when it has credentials."""
+    data = _read_config_file()
+    named = [name for name in data.get("profiles") or {} if name != DEFAULT_PROFILE]
+    has_default = not named or data.get("api_token") or os.getenv("KANBN_API_TOKEN")
+    return ([DEFAULT_PROFILE] if has_default else []) + named
+
+
+def get_data_dir() -> Path:
+    """Get the directory for CLI state files (caches, journals), creating it if needed.
+
+    Named profiles get their own subdirectory so instances never share state.
+    """
+    data_dir = Path(os.getenv("KANBN_HOME") or Path.home() / ".kanbn")
+    profile = get_profile()
+    if profile not in (DEFAULT_PROFILE, ALL_PROFILES):
+        data_dir = data_dir / "instances" / profile
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
+def load_config(profile: Optional[str] = None) -> KanbnConfig:
+    """Load configuration for a profile (the active one by default).
+
+    The default profile reads the top level of the config file, falling back
+    to the environment. Named profiles only read their own section, so a
+    token never leaks to a different instance; ``rate_limits`` are keyed by
+    host and are inherited from the top level.
+    """
+    profile = profile or get_profile()
+    if profile == ALL_PROFILES:
+        raise ConfigurationError(
+            "'--profile all' only works with read commands: health, workspace search, card list"
+        )
+    data = _read_config_file()
+
+    if profile == DEFAULT_PROFILE:
+        # Start with defaults
+        values: Dict[str, Any] = {
+            "api_url": os.getenv("KANBN_API_URL", "https://kanban.mikkelkrogsholm.dk/api"),
+            "api_token": os.getenv("KANBN_API_TOKEN"),
+            "default_workspace": os.getenv("KANBN_DEFAULT_WORKSPACE"),
+        }
+        section = data
+    else:
+        section = (data.get("profiles") or {}).get(profile)
+        if not isinstance(section, dict):
+            raise ConfigurationError(
+                f"Unknown profile '{profile}' (add it with 'kanbn --profile {profile} auth login')"
+            )
+        values = {"rate_limits": data.get("rate_limits") or {}}
+
+    for key in _PROFILE_KEYS:
+        if section.get(key) is not None:
+            values[key] = section[key]
+    values["offline_queue"] = bool(values.get("offline_queue"))
+    values["rate_limits"] = values.get("rate_limits") or {}
+
+    return KanbnConfig(profile=profile, **values)
+
+
 def save_config(config: KanbnConfig) -> None:
-    """Save configuration to config file."""
+    """Save configuration to its profile's section of the config file."""
     config_path = get_config_path()
+    data = _read_config_file()
+    if config.profile == DEFAULT_PROFILE:
+        section = data
+    else:
+        section = data.setdefault("profiles", {}).setdefault(config.profile, {})
+    section.update(
+        api_url=config.api_url,
+        api_token=config.api_token,
+        default_workspace=config.default_workspace,
+    )
+    if config.offline_queue:
+        section["offline_queue"] = True
+    if config.rate_limits:
+        section["rate_limits"] = config.rate_limits
     with open(config_path, "w") as f:
-        json.dump(
-            {
-                "api_url": config.api_url,
-                "api_token": config.api_token,
-                "default_workspace": config.default_workspace,
-            },
-            f,
-            indent=2,
-        )
+        json.dump(data, f, indent=2)
 
 
-def clear_config() -> None:
-    """Clear the configuration file."""
+def clear_config(profile: Optional[str] = None) -> None:
+    """Remove a profile's credentials, or the whole file once nothing else is left."""
+    profile = profile or get_profile()
+    if profile == ALL_PROFILES:
+        raise ConfigurationError("Log out of one profile at a time")
     config_path = get_config_path()
-    if config_path.exists():
-        config_path.unlink()
+    data = _read_config_file()
+    profiles = data.get("profiles") or {}
+    if profile == DEFAULT_PROFILE:
+        for key in ("api_url", "api_token", "default_workspace"):
+            data.pop(key, None)
+    else:
+        profiles.pop(profile, None)
+    if not profiles:
+        data.pop("profiles", None)
+    if not profiles and not data.get("api_token"):
+        if config_path.exists():
+            config_path.unlink()
+        return
+    with open(config_path, "w") as f:
+        json.dump(data, f, indent=2)
@@ -1,16 +1,79 @@
 """Main CLI entry point for Kan.bn CLI."""
 
+import atexit
+import os
+import sys
+from typing import Optional
+
+# Completing an ID is answered from the local index before the heavy imports below
+if os.environ.get("_KANBN_COMPLETE"):
+    from kanbn_cli.utils.completion import complete_fast
+
+    complete_fast()
+
+# Quiet runs are scripted and only print IDs, so keep rich out entirely:
+# typer then uses plain click output, and typer.completion no longer pulls
+# in rich at import time. Display paths check is_quiet() before using rich.
+if any(arg in ("-q", "--quiet") for arg in sys.argv[1:]):
+    sys.modules.setdefault("rich", None)
+
 import typer
 
 from kanbn_cli import __version__
-from kanbn_cli.commands import admin, attachment, auth, board, card, checklist, comment, import_cmd, integration, invite, label, list, user, workspace
+from kanbn_cli.api import offline
+from kanbn_cli.config import set_profile
+from kanbn_cli.commands import admin, attachment, auth, board, card, checklist, comment, completion, import_cmd, integration, invite, label, list, queue, spec, stats, user, workspace
+from kanbn_cli.utils.display import print_warning, set_quiet
 
 app = typer.Typer(
     name="kanbn",
     help="Kan.bn CLI - Manage your Kanban boards from the command line",
-    add_completion=False,
 )
 
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    quiet: bool = typer.Option(
+        False, "--quiet", "-q", help="Print only bare IDs (no tables, colors or messages)"
+    ),
+    offline_queue: bool = typer.Option(
+        False, "--offline-queue", help="Queue writes locally if the API cannot be reached"
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        "-P",
+        envvar="KANBN_PROFILE",
+        help="Configuration profile (Kan.bn instance) to use; 'all' fans read commands out",
+    ),
+    perf: bool = typer.Option(
+        False, "--perf", help="Profile CPU, imports and memory; save a report for bug reports"
+    ),
+):
+    """Kan.bn CLI - Manage your Kanban boards from the command line"""
+    set_quiet(quiet)
+    if profile:
+        set_profile(profile)
+    if offline_queue:
+        offline.set_enabled()
+    if perf:
+        from kanbn_cli.utils import profiling
+
+        command = " ".join(arg for arg in sys.argv[1:] if not arg.startswith("-"))[:60]
+        profiling.start()
+        ctx.call_on_close(lambda: profiling.finish(command))
+
+
+@atexit.register
+def _report_queued() -> None:
+    for entry in offline.queued_here:
+        print_warning(
+            f"API unreachable: queued {entry['method']} {entry['endpoint']} as {entry['localId']}"
+            " (run 'kanbn queue replay' when back online)"
+        )
+
+
 # Add command groups
 app.add_typer(auth.app, name="auth")
 app.add_typer(workspace.app, name="workspace")
@@ -25,10 +88,17 @@ app.add_typer(user.app, name="user")
 app.add_typer(import_cmd.app, name="import")
 app.add_typer(integration.app, name="integration")
 app.add_typer(attachment.app, name="attachment")
+app.add_typer(queue.app, name="queue")
+app.add_typer(stats.app, name="stats")
+app.add_typer(completion.app, name="completion")
 
 # Register admin commands at root level
 app.command(name="health")(admin.health_check)
-app.command(name="stats")(admin.statistics)
+app.command(name="ratelimit")(admin.rate_limit_status)
+
+# Declarative board specs
+app.command(name="plan")(spec.plan_spec)
+app.command(name="apply")(spec.apply_spec)
 
 
 @app.command()
@@ -0,0 +1,406 @@
+"""Programmatic Python API for Kan.bn.
+
+The SDK exposes the same operations as the CLI as resource objects on top of
+``KanbnClient``, so automation can run in-process over one pooled connection
+instead of spawning ``kanbn`` for every call::
+
+    from kanbn_cli.sdk import Kanbn
+
+    with Kanbn() as kb:                       # reads ~/.kanbnrc / KANBN_* env vars
+        board = kb.boards.get("x248npxfjymc")
+        card = kb.cards.create(list_id, "Ship it", description="...")
+        kb.cards.comment(card["publicId"], "Created by automation")
+        outcomes = kb.map(kb.cards.get, card_ids, concurrency=8)
+
+The async variant has the same resources; every method returns an awaitable::
+
+    from kanbn_cli.sdk import AsyncKanbn
+
+    async with AsyncKanbn() as kb:
+        card = await kb.cards.get(card_id)
+        outcomes = await kb.map(kb.cards.get, card_ids, concurrency=16)
+
+Methods return the decoded JSON payloads. Use ``kanbn_cli.api.records`` to
+decode large boards into compact typed records.
+"""
+
+import asyncio
+import mimetypes
+import os
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from kanbn_cli.api.client import AsyncKanbnClient, KanbnClient
+from kanbn_cli.api.idempotency import idempotency_headers
+from kanbn_cli.config import KanbnConfig, load_config
+from kanbn_cli.utils.concurrency import Outcome, run_bounded
+
+AnyClient = Union[KanbnClient, AsyncKanbnClient]
+
+
+def _drop_none(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in data.items() if value is not None}
+
+
+class Resource:
+    """Base class for SDK resources bound to a sync or async client."""
+
+    def __init__(self, client: AnyClient):
+        self._client = client
+
+
+class Workspaces(Resource):
+    """Workspace operations."""
+
+    def list(self) -> Any:
+        return self._client.get("workspaces")
+
+    def iter(self) -> Any:
+        """Iterate lazily over all workspaces, following pagination."""
+        return self._client.paginate("workspaces")
+
+    def get(self, workspace_id: str) -> Any:
+        return self._client.get(f"workspaces/{workspace_id}")
+
+    def get_by_slug(self, slug: str) -> Any:
+        return self._client.get(f"workspaces/slug/{slug}")
+
+    def create(
+        self, name: str, slug: Optional[str] = None, description: Optional[str] = None
+    ) -> Any:
+        data = _drop_none({"name": name, "slug": slug, "description": description})
+        return self._client.post("workspaces", json=data)
+
+    def update(self, workspace_id: str, **fields: Any) -> Any:
+        return self._client.put(f"workspaces/{workspace_id}", json=_drop_none(fields))
+
+    def delete(self, workspace_id: str) -> Any:
+        return self._client.delete(f"workspaces/{workspace_id}")
+
+    def search(self, workspace_id: str, query: str) -> Any:
+        return self._client.get(f"workspaces/{workspace_id}/search", params={"query": query})
+
+    def invite(self, workspace_id: str, email: str) -> Any:
+        return self._client.post(f"workspaces/{workspace_id}/members", json={"email": email})
+
+    def remove_member(self, workspace_id: str, user_id: str) -> Any:
+        return self._client.delete(f"workspaces/{workspace_id}/members/{user_id}")
+
+
+class Boards(Resource):
+    """Board operations."""
+
+    def list(self, workspace_id: str) -> Any:
+        return self._client.get(f"workspaces/{workspace_id}/boards")
+
+    def iter(self, workspace_id: str) -> Any:
+        """Iterate lazily over the boards of a workspace, following pagination."""
+        return self._client.paginate(f"workspaces/{workspace_id}/boards")
+
+    def get(self, board_id: str) -> Any:
+        return self._client.get(f"boards/{board_id}")
+
+    def get_by_slug(self, workspace_id: str, slug: str) -> Any:
+        return self._client.get(f"workspaces/{workspace_id}/boards/slug/{slug}")
+
+    def create(
+        self,
+        workspace_id: str,
+        name: str,
+        slug: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Any:
+        data = _drop_none(
+            {"name": name, "workspace_id": workspace_id, "slug": slug, "description": description}
+        )
+        return self._client.post("boards", json=data)
+
+    def update(self, board_id: str, **fields: Any) -> Any:
+        return self._client.put(f"boards/{board_id}", json=_drop_none(fields))
+
+    def delete(self, board_id: str) -> Any:
+        return self._client.delete(f"boards/{board_id}")
+
+
+class Lists(Resource):
+    """List (column) operations."""
+
+    def create(
+        self,
+        board_id: str,
+        name: str,
+        position: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        data = _drop_none({"name": name, "board_id": board_id, "position": position})
+        headers = idempotency_headers(idempotency_key)
+        return self._client.post("lists", json=data, headers=headers)
+
+    def update(
+        self, list_id: str, name: Optional[str] = None, position: Optional[int] = None
+    ) -> Any:
+        data = _drop_none({"name": name, "position": position})
+        return self._client.put(f"lists/{list_id}", json=data)
+
+    def delete(self, list_id: str) -> Any:
+        return self._client.delete(f"lists/{list_id}")
+
+
+class Cards(Resource):
+    """Card operations."""
+
+    def get(self, card_id: str) -> Any:
+        return self._client.get(f"cards/{card_id}")
+
+    def create(
+        self,
+        list_id: str,
+        title: str,
+        description: str = "",
+        position: Optional[int] = None,
+        label_ids: Iterable[str] = (),
+        member_ids: Iterable[str] = (),
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        data = {
+            "title": title,
+            "description": description,
+            "listPublicId": list_id,
+            "position": position or "end",
+            "labelPublicIds": list(label_ids),
+            "memberPublicIds": list(member_ids),
+        }
+        headers = idempotency_headers(idempotency_key)
+        return self._client.post("cards", json=data, headers=headers)
+
+    def update(
+        self,
+        card_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        list_id: Optional[str] = None,
+    ) -> Any:
+        data = _drop_none({"title": title, "description": description, "listPublicId": list_id})
+        return self._client.put(f"cards/{card_id}", json=data)
+
+    def move(self, card_id: str, list_id: str) -> Any:
+        return self.update(card_id, list_id=list_id)
+
+    def delete(self, card_id: str) -> Any:
+        return self._client.delete(f"cards/{card_id}")
+
+    def comment(self, card_id: str, text: str) -> Any:
+        return self._client.post(f"cards/{card_id}/comments", json={"comment": text})
+
+    def add_label(self, card_id: str, label_id: str) -> Any:
+        data = {"label_id": label_id, "action": "add"}
+        return self._client.post(f"cards/{card_id}/labels", json=data)
+
+    def remove_label(self, card_id: str, label_id: str) -> Any:
+        data = {"label_id": label_id, "action": "remove"}
+        return self._client.post(f"cards/{card_id}/labels", json=data)
+
+    def activities(self, card_id: str) -> Any:
+        """Iterate lazily over a card's activity entries, following pagination."""
+        return self._client.paginate(f"cards/{card_id}/activities")
+
+
+class Labels(Resource):
+    """Label operations."""
+
+    def get(self, label_id: str) -> Any:
+        return self._client.get(f"labels/{label_id}")
+
+    def create(
+        self, board_id: str, name: str, color: str, idempotency_key: Optional[str] = None
+    ) -> Any:
+        data = {"name": name, "color": color, "board_id": board_id}
+        headers = idempotency_headers(idempotency_key)
+        return self._client.post("labels", json=data, headers=headers)
+
+    def update(
+        self, label_id: str, name: Optional[str] = None, color: Optional[str] = None
+    ) -> Any:
+        data = _drop_none({"name": name, "color": color})
+        return self._client.put(f"labels/{label_id}", json=data)
+
+    def delete(self, label_id: str) -> Any:
+        return self._client.delete(f"labels/{label_id}")
+
+
+class Checklists(Resource):
+    """Checklist and checklist item operations."""
+
+    def create(self, card_id: str, name: str) -> Any:
+        return self._client.post(f"cards/{card_id}/checklists", json={"name": name})
+
+    def delete(self, checklist_id: str) -> Any:
+        return self._client.delete(f"checklists/{checklist_id}")
+
+    def add_item(self, checklist_id: str, title: str) -> Any:
+        return self._client.post(f"checklists/{checklist_id}/items", json={"title": title})
+
+    def update_item(
+        self, item_id: str, title: Optional[str] = None, completed: Optional[bool] = None
+    ) -> Any:
+        data = _drop_none({"title": title, "completed": completed})
+        return self._client.put(f"checklist-items/{item_id}", json=data)
+
+    def delete_item(self, item_id: str) -> Any:
+        return self._client.delete(f"checklist-items/{item_id}")
+
+
+class Comments(Resource):
+    """Comment operations."""
+
+    def update(self, comment_id: str, text: str) -> Any:
+        return self._client.put(f"comments/{comment_id}", json={"comment": text})
+
+    def delete(self, comment_id: str) -> Any:
+        return self._client.delete(f"comments/{comment_id}")
+
+
+class Attachments(Resource):
+    """Attachment operations."""
+
+    def presigned_url(self, card_id: str, file_name: str, file_type: str) -> Any:
+        data = {"fileName": file_name, "fileType": file_type, "cardPublicId": card_id}
+        return self._client.post("attachments/presigned-url", json=data)
+
+    def confirm(
+        self, attachment_id: str, card_id: str, key: str, file_name: str, file_type: str
+    ) -> Any:
+        data = {"key": key, "fileName": file_name, "fileType": file_type, "cardPublicId": card_id}
+        return self._client.post(f"attachments/{attachment_id}/confirm", json=data)
+
+    def delete(self, attachment_id: str) -> Any:
+        return self._client.delete(f"attachments/{attachment_id}")
+
+    def upload(self, card_id: str, file_path: str) -> Any:
+        """Upload a file to a card (presign, PUT the bytes, confirm)."""
+        file_name, mime_type = _file_info(file_path)
+        presigned = self.presigned_url(card_id, file_name, mime_type)
+        with open(file_path, "rb") as f:
+            response = self._client.http.put(
+                presigned["url"], content=f.read(), headers={"Content-Type": mime_type}
+            )
+        response.raise_for_status()
+        return self.confirm(presigned["publicId"], card_id, presigned["key"], file_name, mime_type)
+
+
+class AsyncAttachments(Attachments):
+    """Attachment operations for the async client."""
+
+    async def upload(self, card_id: str, file_path: str) -> Any:
+        """Upload a file to a card (presign, PUT the bytes, confirm)."""
+        file_name, mime_type = _file_info(file_path)
+        presigned = await self.presigned_url(card_id, file_name, mime_type)
+        with open(file_path, "rb") as f:
+            content = f.read()
+        response = await self._client.http.put(
+            presigned["url"], content=content, headers={"Content-Type": mime_type}
+        )
+        response.raise_for_status()
+        return await self.confirm(
+            presigned["publicId"], card_id, presigned["key"], file_name, mime_type
+        )
+
+
+def _file_info(file_path: str):
+    mime_type, _ = mimetypes.guess_type(file_path)
+    return os.path.basename(file_path), mime_type or "application/octet-stream"
+
+
+class _Resources:
+    attachments_class = Attachments
+
+    def _bind(self, client: AnyClient) -> None:
+        self.client = client
+        self.workspaces = Workspaces(client)
+        self.boards = Boards(client)
+        self.lists = Lists(client)
+        self.cards = Cards(client)
+        self.labels = Labels(client)
+        self.checklists = Checklists(client)
+        self.comments = Comments(client)
+        self.attachments = self.attachments_class(client)
+
+    def me(self) -> Any:
+        """Return the current user's profile."""
+        return self.client.get("users/me")
+
+
+class Kanbn(_Resources):
+    """Synchronous SDK entry point.
+
+    Pass a ``KanbnConfig`` or ``KanbnClient``; with neither, configuration
+    is loaded the same way as the CLI does.
+    """
+
+    def __init__(
+        self, config: Optional[KanbnConfig] = None, client: Optional[KanbnClient] = None
+    ):
+        self._bind(client or KanbnClient(config or load_config()))
+
+    def map(
+        self, fn: Callable[[Any], Any], items: Iterable[Any], concurrency: int = 8
+    ) -> List[Outcome]:
+        """Run fn over items on the shared connection pool with bounded concurrency.
+
+        Returns one Outcome per item, in input order; failures are captured
+        per item rather than raised.
+        """
+        return run_bounded(fn, items, concurrency)
+
+    def close(self) -> None:
+        self.client.close()
+
+    def __enter__(self) -> "Kanbn":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncKanbn(_Resources):
+    """Asynchronous SDK entry point; every resource method returns an awaitable."""
+
+    attachments_class = AsyncAttachments
+
+    def __init__(
+        self, config: Optional[KanbnConfig] = None, client: Optional[AsyncKanbnClient] = None
+    ):
+        self._bind(client or AsyncKanbnClient(config or load_config()))
+
+    async def map(
+        self, fn: Callable[[Any], Awaitable[Any]], items: Iterable[Any], concurrency: int = 16
+    ) -> List[Outcome]:
+        """Await fn over items with at most ``concurrency`` requests in flight.
+
+        Returns one Outcome per item, in input order.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(item: Any) -> Outcome:
+            async with semaphore:
+                try:
+                    return Outcome(item, await fn(item))
+                except Exception as e:  # noqa: BLE001 - failures are isolated per item
+                    return Outcome(item, error=e)
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncKanbn":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+__all__ = [
+    "AsyncKanbn",
+    "Kanbn",
+    "Outcome",
+]
@@ -0,0 +1,104 @@
+"""Card activity history with an incremental on-disk cache.
+
+Activity entries never change once written, so each card's history is kept
+in ``<data dir>/cache/activity/<card id>.json`` and later fetches only walk
+the API until they reach entries that are already cached.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from kanbn_cli.api.client import PAGE_SIZE, KanbnClient, page_items
+from kanbn_cli.api.records import entity_id
+from kanbn_cli.config import get_data_dir
+
+
+def _entry_key(entry: Dict[str, Any]) -> Tuple[str, ...]:
+    """Identify an entry by its ID, or by a digest of its whole content.
+
+    Entries without an ID fall back to the full content because two events
+    of the same type can share a timestamp (a bulk move, say) and only differ
+    in their user or list fields.
+    """
+    public_id = entity_id(entry)
+    if public_id:
+        return (public_id,)
+    content = json.dumps(entry, sort_keys=True, default=str)
+    return ("sha1", hashlib.sha1(content.encode()).hexdigest())
+
+
+def _created(entry: Dict[str, Any]) -> str:
+    return str(entry.get("createdAt", ""))
+
+
+class ActivityCache:
+    """One JSON file of activity entries per card."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root or get_data_dir() / "cache" / "activity"
+
+    def _path(self, card_id: str) -> Path:
+        return self.root / f"{card_id}.json"
+
+    def load(self, card_id: str) -> List[Dict[str, Any]]:
+        try:
+            return json.loads(self._path(card_id).read_text())
+        except (OSError, ValueError):
+            return []
+
+    def save(self, card_id: str, entries: List[Dict[str, Any]]) -> None:
+        """Write entries atomically so concurrent runs never see a partial file."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp, self._path(card_id))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def fetch_activity(
+    client: KanbnClient, card_id: str, cache: Optional[ActivityCache] = None
+) -> List[Dict[str, Any]]:
+    """Return a card's activity history, oldest first.
+
+    With a cache, and when the API lists entries newest first, pages are
+    requested only until one contains an already cached entry. The order is
+    judged from the first entry returned against the last one of the current
+    page, so it also works with one-entry pages. When the API lists entries
+    oldest first the new ones are on the last pages, so every page is read
+    and the cache only saves re-sorting and de-duplicating the known history.
+    """
+    known = cache.load(card_id) if cache else []
+    seen = {_entry_key(entry) for entry in known}
+    fresh = []
+    first: Optional[Dict[str, Any]] = None
+    for page in client.iter_pages(
+        f"cards/{card_id}/activities", page_size=PAGE_SIZE, prefetch=False
+    ):
+        items = page_items(page)
+        if first is None and items:
+            first = items[0]
+        overlap = False
+        for entry in items:
+            key = _entry_key(entry)
+            if key in seen:
+                overlap = True
+                continue
+            seen.add(key)
+            fresh.append(entry)
+        if overlap and first is not None and _created(first) > _created(items[-1]):
+            break
+
+    if not fresh:
+        return known
+    entries = sorted(known + fresh, key=_created)
+    if cache:
+        cache.save(card_id, entries)
+    return entries
@@ -0,0 +1,533 @@
+"""Declarative board specs: parse, diff against live boards, apply in levels.
+
+A spec describes the lists, labels, cards and checklists a board should have::
+
+    {"boards": [{
+        "board": "<board public ID>",
+        "labels": [{"name": "bug", "color": "#e11d48", "aliases": ["Bug"]}],
+        "lists": [{"name": "Backlog", "cards": [{
+            "title": "Weekly review",
+            "description": "...",
+            "labels": ["bug"],
+            "checklists": [{"name": "Steps",
+                            "items": ["Inbox", {"title": "Plan", "completed": true}]}]
+        }]}]
+    }]}
+
+A single board object (with ``board`` at the top level) is accepted too.
+Entities are matched by name (cards by title within their list) and only
+what is missing or different is changed; anything the spec does not
+mention is left alone, except labels with ``prune``. Omitting ``labels``
+or ``description`` on a card leaves that field unmanaged, and plain string
+items never reset an item someone has ticked off.
+
+Changes run in dependency levels (labels and lists, then cards, then
+checklists, then items). Within a level, independent chains run
+concurrently; a chain (the new lists of a board, the new cards of a list,
+the items of a checklist) runs in order so positions follow the spec.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from kanbn_cli.api.idempotency import Lookup, create_once
+from kanbn_cli.api.records import Card, Label, entity_id
+from kanbn_cli.utils.concurrency import run_bounded
+from kanbn_cli.utils.errors import ValidationError
+from kanbn_cli.utils.labels import (
+    CREATE,
+    DELETE,
+    UPDATE,
+    LabelSpec,
+    parse_label_specs,
+    plan_label_sync,
+)
+
+# Dependency levels
+LEVEL_LISTS = 0
+LEVEL_CARDS = 1
+LEVEL_CHECKLISTS = 2
+LEVEL_ITEMS = 3
+
+Ref = Tuple[str, ...]
+
+
+class ChecklistSpec(NamedTuple):
+    name: str
+    # (title, completed); completed is None when the spec leaves it unmanaged
+    items: Tuple[Tuple[str, Optional[bool]], ...] = ()
+
+
+class CardSpec(NamedTuple):
+    title: str
+    description: Optional[str] = None
+    labels: Optional[Tuple[str, ...]] = None
+    checklists: Tuple[ChecklistSpec, ...] = ()
+
+
+class ListSpec(NamedTuple):
+    name: str
+    cards: Tuple[CardSpec, ...] = ()
+
+
+class BoardSpec(NamedTuple):
+    board_id: str
+    labels: Optional[Tuple[LabelSpec, ...]] = None
+    lists: Tuple[ListSpec, ...] = ()
+
+
+class Change(NamedTuple):
+    """One planned write.
+
+    ``run(client, refs)`` performs it once every ref in ``needs`` has an ID
+    and returns the refs it produced. Changes sharing a ``chain`` run in
+    plan order.
+    """
+
+    level: int
+    board_id: str
+    action: str
+    kind: str
+    target: str
+    chain: Ref
+    run: Callable[[Any, Dict[Ref, str]], Dict[Ref, str]]
+    detail: str = ""
+    needs: Tuple[Ref, ...] = ()
+
+    def describe(self) -> str:
+        return f"{self.action} {self.kind} '{self.target}'" + (
+            f" ({self.detail})" if self.detail else ""
+        )
+
+
+def load_spec(path: Path) -> List[BoardSpec]:
+    """Read a JSON or YAML (if PyYAML is installed) spec file; ``-`` reads stdin."""
+    if str(path) == "-":
+        import sys
+
+        text, suffix = sys.stdin.read(), ""
+    else:
+        text, suffix = path.read_text(), path.suffix.lower()
+    if suffix in (".yaml", ".yml") or (not suffix and not text.lstrip().startswith(("{", "["))):
+        try:
+            import yaml
+        except ImportError:
+            raise ValidationError("YAML specs need PyYAML: pip install 'kanbn-cli[yaml]'")
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    return parse_spec(data)
+
+
+def _require(entry: Any, key: str, what: str) -> str:
+    if not isinstance(entry, Mapping) or not entry.get(key):
+        raise ValidationError(f"{what} needs a '{key}': {entry!r}")
+    return str(entry[key])
+
+
+def _unique(names: Iterable[str], what: str) -> None:
+    seen = set()
+    for name in names:
+        if name in seen:
+            raise ValidationError(f"Duplicate {what} '{name}' in spec")
+        seen.add(name)
+
+
+def _parse_checklist(entry: Any) -> ChecklistSpec:
+    name = _require(entry, "name", "Checklist")
+    items = []
+    for item in entry.get("items") or ():
+        if isinstance(item, str):
+            items.append((item, None))
+        else:
+            completed = item.get("completed") if isinstance(item, Mapping) else None
+            items.append((_require(item, "title", "Checklist item"), completed))
+    return ChecklistSpec(name, tuple(items))
+
+
+def _parse_card(entry: Any) -> CardSpec:
+    title = _require(entry, "title", "Card")
+    labels = entry.get("labels")
+    if isinstance(labels, str):
+        labels = [labels]
+    checklists = tuple(_parse_checklist(c) for c in entry.get("checklists") or ())
+    _unique((c.name for c in checklists), f"checklist on card '{title}'")
+    description = entry.get("description")
+    return CardSpec(
+        title,
+        None if description is None else str(description),
+        None if labels is None else tuple(map(str, labels)),
+        checklists,
+    )
+
+
+def parse_spec(data: Any) -> List[BoardSpec]:
+    """Validate spec data into BoardSpecs."""
+    if isinstance(data, Mapping) and "boards" in data:
+        data = data["boards"]
+    elif isinstance(data, Mapping):
+        data = [data]
+    if not isinstance(data, list):
+        raise ValidationError("Spec must be a board object or {\"boards\": [...]}")
+
+    boards = []
+    for entry in data:
+        board_id = _require(entry, "board", "Board")
+        labels = entry.get("labels")
+        lists = []
+        for lst in entry.get("lists") or ():
+            cards = tuple(_parse_card(card) for card in lst.get("cards") or ())
+            name = _require(lst, "name", "List")
+            _unique((card.title for card in cards), f"card in list '{name}'")
+            lists.append(ListSpec(name, cards))
+        _unique((lst.name for lst in lists), f"list on board '{board_id}'")
+        label_specs = None if labels is None else tuple(parse_label_specs(labels))
+        boards.append(BoardSpec(board_id, label_specs, tuple(lists)))
+    _unique((board.board_id for board in boards), "board")
+    return boards
+
+
+def fetch_state(
+    client: Any, specs: List[BoardSpec], concurrency: int = 8
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch every board in the spec concurrently.
+
+    Cards whose checklists the spec manages are fetched too when the board
+    payload does not embed checklists.
+    """
+    state = {}
+    for outcome in run_bounded(lambda s: client.get(f"boards/{s.board_id}"), specs, concurrency):
+        if not outcome.ok:
+            raise outcome.error
+        state[outcome.item.board_id] = outcome.value
+
+    wanted = []
+    for spec in specs:
+        board = state[spec.board_id]
+        managed = {
+            (lst.name, card.title) for lst in spec.lists for card in lst.cards if card.checklists
+        }
+        for lst in board.get("lists", []):
+            for card in lst.get("cards", []):
+                if (lst.get("name"), card.get("title")) in managed and "checklists" not in card:
+                    wanted.append(card)
+    for outcome in run_bounded(
+        lambda card: client.get(f"cards/{entity_id(card)}"), wanted, concurrency
+    ):
+        if not outcome.ok:
+            raise outcome.error
+        outcome.item["checklists"] = outcome.value.get("checklists") or []
+    return state
+
+
+def _created(ref: Ref) -> Callable[[Any], Dict[Ref, str]]:
+    return lambda entity: {ref: entity_id(entity)}
+
+
+def _plan_labels(
+    spec: BoardSpec, board: Mapping[str, Any], refs: Dict[Ref, str], prune: bool
+) -> List[Change]:
+    board_id = spec.board_id
+    current = [Label.from_api(label) for label in board.get("labels", [])]
+    for label in current:
+        refs[("label", board_id, label.name.lower())] = label.public_id
+    if spec.labels is None:
+        return []
+
+    changes = []
+    for label_change in plan_label_sync(current, spec.labels, prune):
+        ref = ("label", board_id, label_change.name.lower())
+        if label_change.action == CREATE:
+            payload = {"name": label_change.name, "color": label_change.color, "board_id": board_id}
+
+            def run(client, refs, payload=payload, ref=ref):
+                lookup = Lookup(board_id, "labels", payload["name"])
+                return _created(ref)(create_once(client, "labels", payload, lookup=lookup))
+
+        elif label_change.action == DELETE:
+
+            def run(client, refs, label_id=label_change.label_id):
+                client.delete(f"labels/{label_id}")
+                return {}
+
+        else:
+            # A renamed label keeps its ID; card labels may refer to either name
+            refs[ref] = label_change.label_id
+
+            def run(client, refs, label_id=label_change.label_id, change=label_change):
+                client.put(f"labels/{label_id}", json={"name": change.name, "color": change.color})
+                return {}
+
+        if label_change.action == UPDATE:
+            detail = label_change.describe()
+        else:
+            detail = label_change.color if label_change.action == CREATE else ""
+        changes.append(
+            Change(
+                LEVEL_LISTS, board_id, label_change.action, "label", label_change.name, ref, run,
+                detail=detail,
+            )
+        )
+    return changes
+
+
+def _plan_items(
+    board_id: str, checklist_ref: Ref, target: str, spec: ChecklistSpec, current: List[Any]
+) -> List[Change]:
+    existing = {item.get("title"): item for item in current}
+    changes = []
+    for title, completed in spec.items:
+        item = existing.get(title)
+        if item is None:
+
+            def run(client, refs, title=title, completed=completed):
+                created = client.post(
+                    f"checklists/{refs[checklist_ref]}/items", json={"title": title}
+                )
+                if completed:
+                    client.put(f"checklist-items/{entity_id(created)}", json={"completed": True})
+                return {}
+
+            detail = "completed" if completed else ""
+            changes.append(
+                Change(
+                    LEVEL_ITEMS, board_id, CREATE, "item", f"{target} / {title}", checklist_ref,
+                    run, detail=detail, needs=(checklist_ref,),
+                )
+            )
+        elif completed is not None and bool(item.get("completed")) != completed:
+
+            def run(client, refs, item_id=entity_id(item), completed=completed):
+                client.put(f"checklist-items/{item_id}", json={"completed": completed})
+                return {}
+
+            detail = "complete" if completed else "reopen"
+            changes.append(
+                Change(
+                    LEVEL_ITEMS, board_id, UPDATE, "item", f"{target} / {title}", checklist_ref,
+                    run, detail=detail,
+                )
+            )
+    return changes
+
+
+def _plan_card(
+    board_id: str,
+    list_name: str,
+    spec: CardSpec,
+    card: Optional[Mapping[str, Any]],
+    refs: Dict[Ref, str],
+) -> List[Change]:
+    list_ref = ("list", board_id, list_name)
+    card_ref = ("card", board_id, list_name, spec.title)
+    target = f"{list_name} / {spec.title}"
+    label_refs = tuple(("label", board_id, name.lower()) for name in spec.labels or ())
+    changes = []
+
+    if card is None:
+        payload = {
+            "title": spec.title,
+            "description": spec.description or "",
+            "position": "end",
+            "memberPublicIds": [],
+        }
+
+        def run(client, refs, payload=payload):
+            data = dict(payload, listPublicId=refs[list_ref])
+            data["labelPublicIds"] = [refs[ref] for ref in label_refs]
+            lookup = Lookup(board_id, "cards", spec.title, data["listPublicId"])
+            return _created(card_ref)(create_once(client, "cards", data, lookup=lookup))
+
+        detail = f"labels: {', '.join(spec.labels)}" if spec.labels else ""
+        changes.append(
+            Change(
+                LEVEL_CARDS, board_id, CREATE, "card", target, list_ref, run,
+                detail=detail, needs=(list_ref, *label_refs),
+            )
+        )
+        current_checklists: Dict[str, Any] = {}
+    else:
+        card_id = entity_id(card)
+        refs[card_ref] = card_id
+        record = Card.from_api(card)
+        if spec.description is not None and record.description != spec.description:
+
+            def run(client, refs):
+                client.put(f"cards/{card_id}", json={"description": spec.description})
+                return {}
+
+            changes.append(
+                Change(
+                    LEVEL_CARDS, board_id, UPDATE, "card", target, card_ref, run,
+                    detail="description",
+                )
+            )
+        if spec.labels is not None:
+            # Compare by ID: a label renamed from an alias is the same label under a new name
+            have = {label.public_id: label.name for label in record.labels}
+            kept = set()
+            want = []
+            for name in spec.labels:
+                label_id = refs.get(("label", board_id, name.lower()))
+                if label_id in have:
+                    kept.add(label_id)
+                else:
+                    want.append(name)
+            extra = [label_id for label_id in have if label_id not in kept]
+            for name in want:
+                ref = ("label", board_id, name.lower())
+
+                def run(client, refs, ref=ref):
+                    client.post(
+                        f"cards/{card_id}/labels", json={"label_id": refs[ref], "action": "add"}
+                    )
+                    return {}
+
+                changes.append(
+                    Change(
+                        LEVEL_CARDS, board_id, UPDATE, "card", target, card_ref, run,
+                        detail=f"add label {name}", needs=(ref,),
+                    )
+                )
+            for label_id in extra:
+
+                def run(client, refs, label_id=label_id):
+                    client.post(
+                        f"cards/{card_id}/labels", json={"label_id": label_id, "action": "remove"}
+                    )
+                    return {}
+
+                changes.append(
+                    Change(
+                        LEVEL_CARDS, board_id, UPDATE, "card", target, card_ref, run,
+                        detail=f"remove label {have[label_id]}",
+                    )
+                )
+        current_checklists = {
+            c.get("name") or c.get("title"): c for c in card.get("checklists") or ()
+        }
+
+    for checklist in spec.checklists:
+        checklist_ref = ("checklist", board_id, list_name, spec.title, checklist.name)
+        checklist_target = f"{target} / {checklist.name}"
+        existing = current_checklists.get(checklist.name)
+        if existing is None:
+
+            def run(client, refs, name=checklist.name, ref=checklist_ref):
+                created = client.post(f"cards/{refs[card_ref]}/checklists", json={"name": name})
+                return _created(ref)(created)
+
+            changes.append(
+                Change(
+                    LEVEL_CHECKLISTS, board_id, CREATE, "checklist", checklist_target, card_ref,
+                    run, needs=(card_ref,),
+                )
+            )
+            items: List[Any] = []
+        else:
+            refs[checklist_ref] = entity_id(existing)
+            items = existing.get("items") or []
+        changes.extend(_plan_items(board_id, checklist_ref, checklist_target, checklist, items))
+    return changes
+
+
+def plan_board(
+    spec: BoardSpec, board: Mapping[str, Any], refs: Dict[Ref, str], prune: bool = False
+) -> List[Change]:
+    """Diff one board against its spec, recording existing entity IDs in refs."""
+    board_id = spec.board_id
+    changes = _plan_labels(spec, board, refs, prune)
+    known_labels = {ref[2] for ref in refs if ref[:2] == ("label", board_id)}
+    known_labels.update(label.name.lower() for label in spec.labels or ())
+    lists = {lst.get("name"): lst for lst in board.get("lists", [])}
+
+    for list_spec in spec.lists:
+        list_ref = ("list", board_id, list_spec.name)
+        lst = lists.get(list_spec.name)
+        if lst is None:
+
+            def run(client, refs, name=list_spec.name, ref=list_ref):
+                payload = {"name": name, "board_id": board_id}
+                lookup = Lookup(board_id, "lists", name)
+                return _created(ref)(create_once(client, "lists", payload, lookup=lookup))
+
+            changes.append(
+                Change(
+                    LEVEL_LISTS, board_id, CREATE, "list", list_spec.name, ("lists", board_id), run
+                )
+            )
+            cards: Dict[str, Any] = {}
+        else:
+            refs[list_ref] = entity_id(lst)
+            cards = {card.get("title"): card for card in lst.get("cards", [])}
+
+        for card_spec in list_spec.cards:
+            for name in card_spec.labels or ():
+                if name.lower() not in known_labels:
+                    raise ValidationError(
+                        f"Card '{card_spec.title}' uses unknown label '{name}' on board {board_id}"
+                    )
+            changes.extend(
+                _plan_card(board_id, list_spec.name, card_spec, cards.get(card_spec.title), refs)
+            )
+    return changes
+
+
+def plan(
+    specs: List[BoardSpec], state: Mapping[str, Mapping[str, Any]], prune: bool = False
+) -> Tuple[List[Change], Dict[Ref, str]]:
+    """Diff every board in the spec; return the changes and the IDs already known."""
+    refs: Dict[Ref, str] = {}
+    changes = []
+    for spec in specs:
+        changes.extend(plan_board(spec, state[spec.board_id], refs, prune))
+    return changes, refs
+
+
+def apply_changes(
+    client: Any,
+    changes: List[Change],
+    refs: Dict[Ref, str],
+    concurrency: int = 8,
+    on_result: Optional[Callable[[Change, Optional[BaseException]], None]] = None,
+) -> Dict[str, int]:
+    """Run changes level by level; chains within a level run concurrently.
+
+    A change whose ``needs`` were not produced (because an earlier change
+    failed) is skipped, as is the rest of a chain after a failure.
+    """
+    counts = {"done": 0, "failed": 0, "skipped": 0}
+    refs = dict(refs)
+    lock = threading.Lock()
+
+    def record(change: Change, error: Optional[BaseException], skipped: int = 0) -> None:
+        with lock:
+            counts["failed" if error else "done"] += 1
+            counts["skipped"] += skipped
+            if on_result:
+                on_result(change, error)
+
+    def run_chain(chain: List[Change]) -> None:
+        for i, change in enumerate(chain):
+            if any(need not in refs for need in change.needs):
+                with lock:
+                    counts["skipped"] += len(chain) - i
+                return
+            try:
+                produced = change.run(client, refs)
+            except Exception as e:  # noqa: BLE001 - reported per change
+                record(change, e, skipped=len(chain) - i - 1)
+                return
+            with lock:
+                refs.update(produced)
+            record(change, None)
+
+    for level in sorted({change.level for change in changes}):
+        chains: Dict[Ref, List[Change]] = {}
+        for change in changes:
+            if change.level == level:
+                chains.setdefault(change.chain, []).append(change)
+        run_bounded(run_chain, list(chains.values()), concurrency)
+    return counts
@@ -0,0 +1,284 @@
+"""Shell completion for IDs, answered from a local index.
+
+Completing a board, list, label, card or workspace argument must never wait
+for the API, and a completion request should not pay for importing typer,
+httpx and pydantic either (together several hundred milliseconds). So:
+
+* ``kanbn completion refresh`` fetches every workspace and board and writes
+  ``<data dir>/completion.json``: each ID with a description, plus a table
+  of which argument or option of which command takes which kind of ID. It
+  is started in the background whenever a completion finds the index older
+  than INDEX_TTL.
+* ``main.py`` calls ``complete_fast()`` before its heavy imports. When the
+  word being completed is an ID, it is answered from the index with only
+  the standard library loaded. Anything else (command and option names, or
+  no index yet) falls through to typer, whose parameters use the same
+  index through ``Completer``.
+
+Only the standard library may be imported at the top of this module.
+"""
+
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+INDEX_NAME = "completion.json"
+INDEX_TTL = 15 * 60
+REFRESH_COOLDOWN = 60
+MAX_RESULTS = 100
+
+PROFILE_OPTIONS = ("--profile", "-P")
+
+Match = Tuple[str, str]
+
+
+def _profile_name(profile: Optional[str]) -> str:
+    if not profile:
+        profile = os.getenv("KANBN_PROFILE")
+    if not profile:
+        try:
+            with open(Path.home() / ".kanbnrc") as f:
+                profile = json.load(f).get("default_profile")
+        except (OSError, ValueError, AttributeError):
+            profile = None
+    # '--profile all' fans out at run time; completion uses the default instance
+    return "default" if not profile or profile == "all" else profile
+
+
+def index_path(profile: Optional[str] = None) -> Path:
+    """Index location for a profile (the same layout as ``config.get_data_dir``)."""
+    data_dir = Path(os.getenv("KANBN_HOME") or Path.home() / ".kanbn")
+    name = _profile_name(profile)
+    if name != "default":
+        data_dir = data_dir / "instances" / name
+    return data_dir / INDEX_NAME
+
+
+def load_index(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def write_index(path: Path, items: Dict[str, List[Match]], commands: Dict[str, Any]) -> None:
+    """Replace the index atomically, so completions never read a partial file."""
+    from kanbn_cli import __version__
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps(
+            {"version": __version__, "updated": time.time(), "items": items, "commands": commands}
+        )
+    )
+    os.replace(tmp, path)
+
+
+def matches(index: Dict[str, Any], kind: str, incomplete: str) -> List[Match]:
+    """IDs of kind whose ID starts with, or whose description contains, the typed text."""
+    needle = incomplete.lower()
+    found = []
+    for value, description in index.get("items", {}).get(kind, ()):
+        if value.lower().startswith(needle) or needle in description.lower():
+            found.append((value, description))
+            if len(found) >= MAX_RESULTS:
+                break
+    return found
+
+
+def schedule_refresh(path: Path, index: Dict[str, Any], profile: Optional[str] = None) -> None:
+    """Rebuild a stale or outdated index in a detached process, at most once a minute."""
+    from kanbn_cli import __version__
+
+    fresh = time.time() - index.get("updated", 0) < INDEX_TTL
+    if fresh and index.get("version") == __version__:
+        return
+    stamp = path.with_name(INDEX_NAME + ".refresh")
+    try:
+        if time.time() - stamp.stat().st_mtime < REFRESH_COOLDOWN:
+            return
+    except OSError:
+        pass
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        args = [sys.executable, "-m", "kanbn_cli.main", "-q"]
+        if _profile_name(profile) != "default":
+            args += ["--profile", _profile_name(profile)]
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if not (key.endswith("_COMPLETE") or key.startswith(("_TYPER_", "COMP_")))
+        }
+        subprocess.Popen(
+            args + ["completion", "refresh"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+class Completer:
+    """``shell_complete`` callback completing one kind of ID from the index."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+
+    def __call__(self, ctx: Any, param: Any, incomplete: str) -> List[Any]:
+        from click.shell_completion import CompletionItem
+
+        profile = ctx.find_root().params.get("profile")
+        path = index_path(profile)
+        index = load_index(path)
+        schedule_refresh(path, index, profile)
+        return [
+            CompletionItem(value, help=description)
+            for value, description in matches(index, self.kind, incomplete)
+        ]
+
+
+complete_workspace = Completer("workspace")
+complete_board = Completer("board")
+complete_list = Completer("list")
+complete_label = Completer("label")
+complete_card = Completer("card")
+
+
+def _split(string: str) -> List[str]:
+    """Split a command line like click does, keeping an unterminated last word."""
+    lexer = shlex.shlex(string, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    words: List[str] = []
+    try:
+        for word in lexer:
+            words.append(word)
+    except ValueError:
+        words.append(lexer.token)
+    return words
+
+
+def _completion_args(shell: str) -> Optional[Tuple[List[str], str]]:
+    """(args, incomplete) the way typer's completion class for shell reads them."""
+    if shell == "bash":
+        words = _split(os.environ.get("COMP_WORDS", ""))
+        cword = int(os.environ.get("COMP_CWORD", "0"))
+        return words[1:cword], words[cword] if cword < len(words) else ""
+    line = os.environ.get("_TYPER_COMPLETE_ARGS", "")
+    args = _split(line)[1:]
+    if shell in ("powershell", "pwsh"):
+        incomplete = os.environ.get("_TYPER_COMPLETE_WORD_TO_COMPLETE", "")
+        return (args[:-1] if incomplete else args), incomplete
+    if shell in ("zsh", "fish"):
+        if args and not line.endswith(" "):
+            return args[:-1], args[-1]
+        return args, ""
+    return None
+
+
+def resolve_kind(
+    spec: Dict[str, Any], args: Sequence[str], incomplete: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """Kind of ID expected for the incomplete word, and any ``--profile`` given.
+
+    Returns ``(None, ...)`` whenever the command line is not fully understood
+    or the word is not an ID, so the caller can defer to typer.
+    """
+    node, position, pending, profile = spec, 0, None, None
+    for word in args:
+        if pending is not None:
+            if node is spec and pending in PROFILE_OPTIONS:
+                profile = word
+            pending = None
+        elif word.startswith("-") and word != "-":
+            name, has_value, value = word.partition("=")
+            if name not in node.get("options", {}):
+                return None, profile
+            if has_value and node is spec and name in PROFILE_OPTIONS:
+                profile = value
+            elif node["options"][name] is not None and not has_value:
+                pending = name
+        elif node.get("commands"):
+            if word not in node["commands"]:
+                return None, profile
+            node = node["commands"][word]
+        else:
+            position += 1
+
+    if incomplete.startswith("-"):
+        return None, profile
+    if pending is not None:
+        return node["options"][pending] or None, profile
+    kinds = node.get("args", [])
+    if position < len(kinds):
+        return kinds[position] or None, profile
+    if kinds and node.get("variadic"):
+        return kinds[-1] or None, profile
+    return None, profile
+
+
+def _format(shell: str, found: List[Match]) -> str:
+    if shell == "bash":
+        return "\n".join(value for value, _ in found)
+    if shell == "zsh":
+        if not found:
+            return "_files"
+
+        def escape(s: str) -> str:
+            return s.replace('"', '""').replace("'", "''").replace("$", "\\$").replace("`", "\\`")
+
+        items = "\n".join(
+            f'"{escape(value)}":"{escape(description)}"' if description else f'"{escape(value)}"'
+            for value, description in found
+        )
+        return f"_arguments '*: :(({items}))'"
+    if shell == "fish":
+        return "\n".join(
+            f"{value}\t{' '.join(description.split())}" if description else value
+            for value, description in found
+        )
+    return "\n".join(f"{value}:::{description or ' '}" for value, description in found)
+
+
+def complete_fast(complete_var: str = "_KANBN_COMPLETE") -> None:
+    """Answer an ID completion from the index and exit; return to let typer handle it."""
+    instruction, _, shell = os.environ.get(complete_var, "").partition("_")
+    if instruction != "complete":
+        return
+    try:
+        parsed = _completion_args(shell)
+    except ValueError:
+        return
+    if parsed is None:
+        return
+    args, incomplete = parsed
+
+    path = index_path(os.getenv("KANBN_PROFILE"))
+    index = load_index(path)
+    kind, profile = resolve_kind(index.get("commands") or {}, args, incomplete)
+    if kind is None:
+        return
+    if profile:
+        path = index_path(profile)
+        index = load_index(path)
+    schedule_refresh(path, index, profile)
+    found = matches(index, kind, incomplete)
+
+    if shell == "fish" and os.environ.get("_TYPER_COMPLETE_FISH_ACTION") == "is-args":
+        sys.exit(0 if found else 1)
+    output = _format(shell, found)
+    if output:
+        sys.stdout.write(output + "\n")
+    sys.exit(0)
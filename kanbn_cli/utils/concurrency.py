@@ -0,0 +1,77 @@
+"""Bounded concurrency helpers for fanning out API requests."""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional
+
+
+class Outcome(NamedTuple):
+    """Result of running a function against one input item."""
+
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _call(fn: Callable[[Any], Any], item: Any) -> Outcome:
+    try:
+        return Outcome(item, fn(item))
+    except Exception as e:  # noqa: BLE001 - failures are isolated per item
+        return Outcome(item, error=e)
+
+
+def run_bounded(
+    fn: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 8
+) -> List[Outcome]:
+    """Run fn over items with at most max_workers in flight.
+
+    Results are returned in input order. Exceptions are captured on the
+    corresponding Outcome instead of aborting the whole batch.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [_call(fn, item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(lambda item: _call(fn, item), items))
+
+
+def iter_completed(
+    fn: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 8
+) -> Iterator[Outcome]:
+    """Run fn over items with bounded concurrency, yielding outcomes as they finish."""
+    items = list(items)
+    if not items:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        futures = [pool.submit(_call, fn, item) for item in items]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def poll_with_backoff(
+    fn: Callable[[], Any],
+    is_done: Callable[[Any], bool],
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    factor: float = 1.5,
+    timeout: Optional[float] = None,
+) -> Any:
+    """Call fn until is_done(result) is true, sleeping with jittered exponential backoff.
+
+    Raises TimeoutError if timeout seconds elapse first.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        result = fn()
+        if is_done(result):
+            return result
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Gave up polling after {timeout:g}s")
+        time.sleep(delay * random.uniform(0.8, 1.2))
+        delay = min(delay * factor, max_delay)
@@ -0,0 +1,83 @@
+"""Date and time helpers for API timestamps."""
+
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Parse an ISO 8601 API timestamp into a POSIX timestamp.
+
+    Returns None for missing or unparseable values. Naive timestamps are
+    treated as UTC.
+    """
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def iso_week(timestamp: float) -> str:
+    """Return the ISO week label (e.g. ``2026-W07``) for a POSIX timestamp."""
+    year, week, _ = datetime.fromtimestamp(timestamp, tz=timezone.utc).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+_DATE_ONLY = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_LAST_INSTANT = 86400 - 1e-6  # offset of the last microsecond of a day
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration such as ``90s``, ``15m``, ``12h``, ``7d`` or ``2w`` into seconds.
+
+    A bare number is taken as seconds. Raises ValueError for anything else.
+    """
+    text = str(value).strip().lower()
+    unit = _DURATION_UNITS.get(text[-1:]) if text else None
+    number = text[:-1] if unit else text
+    try:
+        seconds = float(number) * (unit or 1)
+    except ValueError:
+        raise ValueError(f"Invalid duration: {value!r} (expected e.g. 30s, 15m, 12h, 7d)")
+    if seconds < 0:
+        raise ValueError(f"Invalid duration: {value!r}")
+    return seconds
+
+
+def parse_when(value: str, now: Optional[float] = None, end_of_day: bool = False) -> float:
+    """Parse a point in time for filters into a POSIX timestamp.
+
+    Accepts ``now``, ``today`` (midnight UTC), an offset from now such as
+    ``+3d`` or ``-2w``, or an ISO 8601 date or timestamp. With end_of_day,
+    ``today`` and date-only values mean the last instant of that day, so an
+    upper bound includes the whole day. Raises ValueError for anything else.
+    """
+    now = time.time() if now is None else now
+    text = str(value).strip().lower()
+    if text == "now":
+        return now
+    if text == "today":
+        start = now - now % 86400
+        return start + _LAST_INSTANT if end_of_day else start
+    if text[:1] in "+-" and len(text) > 1:
+        offset = parse_duration(text[1:])
+        return now + offset if text[0] == "+" else now - offset
+    parsed = parse_timestamp(value)
+    if parsed is None:
+        raise ValueError(f"Invalid date: {value!r} (expected e.g. 2026-11-01, today, +7d, -2w)")
+    if end_of_day and _DATE_ONLY.match(text):
+        return parsed + _LAST_INSTANT
+    return parsed
@@ -1,40 +1,120 @@
 """Display utilities for rich terminal output."""
 
-from typing import Any, Dict, List, Optional
+import json
+import os
+import sys
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import print as rprint
+from kanbn_cli.api.records import entity_id
 
-console = Console()
+_console = None
+_quiet = False
+
+
+class _PlainConsole:
+    """Minimal stand-in used when rich is unavailable (e.g. quiet scripted runs)."""
+
+    is_terminal = False
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        sys.stdout.write(" ".join(str(obj) for obj in objects) + "\n")
+
+
+def get_console() -> Any:
+    """Return the shared console, importing rich and creating it on first use."""
+    global _console
+    if _console is None:
+        try:
+            from rich.console import Console
+        except ImportError:
+            _console = _PlainConsole()
+        else:
+            _console = Console()
+    return _console
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps ``from kanbn_cli.utils.display import console`` working without
+    # constructing the console at import time.
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def set_quiet(quiet: bool = True) -> None:
+    """Enable quiet mode: only bare IDs and errors are printed."""
+    global _quiet
+    _quiet = quiet
+
+
+def is_quiet() -> bool:
+    """Return whether quiet mode is enabled."""
+    return _quiet
+
+
+def print_id(entity: Any) -> None:
+    """Print the bare public ID of an entity (or an ID string)."""
+    value = entity if isinstance(entity, str) else entity_id(entity)
+    sys.stdout.write(f"{value}\n")
+
+
+def print_created(message: str, entity: Any) -> None:
+    """Report a created entity: its bare ID in quiet mode, a success message otherwise."""
+    if _quiet:
+        print_id(entity)
+    elif isinstance(entity, dict) and entity.get("queued"):
+        print_info(f"Queued as {entity_id(entity)}; it is created by 'kanbn queue replay'")
+    else:
+        print_success(message)
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    if _quiet:
+        return
+    get_console().print(f"[green]✓[/green] {message}")
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[red]✗[/red] {message}", style="red")
+    if _quiet:
+        sys.stderr.write(f"Error: {message}\n")
+        return
+    get_console().print(f"[red]✗[/red] {message}", style="red")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[yellow]⚠[/yellow] {message}", style="yellow")
+    if _quiet:
+        return
+    get_console().print(f"[yellow]⚠[/yellow] {message}", style="yellow")
+
+
+def print_data(value: Any) -> None:
+    """Print a value as one line of JSON (quiet mode's output for results without IDs)."""
+    sys.stdout.write(json.dumps(value, default=str) + "\n")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+    if _quiet:
+        return
+    get_console().print(f"[blue]ℹ[/blue] {message}")
 
 
 def display_workspace(workspace: Dict[str, Any]) -> None:
     """Display workspace details."""
-    console.print(Panel.fit(
+    if _quiet:
+        print_id(workspace)
+        return
+
+    from rich.panel import Panel
+
+    get_console().print(Panel.fit(
         f"[bold]{workspace.get('name')}[/bold]\n"
-        f"ID: {workspace.get('publicId') or workspace.get('public_id') or workspace.get('id')}\n"
+        f"ID: {entity_id(workspace)}\n"
         f"Slug: {workspace.get('slug', 'N/A')}\n"
         f"Description: {workspace.get('description', 'N/A')}",
         title="Workspace",
@@ -42,105 +122,202 @@ def display_workspace(workspace: Dict[str, Any]) -> None:
     ))
 
 
-def display_workspaces(workspaces: List[Dict[str, Any]]) -> None:
-    """Display a table of workspaces."""
-    if not workspaces:
-        print_info("No workspaces found")
+# Above this many rows (or when stdout is not a terminal) tables are written
+# with a streaming fixed-width formatter instead of a rich Table.
+TABLE_ROW_THRESHOLD = int(os.getenv("KANBN_TABLE_THRESHOLD", "500"))
+# Rows are written in chunks of this size by the streaming formatter
+RENDER_CHUNK_SIZE = 200
+# Longest a column may get in the fixed-width formatter
+MAX_PLAIN_WIDTH = 60
+
+Column = Tuple[str, Dict[str, Any]]
+
+
+def _fit(value: str, width: int) -> str:
+    value = value.replace("\n", " ")
+    if len(value) > width:
+        return value[: width - 1] + "…"
+    return value.ljust(width)
+
+
+def _render_plain(
+    columns: Sequence[Column], sample: List[Sequence[str]], rows: Iterator[Sequence[str]]
+) -> None:
+    """Write rows as fixed-width text, sizing columns from the first rows seen."""
+    widths = [
+        min(MAX_PLAIN_WIDTH, max([len(name)] + [len(str(row[i])) for row in sample]))
+        for i, (name, _) in enumerate(columns)
+    ]
+    last = len(columns) - 1
+
+    def line(values: Sequence[Any]) -> str:
+        cells = [
+            str(value).replace("\n", " ") if i == last else _fit(str(value), widths[i])
+            for i, value in enumerate(values)
+        ]
+        return "  ".join(cells).rstrip() + "\n"
+
+    out = sys.stdout
+    out.write(line([name for name, _ in columns]))
+    out.write(line(["-" * width for width in widths[:last]] + ["-" * len(columns[last][0])]))
+    chunk = [line(row) for row in sample]
+    for row in rows:
+        if len(chunk) >= RENDER_CHUNK_SIZE:
+            out.write("".join(chunk))
+            out.flush()
+            chunk = []
+        chunk.append(line(row))
+    out.write("".join(chunk))
+    out.flush()
+
+
+def render_rows(
+    title: str,
+    columns: Sequence[Column],
+    rows: Iterable[Sequence[str]],
+    empty_message: str = "No results found",
+    id_column: int = 0,
+) -> None:
+    """Render rows as a table, streaming large or non-interactive output.
+
+    Up to TABLE_ROW_THRESHOLD rows on a terminal are shown as a rich Table.
+    Beyond that, or when stdout is not a terminal, rows are written in
+    chunks by a fixed-width formatter so the first screen appears
+    immediately and memory does not grow with the row count. In quiet mode
+    only the ``id_column`` value of each row is printed.
+    """
+    rows = iter(rows)
+    if _quiet:
+        sys.stdout.writelines(f"{row[id_column]}\n" for row in rows)
         return
 
-    table = Table(title="Workspaces")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name", style="green")
-    table.add_column("Slug", style="yellow")
-    table.add_column("Description")
-
-    for ws in workspaces:
-        # Handle API response structure that may wrap workspace in {role, workspace}
-        workspace_data = ws.get("workspace", ws)
-        table.add_row(
-            workspace_data.get("publicId") or workspace_data.get("public_id") or workspace_data.get("id", ""),
-            workspace_data.get("name", ""),
-            workspace_data.get("slug", ""),
-            workspace_data.get("description", "")[:50] if workspace_data.get("description") else ""
-        )
+    sample = list(islice(rows, TABLE_ROW_THRESHOLD + 1))
+    if not sample:
+        print_info(empty_message)
+        return
 
-    console.print(table)
+    if len(sample) > TABLE_ROW_THRESHOLD or not sys.stdout.isatty():
+        _render_plain(columns, sample, rows)
+        return
 
+    from rich.table import Table
 
-def display_boards(boards: List[Dict[str, Any]]) -> None:
-    """Display a table of boards."""
-    if not boards:
-        print_info("No boards found")
-        return
+    table = Table(title=title)
+    for name, options in columns:
+        table.add_column(name, **options)
+    for row in sample:
+        table.add_row(*row)
+    get_console().print(table)
 
-    table = Table(title="Boards")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name", style="green")
-    table.add_column("Slug", style="yellow")
-    table.add_column("Description")
 
-    for board in boards:
-        table.add_row(
-            board.get("publicId") or board.get("public_id") or board.get("id", ""),
+def display_workspaces(workspaces: Iterable[Dict[str, Any]]) -> None:
+    """Display a table of workspaces."""
+    columns = [
+        ("ID", {"style": "cyan"}),
+        ("Name", {"style": "green"}),
+        ("Slug", {"style": "yellow"}),
+        ("Description", {}),
+    ]
+
+    def rows():
+        for ws in workspaces:
+            # Handle API response structure that may wrap workspace in {role, workspace}
+            workspace_data = ws.get("workspace", ws)
+            yield (
+                entity_id(workspace_data),
+                workspace_data.get("name", ""),
+                workspace_data.get("slug", ""),
+                (workspace_data.get("description") or "")[:50],
+            )
+
+    render_rows("Workspaces", columns, rows(), "No workspaces found")
+
+
+def display_boards(boards: Iterable[Dict[str, Any]]) -> None:
+    """Display a table of boards."""
+    columns = [
+        ("ID", {"style": "cyan"}),
+        ("Name", {"style": "green"}),
+        ("Slug", {"style": "yellow"}),
+        ("Description", {}),
+    ]
+    rows = (
+        (
+            entity_id(board),
             board.get("name", ""),
             board.get("slug", ""),
-            board.get("description", "")[:50] if board.get("description") else ""
+            (board.get("description") or "")[:50],
         )
+        for board in boards
+    )
+    render_rows("Boards", columns, rows, "No boards found")
 
-    console.print(table)
 
-
-def display_lists(lists: List[Dict[str, Any]]) -> None:
+def display_lists(lists: Iterable[Dict[str, Any]]) -> None:
     """Display a table of lists."""
-    if not lists:
-        print_info("No lists found")
-        return
-
-    table = Table(title="Lists")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name", style="green")
-    table.add_column("Position", style="yellow")
-
-    for lst in lists:
-        table.add_row(
-            lst.get("publicId") or lst.get("public_id") or lst.get("id", ""),
-            lst.get("name", ""),
-            str(lst.get("position", ""))
-        )
-
-    console.print(table)
-
-
-def display_cards(cards: List[Dict[str, Any]]) -> None:
+    columns = [
+        ("ID", {"style": "cyan"}),
+        ("Name", {"style": "green"}),
+        ("Position", {"style": "yellow"}),
+    ]
+    rows = (
+        (entity_id(lst), lst.get("name", ""), str(lst.get("position", "")))
+        for lst in lists
+    )
+    render_rows("Lists", columns, rows, "No lists found")
+
+
+def display_cards(cards: Iterable[Dict[str, Any]]) -> None:
     """Display a table of cards."""
-    if not cards:
-        print_info("No cards found")
-        return
-
-    table = Table(title="Cards")
-    table.add_column("ID", style="cyan")
-    table.add_column("Title", style="green")
-    table.add_column("Description")
-    table.add_column("Labels", style="yellow")
-
-    for card in cards:
-        labels = ", ".join([l.get("name", "") for l in card.get("labels", [])])
-        table.add_row(
-            card.get("publicId") or card.get("public_id") or card.get("id", ""),
+    columns = [
+        ("ID", {"style": "cyan"}),
+        ("Title", {"style": "green"}),
+        ("Description", {}),
+        ("Labels", {"style": "yellow"}),
+    ]
+    rows = (
+        (
+            entity_id(card),
             card.get("title", ""),
-            card.get("description", "")[:40] if card.get("description") else "",
-            labels
+            (card.get("description") or "")[:40],
+            ", ".join(label.get("name", "") for label in card.get("labels", [])),
         )
-
-    console.print(table)
+        for card in cards
+    )
+    render_rows("Cards", columns, rows, "No cards found")
+
+
+def display_search_results(
+    hits: Iterable[Tuple[str, str, Dict[str, Any]]], empty_message: str = "No results found"
+) -> None:
+    """Display ``(profile, kind, item)`` search hits merged from several instances."""
+    columns = [
+        ("Profile", {"style": "magenta"}),
+        ("Type", {}),
+        ("ID", {"style": "cyan"}),
+        ("Name", {"style": "green"}),
+    ]
+    rows = (
+        (profile, kind, entity_id(item), item.get("name") or item.get("title") or "")
+        if isinstance(item, dict)
+        else (profile, kind, "", str(item))
+        for profile, kind, item in hits
+    )
+    render_rows("Search Results", columns, rows, empty_message, id_column=2)
 
 
 def display_card(card: Dict[str, Any]) -> None:
     """Display detailed card information."""
+    if _quiet:
+        print_id(card)
+        return
+
+    from rich.panel import Panel
+
     labels = ", ".join([l.get("name", "") for l in card.get("labels", [])])
     
     content = f"[bold]{card.get('title')}[/bold]\n\n"
-    content += f"ID: {card.get('publicId') or card.get('public_id') or card.get('id')}\n"
+    content += f"ID: {entity_id(card)}\n"
     content += f"Description: {card.get('description', 'N/A')}\n"
     content += f"Labels: {labels or 'None'}\n"
     content += f"Due Date: {card.get('dueDate') or card.get('due_date', 'N/A')}\n"
@@ -151,41 +328,65 @@ def display_card(card: Dict[str, Any]) -> None:
         content += "\n[bold]Checklists:[/bold]\n"
         for checklist in checklists:
             name = checklist.get('name') or checklist.get('title') or 'Untitled'
-            clid = checklist.get('publicId') or checklist.get('public_id') or checklist.get('id')
+            clid = entity_id(checklist)
             content += f"  • {name} (ID: {clid})\n"
             for item in checklist.get("items", []):
                 status = "✓" if item.get("completed") else "○"
-                iid = item.get('publicId') or item.get('public_id') or item.get('id')
+                iid = entity_id(item)
                 content += f"    {status} {item.get('title')} (ID: {iid})\n"
     
-    console.print(Panel.fit(content, title="Card Details", border_style="green"))
+    get_console().print(Panel.fit(content, title="Card Details", border_style="green"))
+
+
+def display_activities(
+    activities: Union[Dict[str, Any], Iterable[Dict[str, Any]], None],
+    show_card: bool = False,
+) -> None:
+    """Display card activities from an ``activities`` envelope or any iterable of entries.
+
+    With ``show_card`` a leading Card column is filled from each entry's
+    ``cardPublicId``. In quiet mode that card ID is printed, or the
+    activity's own ID without ``show_card``.
+    """
+    if isinstance(activities, dict):
+        activities = activities.get("activities", [])
+    if _quiet and not show_card:
+        sys.stdout.writelines(
+            f"{entity_id(activity)}\n" for activity in activities or [] if entity_id(activity)
+        )
+        return
 
+    columns = [
+        ("Date", {"style": "cyan"}),
+        ("User", {"style": "green"}),
+        ("Action", {"style": "yellow"}),
+        ("Details", {}),
+    ]
+    if show_card:
+        columns.insert(0, ("Card", {"style": "magenta"}))
 
-def display_activities(activities: List[Dict[str, Any]]) -> None:
-    """Display card activities."""
-    if not activities or not activities.get("activities"):
-        print_info("No activities found")
-        return
+    def rows():
+        for activity in activities or []:
+            row = (
+                activity.get("createdAt", ""),
+                (activity.get("user") or {}).get("name", ""),
+                activity.get("action") or activity.get("type", ""),
+                activity.get("details", "") or "",
+            )
+            yield (activity.get("cardPublicId", ""), *row) if show_card else row
 
-    table = Table(title="Card Activity")
-    table.add_column("Date", style="cyan")
-    table.add_column("User", style="green")
-    table.add_column("Action", style="yellow")
-    table.add_column("Details")
-    
-    for activity in activities.get("activities", []):
-        table.add_row(
-            activity.get("createdAt", ""),
-            activity.get("user", {}).get("name", ""),
-            activity.get("action", ""),
-            activity.get("details", "") or ""
-        )
-    console.print(table)
+    render_rows("Card Activity", columns, rows(), "No activities found", id_column=0)
 
 
 def display_user(user: Dict[str, Any]) -> None:
     """Display user profile."""
-    console.print(Panel.fit(
+    if _quiet:
+        print_id(user)
+        return
+
+    from rich.panel import Panel
+
+    get_console().print(Panel.fit(
         f"[bold]{user.get('name')}[/bold]\n"
         f"Email: {user.get('email')}\n"
         f"ID: {user.get('publicId')}",
@@ -194,62 +395,304 @@ def display_user(user: Dict[str, Any]) -> None:
     ))
 
 
-def display_activities(activities: List[Dict[str, Any]]) -> None:
-    """Display card activities."""
-    if not activities or not activities.get("activities"):
-        print_info("No activities found")
-        return
-
-    table = Table(title="Card Activity")
-    table.add_column("Date", style="cyan")
-    table.add_column("User", style="green")
-    table.add_column("Action", style="yellow")
-    table.add_column("Details")
-    
-    for activity in activities.get("activities", []):
-        table.add_row(
-            activity.get("createdAt", ""),
-            activity.get("user", {}).get("name", ""),
-            activity.get("action", ""),
-            activity.get("details", "") or ""
-        )
-    console.print(table)
-
-
 def display_integrations(providers: List[Dict[str, Any]]) -> None:
     """Display integration providers."""
-    if not providers:
-        print_info("No integrations found")
-        return
-
-    table = Table(title="Integrations")
-    table.add_column("Provider", style="cyan")
-    table.add_column("Connected", style="green")
-    
-    for provider in providers:
-        connected = "✓" if provider.get("connected") else "○"
-        table.add_row(
-            provider.get("name", ""),
-            connected
-        )
-    console.print(table)
+    columns = [
+        ("Provider", {"style": "cyan"}),
+        ("Connected", {"style": "green"}),
+    ]
+    rows = (
+        (provider.get("name", ""), "✓" if provider.get("connected") else "○")
+        for provider in providers
+    )
+    render_rows("Integrations", columns, rows, "No integrations found")
 
 
 def display_trello_boards(boards: List[Dict[str, Any]]) -> None:
     """Display Trello boards."""
-    if not boards:
-        print_info("No Trello boards found")
+    columns = [
+        ("ID", {"style": "cyan"}),
+        ("Name", {"style": "green"}),
+        ("URL", {}),
+    ]
+    rows = (
+        (board.get("id", ""), board.get("name", ""), board.get("url", "")) for board in boards
+    )
+    render_rows("Trello Boards", columns, rows, "No Trello boards found")
+
+
+def _fmt_days(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}d"
+
+
+def display_flow_metrics(board_name: str, metrics: Dict[str, Any]) -> None:
+    """Display flow metrics for a board (as one line of JSON in quiet mode)."""
+    if _quiet:
+        print_data({"board": board_name, **metrics})
         return
 
-    table = Table(title="Trello Boards")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name", style="green")
-    table.add_column("URL")
-    
-    for board in boards:
-        table.add_row(
-            board.get("id", ""),
-            board.get("name", ""),
-            board.get("url", "")
+    from rich.table import Table
+
+    wip = Table(title=f"WIP in {board_name}")
+    wip.add_column("List", style="green")
+    wip.add_column("Cards", style="cyan", justify="right")
+    for row in metrics.get("wip", []):
+        wip.add_row(row["list"], str(row["cards"]))
+    get_console().print(wip)
+
+    ages = Table(title="Age in List")
+    ages.add_column("List", style="green")
+    ages.add_column("Cards", justify="right")
+    ages.add_column("p50", style="cyan", justify="right")
+    ages.add_column("p85", style="yellow", justify="right")
+    ages.add_column("Max", style="red", justify="right")
+    for row in metrics.get("ageInList", []):
+        ages.add_row(
+            row["list"],
+            str(row["count"]),
+            _fmt_days(row.get("p50")),
+            _fmt_days(row.get("p85")),
+            _fmt_days(row.get("max")),
+        )
+    get_console().print(ages)
+
+    if metrics.get("labels"):
+        labels = Table(title="Labels")
+        labels.add_column("Label", style="yellow")
+        labels.add_column("Cards", justify="right")
+        for row in metrics["labels"]:
+            labels.add_row(row["label"], str(row["cards"]))
+        get_console().print(labels)
+
+    throughput = Table(title=f"Throughput ({', '.join(metrics.get('doneLists', [])) or 'n/a'})")
+    throughput.add_column("Week", style="cyan")
+    throughput.add_column("Done", style="green", justify="right")
+    for row in metrics.get("throughput", []):
+        throughput.add_row(row["week"], str(row["cards"]))
+    get_console().print(throughput)
+
+    timing = Table(title="Cycle and Lead Time")
+    timing.add_column("Metric", style="green")
+    timing.add_column("Cards", justify="right")
+    timing.add_column("p50", style="cyan", justify="right")
+    timing.add_column("p85", style="yellow", justify="right")
+    timing.add_column("p95", style="red", justify="right")
+    for label, key in (("Cycle time", "cycleTime"), ("Lead time", "leadTime")):
+        row = metrics.get(key, {})
+        timing.add_row(
+            label,
+            str(row.get("count", 0)),
+            _fmt_days(row.get("p50")),
+            _fmt_days(row.get("p85")),
+            _fmt_days(row.get("p95")),
+        )
+    get_console().print(timing)
+
+
+def display_label_plan(plans: List[Tuple[str, str, List[Any]]]) -> None:
+    """Display planned label changes as ``(board_id, board_name, changes)`` rows."""
+    columns = [
+        ("Board", {"style": "cyan"}),
+        ("Name", {"style": "green"}),
+        ("Action", {"style": "yellow"}),
+        ("Change", {}),
+    ]
+    rows = (
+        (board_id, name, change.action, change.describe())
+        for board_id, name, changes in plans
+        for change in changes
+    )
+    render_rows("Label Sync Plan", columns, rows, "No label changes needed")
+
+
+def display_spec_plan(changes: List[Any]) -> None:
+    """Display planned board spec changes in the order they will run."""
+    columns = [
+        ("Board", {"style": "cyan"}),
+        ("Action", {"style": "yellow"}),
+        ("Kind", {}),
+        ("Target", {"style": "green"}),
+        ("Detail", {}),
+    ]
+    rows = (
+        (change.board_id, change.action, change.kind, change.target, change.detail)
+        for change in changes
+    )
+    render_rows("Board Spec Plan", columns, rows, "No changes: boards match the spec")
+
+
+def display_health_report(report: Dict[str, Any]) -> None:
+    """Display per-endpoint probe latency percentiles, error rates and throughput."""
+    columns = [
+        ("Endpoint", {"style": "cyan"}),
+        ("Phase", {}),
+        ("p50", {"justify": "right"}),
+        ("p95", {"justify": "right"}),
+        ("p99", {"justify": "right"}),
+        ("Max", {"justify": "right"}),
+        ("Errors", {"justify": "right", "style": "red"}),
+    ]
+
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:.1f}ms"
+
+    def rows():
+        for endpoint, entry in report["endpoints"].items():
+            errors = f"{entry['errors']}/{entry['count']} ({entry['error_rate']:.0%})"
+            for phase in ("connect", "ttfb", "total"):
+                stats = entry[phase]
+                yield (
+                    endpoint if phase == "connect" else "",
+                    phase,
+                    ms(stats["p50"]),
+                    ms(stats["p95"]),
+                    ms(stats["p99"]),
+                    ms(stats["max"]),
+                    errors if phase == "connect" else "",
+                )
+
+    render_rows("API Latency", columns, rows(), "No probes run")
+    count = len(report["samples"])
+    errors = sum(entry["errors"] for entry in report["endpoints"].values())
+    wall = report["wall"]
+    print_info(
+        f"{count} request(s) in {wall:.2f}s ({count / wall if wall else 0:.1f} req/s), "
+        f"{errors} error(s) ({errors / count if count else 0:.1%})"
+    )
+
+
+def display_stats_summary(summaries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+    """Display per-metric trends from the local stats store."""
+    columns = [
+        ("Metric", {"style": "cyan"}),
+        ("First", {"justify": "right"}),
+        ("Last", {"justify": "right"}),
+        ("Change", {"justify": "right"}),
+        ("Per day", {"justify": "right"}),
+        ("Min", {"justify": "right"}),
+        ("Max", {"justify": "right"}),
+        ("Samples", {"justify": "right"}),
+        ("Since", {}),
+    ]
+    rows = (
+        (
+            metric,
+            f"{s['first']:g}",
+            f"{s['last']:g}",
+            f"{s['change']:+g}",
+            "-" if s["per_day"] is None else f"{s['per_day']:+.2f}",
+            f"{s['min']:g}",
+            f"{s['max']:g}",
+            str(s["samples"]),
+            datetime.fromtimestamp(s["from"]).strftime("%Y-%m-%d %H:%M"),
+        )
+        for metric, s in summaries
+    )
+    render_rows("Statistics Trends", columns, rows, "No samples recorded in this window")
+
+
+def display_stats_points(points: Iterable[Any]) -> None:
+    """Display stored stats points (raw samples or rollup buckets)."""
+    columns = [
+        ("Time", {}),
+        ("Metric", {"style": "cyan"}),
+        ("Avg", {"justify": "right"}),
+        ("Min", {"justify": "right"}),
+        ("Max", {"justify": "right"}),
+        ("Last", {"justify": "right"}),
+        ("Samples", {"justify": "right"}),
+    ]
+    rows = (
+        (
+            datetime.fromtimestamp(p.ts).strftime("%Y-%m-%d %H:%M:%S"),
+            p.metric,
+            f"{p.avg:.6g}",
+            f"{p.min:g}",
+            f"{p.max:g}",
+            f"{p.last:g}",
+            str(p.count),
+        )
+        for p in points
+    )
+    render_rows("Statistics", columns, rows, "No samples recorded in this window", id_column=1)
+
+
+def display_rate_limits(state: Dict[str, Any], now: float) -> None:
+    """Display shared rate-limit buckets with their wait-time metrics."""
+    columns = [
+        ("Bucket", {"style": "cyan"}),
+        ("Rate/s", {"justify": "right"}),
+        ("Burst", {"justify": "right"}),
+        ("Tokens", {"justify": "right"}),
+        ("Requests", {"justify": "right"}),
+        ("Waited", {"justify": "right"}),
+        ("Avg wait", {"justify": "right"}),
+        ("Max wait", {"justify": "right"}),
+        ("429s", {"justify": "right", "style": "red"}),
+    ]
+
+    def rows():
+        for key, bucket in sorted(state.items()):
+            rate = bucket.get("rate", 0.0)
+            burst = bucket.get("burst", 0.0)
+            elapsed = max(0.0, now - bucket.get("updated", now))
+            tokens = min(burst, bucket.get("tokens", 0.0) + elapsed * rate)
+            waits = bucket.get("waits", 0)
+            wait_seconds = bucket.get("waitSeconds", 0.0)
+            yield (
+                key,
+                f"{rate:g}",
+                f"{burst:g}",
+                f"{tokens:.1f}",
+                str(bucket.get("requests", 0)),
+                str(waits),
+                f"{wait_seconds / waits:.2f}s" if waits else "-",
+                f"{bucket.get('maxWait', 0.0):.2f}s",
+                str(bucket.get("throttled", 0)),
+            )
+
+    render_rows("Rate Limits", columns, rows(), "No rate-limited requests recorded")
+
+
+def display_queue(entries: Iterable[Dict[str, Any]]) -> None:
+    """Display offline-queue entries with their placeholder IDs and outcome."""
+    columns = [
+        ("Local ID", {"style": "cyan"}),
+        ("Status", {"style": "yellow"}),
+        ("Method", {}),
+        ("Endpoint", {"style": "green"}),
+        ("Result", {}),
+    ]
+    rows = (
+        (
+            entry.get("localId", ""),
+            entry.get("status", ""),
+            entry.get("method", ""),
+            entry.get("endpoint", ""),
+            entry.get("publicId") or entry.get("error") or "",
+        )
+        for entry in entries
+    )
+    render_rows("Offline Queue", columns, rows, "Queue is empty")
+
+
+def display_import_results(results: List[Dict[str, Any]]) -> None:
+    """Display per-board import results."""
+    columns = [
+        ("Board", {"style": "cyan"}),
+        ("Name", {"style": "green"}),
+        ("Status", {"style": "yellow"}),
+        ("Duration", {"justify": "right"}),
+        ("Error", {"style": "red"}),
+    ]
+    rows = (
+        (
+            row.get("board", ""),
+            row.get("name", ""),
+            row.get("status", ""),
+            f"{row['duration']:.1f}s" if row.get("duration") is not None else "-",
+            row.get("error", "") or "",
         )
-    console.print(table)
+        for row in results
+    )
+    render_rows("Import Results", columns, rows, "No imports run")
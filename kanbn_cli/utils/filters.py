@@ -0,0 +1,117 @@
+"""Card filters compiled into predicates.
+
+A CardFilter holds the criteria from the command line. ``compile_filter``
+turns it into a single predicate once: regexes are compiled, names are
+lowercased and date bounds are parsed up front, and the checks run cheapest
+first so most cards are rejected after a set lookup. Cards are then tested
+in one lazy pass (``filter_cards``), as they stream in or off a decoded board.
+"""
+
+import re
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from kanbn_cli.api.records import Card
+from kanbn_cli.utils.dates import parse_timestamp, parse_when
+from kanbn_cli.utils.errors import ValidationError
+
+Predicate = Callable[[Card], bool]
+
+CHECKLIST_STATES = ("done", "open", "none")
+
+
+class CardFilter(NamedTuple):
+    """Criteria a card must all meet; empty fields match everything."""
+
+    lists: Tuple[str, ...] = ()
+    labels: Tuple[str, ...] = ()
+    assignees: Tuple[str, ...] = ()
+    due_after: Optional[float] = None
+    due_before: Optional[float] = None
+    match: Optional[str] = None
+    checklist: Optional[str] = None
+
+    @classmethod
+    def from_options(
+        cls,
+        lists: Iterable[str] = (),
+        labels: Iterable[str] = (),
+        assignees: Iterable[str] = (),
+        due_after: Optional[str] = None,
+        due_before: Optional[str] = None,
+        match: Optional[str] = None,
+        checklist: Optional[str] = None,
+    ) -> "CardFilter":
+        """Build a filter from command-line strings, raising ValidationError on bad input."""
+        try:
+            after = parse_when(due_after) if due_after else None
+            before = parse_when(due_before, end_of_day=True) if due_before else None
+        except ValueError as e:
+            raise ValidationError(str(e))
+        if checklist is not None and checklist not in CHECKLIST_STATES:
+            raise ValidationError(f"--checklist must be one of: {', '.join(CHECKLIST_STATES)}")
+        if match is not None:
+            try:
+                re.compile(match)
+            except re.error as e:
+                raise ValidationError(f"Invalid --match pattern: {e}")
+        return cls(
+            tuple(name for name in lists if name),
+            tuple(labels or ()),
+            tuple(assignees or ()),
+            after,
+            before,
+            match,
+            checklist,
+        )
+
+    @property
+    def empty(self) -> bool:
+        return not any(self)
+
+
+def _checklist_state(card: Card) -> str:
+    items = [item for checklist in card.checklists for item in checklist.items]
+    if not items:
+        return "none"
+    return "done" if all(item.completed for item in items) else "open"
+
+
+def compile_filter(spec: CardFilter) -> Predicate:
+    """Compile spec into one predicate over Card records."""
+    checks: List[Predicate] = []
+
+    if spec.lists:
+        lists = {name.lower() for name in spec.lists}
+        checks.append(lambda card: card.list_name.lower() in lists)
+    if spec.labels:
+        labels = {name.lower() for name in spec.labels}
+        checks.append(lambda card: labels <= {label.name.lower() for label in card.labels})
+    if spec.assignees:
+        assignees = {name.lower() for name in spec.assignees}
+        checks.append(lambda card: any(member.lower() in assignees for member in card.members))
+    if spec.due_after is not None or spec.due_before is not None:
+        low = spec.due_after if spec.due_after is not None else float("-inf")
+        high = spec.due_before if spec.due_before is not None else float("inf")
+
+        def due_in_range(card: Card) -> bool:
+            due = parse_timestamp(card.due_date)
+            return due is not None and low <= due <= high
+
+        checks.append(due_in_range)
+    if spec.match is not None:
+        search = re.compile(spec.match, re.IGNORECASE).search
+        checks.append(lambda card: bool(search(card.title) or search(card.description)))
+    if spec.checklist is not None:
+        state = spec.checklist
+        checks.append(lambda card: _checklist_state(card) == state)
+
+    if not checks:
+        return lambda card: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda card: all(check(card) for check in checks)
+
+
+def filter_cards(cards: Iterable[Card], predicate: Predicate) -> Iterator[Card]:
+    """Lazily keep the cards the predicate accepts."""
+    return (card for card in cards if predicate(card))
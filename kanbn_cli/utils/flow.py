@@ -0,0 +1,231 @@
+"""Flow analytics (WIP, age, throughput, cycle time) for a board.
+
+A board snapshot and its card activity history are first flattened into
+columnar arrays (one ``array`` per attribute, cards and events addressed by
+integer index). All metrics are then computed in single linear passes over
+those columns, so the cost grows with the number of events rather than with
+the depth of the nested API payload.
+"""
+
+import time
+from array import array
+from collections import Counter
+from math import isnan
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from kanbn_cli.api.records import entity_id
+from kanbn_cli.utils.dates import iso_week, parse_timestamp
+from kanbn_cli.utils.numeric import summarize
+
+DAY = 86400.0
+NAN = float("nan")
+
+EVENT_CREATED = 0
+EVENT_MOVED = 1
+
+
+class BoardColumns:
+    """Columnar representation of a board snapshot and its card activity."""
+
+    def __init__(
+        self,
+        board: Mapping[str, Any],
+        activities: Optional[Mapping[str, Iterable[Mapping[str, Any]]]] = None,
+    ):
+        lists = sorted(
+            board.get("lists", []),
+            key=lambda lst: lst.get("index", lst.get("position", 0)) or 0,
+        )
+
+        self.list_names: List[str] = [lst.get("name", "") for lst in lists]
+        self._list_lookup: Dict[str, int] = {}
+        for i, lst in enumerate(lists):
+            self._list_lookup.setdefault(entity_id(lst), i)
+            self._list_lookup.setdefault(lst.get("name", ""), i)
+
+        self.card_ids: List[str] = []
+        self.card_list = array("i")
+        self.card_created = array("d")
+        self.label_names: List[str] = []
+        self.card_labels = array("i")
+        self.card_label_offsets = array("i", [0])
+
+        label_codes: Dict[str, int] = {}
+        for list_index, lst in enumerate(lists):
+            for card in lst.get("cards", []):
+                self.card_ids.append(entity_id(card))
+                self.card_list.append(list_index)
+                created = parse_timestamp(card.get("createdAt"))
+                self.card_created.append(NAN if created is None else created)
+                for label in card.get("labels", []):
+                    name = label.get("name", "")
+                    code = label_codes.get(name)
+                    if code is None:
+                        code = label_codes[name] = len(self.label_names)
+                        self.label_names.append(name)
+                    self.card_labels.append(code)
+                self.card_label_offsets.append(len(self.card_labels))
+
+        self.event_card = array("i")
+        self.event_time = array("d")
+        self.event_kind = array("b")
+        self.event_list = array("i")
+        if activities:
+            card_index = {card_id: i for i, card_id in enumerate(self.card_ids)}
+            for card_id, events in activities.items():
+                index = card_index.get(card_id)
+                if index is None:
+                    continue
+                for event in events:
+                    self._add_event(index, event)
+
+    def _add_event(self, card_index: int, event: Mapping[str, Any]) -> None:
+        timestamp = parse_timestamp(event.get("createdAt"))
+        if timestamp is None:
+            return
+        kind_name = str(event.get("type") or event.get("action") or "")
+        target = event.get("toList") or event.get("toListPublicId") or event.get("toListId")
+        if isinstance(target, Mapping):
+            target = entity_id(target) or target.get("name")
+        if target is not None or kind_name.endswith(".list"):
+            kind = EVENT_MOVED
+        elif "create" in kind_name:
+            kind = EVENT_CREATED
+        else:
+            return
+        self.event_card.append(card_index)
+        self.event_time.append(timestamp)
+        self.event_kind.append(kind)
+        self.event_list.append(self._list_lookup.get(str(target), -1) if target is not None else -1)
+
+    @property
+    def card_count(self) -> int:
+        return len(self.card_ids)
+
+    def list_indexes(self, names: Iterable[str]) -> List[int]:
+        """Resolve list names (case-insensitive) to column indexes."""
+        wanted = {name.lower() for name in names}
+        return [i for i, name in enumerate(self.list_names) if name.lower() in wanted]
+
+
+def _card_timelines(
+    columns: BoardColumns, done_lists: Sequence[int], backlog_lists: Sequence[int]
+):
+    """Derive created/started/entered/done timestamps per card in one pass.
+
+    A card starts on its first move to a known list outside ``backlog_lists``;
+    moves to lists no longer on the board are ignored.
+    """
+    n = columns.card_count
+    created = array("d", columns.card_created)
+    started = array("d", [NAN]) * n
+    entered = array("d", [NAN]) * n
+    done_at = array("d", [NAN]) * n
+    done = set(done_lists)
+    backlog = set(backlog_lists)
+
+    order = sorted(range(len(columns.event_time)), key=columns.event_time.__getitem__)
+    for e in order:
+        card = columns.event_card[e]
+        ts = columns.event_time[e]
+        if columns.event_kind[e] == EVENT_CREATED:
+            if isnan(created[card]) or ts < created[card]:
+                created[card] = ts
+            continue
+        target = columns.event_list[e]
+        if isnan(started[card]) and target != -1 and target not in backlog:
+            started[card] = ts
+        if target == columns.card_list[card]:
+            entered[card] = ts
+        if target in done:
+            done_at[card] = ts
+        elif target != -1:
+            done_at[card] = NAN
+
+    for card in range(n):
+        if isnan(entered[card]):
+            entered[card] = created[card]
+        if columns.card_list[card] in done and isnan(done_at[card]):
+            done_at[card] = entered[card]
+        if columns.card_list[card] not in done:
+            done_at[card] = NAN
+    return created, started, entered, done_at
+
+
+def _days(summary: Dict[str, Optional[float]]) -> Dict[str, Optional[float]]:
+    return {
+        key: (round(value / DAY, 2) if value is not None and key != "count" else value)
+        for key, value in summary.items()
+    }
+
+
+def compute_flow_metrics(
+    columns: BoardColumns,
+    done_lists: Optional[Sequence[str]] = None,
+    weeks: int = 8,
+    now: Optional[float] = None,
+    backlog_lists: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Compute WIP, label distribution, age-in-list, throughput and cycle time.
+
+    ``done_lists`` names the lists that count as finished work; the last list
+    on the board is used when omitted. ``backlog_lists`` names the lists whose
+    cards have not started yet, for cycle time; the first list is used when
+    omitted.
+    """
+    now = time.time() if now is None else now
+    if done_lists:
+        done = columns.list_indexes(done_lists)
+    else:
+        done = [len(columns.list_names) - 1] if columns.list_names else []
+    if backlog_lists:
+        backlog = columns.list_indexes(backlog_lists)
+    else:
+        backlog = [0] if columns.list_names else []
+
+    wip = Counter(columns.card_list)
+    labels = Counter(columns.card_labels)
+    created, started, entered, done_at = _card_timelines(columns, done, backlog)
+
+    ages: Dict[int, List[float]] = {}
+    cycle: List[float] = []
+    lead: List[float] = []
+    horizon = now - weeks * 7 * DAY
+    throughput = Counter()
+    for card in range(columns.card_count):
+        list_index = columns.card_list[card]
+        finished = done_at[card]
+        if not isnan(finished):
+            start = started[card]
+            if isnan(start) or start > finished:
+                start = created[card]
+            if not isnan(start):
+                cycle.append(finished - start)
+            if not isnan(created[card]):
+                lead.append(finished - created[card])
+            if finished >= horizon:
+                throughput[iso_week(finished)] += 1
+        elif not isnan(entered[card]):
+            ages.setdefault(list_index, []).append(now - entered[card])
+
+    week_labels = [iso_week(now - i * 7 * DAY) for i in reversed(range(weeks))]
+    return {
+        "doneLists": [columns.list_names[i] for i in done],
+        "backlogLists": [columns.list_names[i] for i in backlog],
+        "wip": [
+            {"list": name, "cards": wip.get(i, 0)}
+            for i, name in enumerate(columns.list_names)
+        ],
+        "labels": [
+            {"label": columns.label_names[code], "cards": count}
+            for code, count in labels.most_common()
+        ],
+        "ageInList": [
+            {"list": name, **_days(summarize(ages.get(i, [])))}
+            for i, name in enumerate(columns.list_names)
+            if i not in done
+        ],
+        "throughput": [{"week": week, "cards": throughput.get(week, 0)} for week in week_labels],
+        "cycleTime": _days(summarize(cycle)),
+        "leadTime": _days(summarize(lead)),
+    }
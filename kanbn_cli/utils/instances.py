@@ -0,0 +1,40 @@
+"""Fan read commands out over every configured profile (``--profile all``)."""
+
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+from kanbn_cli.config import (
+    ALL_PROFILES,
+    KanbnConfig,
+    get_profile,
+    list_profiles,
+    load_config,
+    use_profile,
+)
+from kanbn_cli.utils.concurrency import Outcome, iter_completed
+from kanbn_cli.utils.errors import ConfigurationError
+
+
+def fan_out_requested() -> bool:
+    """Whether the active profile is the ``all`` pseudo-profile."""
+    return get_profile() == ALL_PROFILES
+
+
+def each_profile(
+    fn: Callable[[KanbnConfig], Any], profiles: Optional[Sequence[str]] = None
+) -> Iterator[Outcome]:
+    """Run fn(config) for every profile concurrently, yielding outcomes as they finish.
+
+    Each call runs in its own thread with its profile active, so clients it
+    builds get that profile's connection pool, rate limits and data
+    directory. ``Outcome.item`` is the profile name; one instance failing
+    does not stop the others.
+    """
+    names: List[str] = list(profiles or list_profiles())
+    if not names:
+        raise ConfigurationError("No profiles configured (run 'kanbn auth login')")
+
+    def run(name: str) -> Any:
+        with use_profile(name):
+            return fn(load_config(name))
+
+    return iter_completed(run, names, len(names))
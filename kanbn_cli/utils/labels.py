@@ -0,0 +1,125 @@
+"""Planning label changes to bring a board in line with a desired label set.
+
+The planner is pure: it compares a board's current labels with the desired
+specs and returns the fewest writes needed. An existing label is matched to a
+spec by name first and then by any of the spec's aliases (both
+case-insensitive), so a renamed label keeps its ID and card assignments
+instead of being deleted and recreated.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from kanbn_cli.api.records import Label
+from kanbn_cli.utils.errors import ValidationError
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+
+class LabelSpec(NamedTuple):
+    """Desired label: its canonical name, color and former names."""
+
+    name: str
+    color: str
+    aliases: Tuple[str, ...] = ()
+
+
+class LabelChange(NamedTuple):
+    """One write needed to reconcile a board's labels."""
+
+    action: str
+    name: str
+    color: str = ""
+    current: Optional[Label] = None
+
+    @property
+    def label_id(self) -> str:
+        return self.current.public_id if self.current else ""
+
+    def describe(self) -> str:
+        """Human-readable summary, e.g. "rename 'Bug' -> 'bug', recolor #f00 -> #e00"."""
+        if self.action == CREATE:
+            return f"create '{self.name}' {self.color}"
+        if self.action == DELETE:
+            return f"delete '{self.name}'"
+        parts = []
+        if self.current.name != self.name:
+            parts.append(f"rename '{self.current.name}' -> '{self.name}'")
+        if not _same_color(self.current.color, self.color):
+            parts.append(f"recolor {self.current.color or '-'} -> {self.color}")
+        return ", ".join(parts)
+
+
+def _same_color(a: str, b: str) -> bool:
+    return (a or "").lower() == (b or "").lower()
+
+
+def parse_label_specs(data: Any) -> List[LabelSpec]:
+    """Validate a label set given as ``[{name, color, aliases}]`` or ``{"labels": [...]}``."""
+    if isinstance(data, Mapping):
+        data = data.get("labels")
+    if not isinstance(data, list):
+        raise ValidationError("Label set must be a list of {name, color, aliases} objects")
+
+    specs = []
+    seen: Dict[str, str] = {}
+    for entry in data:
+        if not isinstance(entry, Mapping) or not entry.get("name") or not entry.get("color"):
+            raise ValidationError(f"Label entry needs a name and a color: {entry!r}")
+        aliases = entry.get("aliases") or ()
+        if isinstance(aliases, str):
+            aliases = (aliases,)
+        spec = LabelSpec(str(entry["name"]), str(entry["color"]), tuple(map(str, aliases)))
+        for key in (spec.name, *spec.aliases):
+            owner = seen.setdefault(key.lower(), spec.name)
+            if owner != spec.name:
+                raise ValidationError(f"'{key}' is used by both '{owner}' and '{spec.name}'")
+        specs.append(spec)
+    return specs
+
+
+def plan_label_sync(
+    current: Iterable[Label], desired: Sequence[LabelSpec], prune: bool = False
+) -> List[LabelChange]:
+    """Return the minimal create/update/delete plan for one board.
+
+    Labels that already match are left alone; a rename and a recolor of the
+    same label are folded into a single update. Labels not covered by the
+    desired set are deleted only when ``prune`` is set.
+    """
+    remaining = list(current)
+    changes = []
+
+    def take(name: str) -> Optional[Label]:
+        for i, label in enumerate(remaining):
+            if label.name.lower() == name.lower():
+                return remaining.pop(i)
+        return None
+
+    # Exact names are claimed before aliases so an alias never steals a label
+    # that another spec matches by name.
+    matched: Dict[int, Label] = {}
+    for i, spec in enumerate(desired):
+        label = take(spec.name)
+        if label is not None:
+            matched[i] = label
+    for i, spec in enumerate(desired):
+        if i in matched:
+            continue
+        for alias in spec.aliases:
+            label = take(alias)
+            if label is not None:
+                matched[i] = label
+                break
+
+    for i, spec in enumerate(desired):
+        label = matched.get(i)
+        if label is None:
+            changes.append(LabelChange(CREATE, spec.name, spec.color))
+        elif label.name != spec.name or not _same_color(label.color, spec.color):
+            changes.append(LabelChange(UPDATE, spec.name, spec.color, label))
+
+    if prune:
+        changes.extend(LabelChange(DELETE, label.name, label.color, label) for label in remaining)
+    return changes
@@ -0,0 +1,37 @@
+"""Small numeric helpers shared by analytics and monitoring commands."""
+
+import math
+from typing import Dict, Optional, Sequence
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> Optional[float]:
+    """Return the q-th percentile (0-100) of pre-sorted values.
+
+    Uses linear interpolation between closest ranks. Returns None for an
+    empty sequence.
+    """
+    if not sorted_values:
+        return None
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+    rank = (len(sorted_values) - 1) * (q / 100.0)
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return float(sorted_values[low])
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(
+    values: Sequence[float], percentiles: Sequence[float] = (50, 85, 95)
+) -> Dict[str, Optional[float]]:
+    """Summarize values as count, mean, max and the requested percentiles."""
+    ordered = sorted(values)
+    summary: Dict[str, Optional[float]] = {
+        "count": len(ordered),
+        "avg": (sum(ordered) / len(ordered)) if ordered else None,
+        "max": ordered[-1] if ordered else None,
+    }
+    for q in percentiles:
+        summary[f"p{q:g}"] = percentile(ordered, q)
+    return summary
@@ -0,0 +1,146 @@
+"""Profiling a single CLI run for performance bug reports.
+
+``start()`` turns on cProfile and tracemalloc before the command runs and
+``finish()`` stops them, measures import times in a fresh interpreter
+(``python -X importtime``, since this process has already imported
+everything), saves the raw artifacts under ``<data dir>/perf/`` and
+prints a short hot-spot summary to stderr.
+"""
+
+import cProfile
+import io
+import pstats
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from kanbn_cli.config import get_data_dir
+
+TOP = 10
+
+# Dispatch frames that wrap every command and would crowd the hot-spot list
+_FRAMEWORK = ("click/", "typer/")
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)")
+
+_profiler: Optional[cProfile.Profile] = None
+_started = 0.0
+
+
+def start() -> None:
+    """Begin profiling CPU time and allocations."""
+    global _profiler, _started
+    tracemalloc.start()
+    _profiler = cProfile.Profile()
+    _started = time.perf_counter()
+    _profiler.enable()
+
+
+def import_times(module: str = "kanbn_cli.main") -> Tuple[str, List[Tuple[int, int, str]]]:
+    """Import module in a fresh interpreter with ``-X importtime``.
+
+    Returns the raw report and ``(self_us, cumulative_us, name)`` rows.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            rows.append((int(match.group(1)), int(match.group(2)), match.group(4)))
+    return result.stderr, rows
+
+
+def _artifact_dir(command: str) -> Path:
+    name = time.strftime("%Y%m%d-%H%M%S") + "-" + (re.sub(r"[^\w.-]+", "-", command) or "kanbn")
+    path = get_data_dir() / "perf" / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def finish(command: str = "") -> Optional[Path]:
+    """Stop profiling, save artifacts and print a summary; return the artifact directory."""
+    global _profiler
+    if _profiler is None:
+        return None
+    _profiler.disable()
+    elapsed = time.perf_counter() - _started
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    profiler, _profiler = _profiler, None
+
+    out = _artifact_dir(command)
+    profiler.dump_stats(str(out / "cpu.pstats"))
+
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.sort_stats("cumulative").print_stats(TOP * 3)
+    (out / "cpu.txt").write_text(buffer.getvalue())
+
+    allocations = snapshot.statistics("lineno")
+    (out / "memory.txt").write_text(
+        f"peak: {peak} bytes\n" + "".join(f"{stat}\n" for stat in allocations[: TOP * 5])
+    )
+
+    try:
+        report, imports = import_times()
+        (out / "importtime.txt").write_text(report)
+    except (OSError, subprocess.SubprocessError) as e:
+        imports = []
+        (out / "importtime.txt").write_text(f"import time measurement failed: {e}\n")
+
+    lines = [f"Profile of '{command or 'kanbn'}': {elapsed:.3f}s wall, peak memory {_size(peak)}"]
+    lines.append("Hot spots (cumulative):")
+    rows = sorted(
+        (item for item in stats.stats.items() if not any(f in item[0][0] for f in _FRAMEWORK)),
+        key=lambda item: item[1][3],
+        reverse=True,
+    )
+    for (filename, lineno, func), (_, calls, _, cumulative, _) in rows[:TOP]:
+        lines.append(f"  {cumulative:8.3f}s  {calls:>7}  {_where(filename, lineno, func)}")
+    if imports:
+        total = max(cumulative for _, cumulative, _ in imports)
+        lines.append(f"Slowest imports (self time; startup imports take {total / 1e6:.3f}s):")
+        for self_us, _, name in sorted(imports, reverse=True)[: TOP // 2]:
+            lines.append(f"  {self_us / 1e6:8.3f}s  {name}")
+    lines.append("Top allocations:")
+    for stat in allocations[: TOP // 2]:
+        frame = stat.traceback[0]
+        lines.append(f"  {_size(stat.size):>9}  {_short(frame.filename)}:{frame.lineno}")
+    lines.append(f"Artifacts: {out}")
+    print("\n".join(lines), file=sys.stderr)
+    return out
+
+
+def _size(size: float) -> str:
+    if size < 1024:
+        return f"{size:.0f} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def _short(filename: str) -> str:
+    """Trim a path to the part after site-packages, the package root or the stdlib."""
+    for marker in ("site-packages/", "kanbn_cli/"):
+        index = filename.rfind(marker)
+        if index != -1:
+            return filename[index + len(marker) if marker == "site-packages/" else index :]
+    if "/lib/python" in filename:
+        return filename.rsplit("/lib/python", 1)[1].split("/", 1)[-1]
+    return filename
+
+
+def _where(filename: str, lineno: int, func: str) -> str:
+    if filename == "~":
+        return func  # a builtin
+    return f"{_short(filename)}:{lineno}({func})"
@@ -0,0 +1,109 @@
+"""Sorted and top-K views over streams of cards.
+
+``--sort due,-updated`` orders by due date, then most recently updated;
+a ``-`` prefix sorts that key in descending order, and cards missing a
+value (no due date) always come last. With ``--limit`` the stream goes
+through ``heapq.nsmallest``, which keeps only the best K cards in a heap
+while the rest stream past, so "the 20 most overdue cards" across a whole
+workspace needs memory for 20 cards, not for the workspace.
+"""
+
+import heapq
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from kanbn_cli.api.records import Board, Card
+from kanbn_cli.utils.dates import parse_timestamp
+from kanbn_cli.utils.errors import ValidationError
+
+SORT_KEYS = ("due", "updated", "created", "position", "title")
+
+
+class _Descending:
+    """Wrapper that inverts the ordering of any comparable value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+class CardOrder:
+    """Multi-key ordering of cards, parsed from a ``--sort`` value."""
+
+    def __init__(self, keys: List[Tuple[str, bool]]):
+        self.keys = keys
+        # Position sorts by list order first; lists are learned as boards arrive
+        self.list_positions: Dict[str, int] = {}
+
+    @classmethod
+    def parse(cls, text: str) -> "CardOrder":
+        keys = []
+        for part in text.split(","):
+            part = part.strip().lower()
+            name = part.lstrip("-")
+            if name not in SORT_KEYS:
+                raise ValidationError(
+                    f"Unknown sort key '{name}' (choose from {', '.join(SORT_KEYS)})"
+                )
+            keys.append((name, part.startswith("-")))
+        return cls(keys)
+
+    def note_board(self, board: Board) -> None:
+        """Record the list order of a board whose cards are about to be sorted."""
+        for lst in board.lists:
+            self.note_list(lst.public_id, lst.index)
+
+    def note_list(self, list_id: str, index: int) -> None:
+        """Record the position of one list, for cards decoded a list at a time."""
+        self.list_positions[list_id] = index
+
+    def _value(self, card: Card, name: str) -> Any:
+        if name == "due":
+            return parse_timestamp(card.due_date)
+        if name == "updated":
+            return parse_timestamp(card.updated_at)
+        if name == "created":
+            return parse_timestamp(card.created_at)
+        if name == "position":
+            return (self.list_positions.get(card.list_id, 0), card.index)
+        return card.title.lower()
+
+    def key(self, card: Card) -> Tuple:
+        parts = []
+        for name, descending in self.keys:
+            value = self._value(card, name)
+            if value is None:
+                parts.append((1, 0))  # missing values sort last in either direction
+            else:
+                parts.append((0, _Descending(value) if descending else value))
+        return tuple(parts)
+
+
+def order_items(
+    items: Iterable[Any],
+    order: Optional[CardOrder] = None,
+    limit: Optional[int] = None,
+    card_of: Callable[[Any], Card] = lambda item: item,
+) -> Iterable[Any]:
+    """Sort and/or truncate items (anything card_of maps to a Card).
+
+    Without an order the stream stays lazy and is cut after limit items.
+    With both, a bounded heap keeps the best limit items. An order without
+    a limit has to see every item before the first can be returned.
+    """
+    if order is None:
+        return islice(items, limit) if limit is not None else items
+
+    def key(item: Any) -> Tuple:
+        return order.key(card_of(item))
+
+    if limit is not None:
+        return heapq.nsmallest(limit, items, key=key)
+    return sorted(items, key=key)
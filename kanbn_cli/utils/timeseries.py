@@ -0,0 +1,190 @@
+"""Local time-series store for sampled instance statistics.
+
+Samples live in ``<data dir>/stats.sqlite`` in a single table keyed by
+(resolution, metric, bucket start). Raw samples have resolution 0; hourly
+and daily rollups keep the average, minimum, maximum, last value and sample
+count of each bucket, so a rollup of rollups stays exact. ``maintain()``
+rolls complete buckets up and then drops rows past each resolution's
+retention, which keeps the database small however long the collector runs.
+"""
+
+import sqlite3
+import time
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from kanbn_cli.config import get_data_dir
+
+RAW = 0
+HOUR = 3600
+DAY = 86400
+RESOLUTIONS = {"raw": RAW, "1h": HOUR, "1d": DAY}
+
+DEFAULT_RETENTION = {RAW: 7 * DAY, HOUR: 90 * DAY, DAY: 5 * 365 * DAY}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    resolution INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    avg REAL NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    last REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (resolution, metric, ts)
+) WITHOUT ROWID
+"""
+
+
+class Point(NamedTuple):
+    """One bucket (or raw sample) of a metric."""
+
+    ts: int
+    metric: str
+    avg: float
+    min: float
+    max: float
+    last: float
+    count: int
+
+
+def flatten(stats: Any, prefix: str = "") -> Dict[str, float]:
+    """Flatten nested numeric stats into ``{"cards.total": 120.0}``, dropping other values."""
+    metrics: Dict[str, float] = {}
+    if isinstance(stats, Mapping):
+        for key, value in stats.items():
+            metrics.update(flatten(value, f"{prefix}{key}."))
+    elif isinstance(stats, (int, float)) and not isinstance(stats, bool):
+        metrics[prefix.rstrip(".")] = float(stats)
+    return metrics
+
+
+class StatsStore:
+    """SQLite-backed series with downsampling and retention."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_data_dir() / "stats.sqlite"
+        self.db = sqlite3.connect(str(self.path), timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(_SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "StatsStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def record(self, metrics: Mapping[str, float], ts: Optional[float] = None) -> None:
+        """Store one raw sample of every metric."""
+        ts = int(ts if ts is not None else time.time())
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?, ?, ?, ?, 1)",
+                [(RAW, ts, name, value, value, value, value) for name, value in metrics.items()],
+            )
+
+    def _rollup(self, source: int, target: int, now: float) -> None:
+        """Aggregate complete ``target`` buckets from ``source`` rows."""
+        (latest,) = self.db.execute(
+            "SELECT MAX(ts) FROM samples WHERE resolution = ?", (target,)
+        ).fetchone()
+        # The newest rollup is recomputed in case late samples landed in it
+        since = latest if latest is not None else 0
+        until = int(now) // target * target
+        self.db.execute(
+            """
+            INSERT OR REPLACE INTO samples
+            SELECT :target, ts / :target * :target AS bucket, metric,
+                   SUM(avg * count) / SUM(count), MIN(min), MAX(max),
+                   (SELECT s2.last FROM samples s2
+                     WHERE s2.resolution = :source AND s2.metric = s.metric
+                       AND s2.ts / :target = s.ts / :target
+                     ORDER BY s2.ts DESC LIMIT 1),
+                   SUM(count)
+              FROM samples s
+             WHERE resolution = :source AND ts >= :since AND ts < :until
+             GROUP BY metric, bucket
+            """,
+            {"source": source, "target": target, "since": since, "until": until},
+        )
+
+    def maintain(
+        self, retention: Optional[Mapping[int, float]] = None, now: Optional[float] = None
+    ) -> None:
+        """Roll raw samples up into hours and hours into days, then apply retention."""
+        now = now if now is not None else time.time()
+        retention = {**DEFAULT_RETENTION, **(retention or {})}
+        with self.db:
+            self._rollup(RAW, HOUR, now)
+            self._rollup(HOUR, DAY, now)
+            for resolution, keep in retention.items():
+                self.db.execute(
+                    "DELETE FROM samples WHERE resolution = ? AND ts < ?",
+                    (resolution, int(now - keep)),
+                )
+
+    def metrics(self) -> List[str]:
+        return [row[0] for row in self.db.execute("SELECT DISTINCT metric FROM samples ORDER BY 1")]
+
+    def points(
+        self, resolution: int, since: float, metrics: Sequence[str] = ()
+    ) -> Iterator[Point]:
+        """Yield points at resolution from ``since`` on, ordered by metric then time."""
+        query = "SELECT ts, metric, avg, min, max, last, count FROM samples"
+        query += " WHERE resolution = ? AND ts >= ?"
+        args: List[Any] = [resolution, int(since)]
+        if metrics:
+            query += f" AND metric IN ({', '.join('?' * len(metrics))})"
+            args.extend(metrics)
+        for row in self.db.execute(query + " ORDER BY metric, ts", args):
+            yield Point(*row)
+
+    def best_resolution(self, since: float, now: Optional[float] = None) -> int:
+        """Pick a resolution for a window: raw up to 2 days, hourly up to 60, else daily.
+
+        Falls back to finer resolutions when the preferred one has no data
+        yet (a collector that started recently has nothing rolled up).
+        """
+        window = (now if now is not None else time.time()) - since
+        preferred = RAW if window <= 2 * DAY else HOUR if window <= 60 * DAY else DAY
+        for resolution in (DAY, HOUR, RAW):
+            if resolution > preferred:
+                continue
+            (found,) = self.db.execute(
+                "SELECT COUNT(*) FROM samples WHERE resolution = ? AND ts >= ?",
+                (resolution, int(since)),
+            ).fetchone()
+            if found:
+                return resolution
+        return RAW
+
+
+def summarize_series(points: Sequence[Point]) -> Dict[str, Any]:
+    """First/last value, change, rate per day and extremes of one metric's points."""
+    first, last = points[0], points[-1]
+    span = last.ts - first.ts
+    change = last.last - first.avg
+    return {
+        "first": first.avg,
+        "last": last.last,
+        "change": change,
+        "per_day": change / span * DAY if span else None,
+        "min": min(p.min for p in points),
+        "max": max(p.max for p in points),
+        "samples": sum(p.count for p in points),
+        "from": first.ts,
+        "to": last.ts,
+    }
+
+
+def summarize_store(
+    store: StatsStore, resolution: int, since: float, metrics: Sequence[str] = ()
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ``(metric, summary)`` for each metric with points since ``since``."""
+    for metric, points in groupby(store.points(resolution, since, metrics), lambda p: p.metric):
+        yield metric, summarize_series(list(points))
@@ -0,0 +1,10 @@
+"""Shared fixtures: every test gets its own empty KANBN_HOME."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def kanbn_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("KANBN_HOME", str(tmp_path / "kanbn"))
+    monkeypatch.delenv("KANBN_PROFILE", raising=False)
+    return tmp_path / "kanbn"
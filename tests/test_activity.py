@@ -0,0 +1,64 @@
+"""Tests for the incremental card activity cache."""
+
+from kanbn_cli.utils.activity import ActivityCache, fetch_activity
+
+
+class FakeClient:
+    """Serves a fixed list of pages and records how many were read."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.read = 0
+
+    def iter_pages(self, endpoint, page_size=None, prefetch=True):
+        for page in self.pages:
+            self.read += 1
+            yield page
+
+
+def event(minute, **fields):
+    return {"createdAt": f"2026-01-01T10:{minute:02d}:00Z", "type": "card.updated", **fields}
+
+
+def test_entries_without_id_sharing_time_and_type_are_kept(tmp_path):
+    moves = [
+        event(1, userId="u1", listId="l1"),
+        event(1, userId="u2", listId="l1"),
+        event(1, userId="u1", listId="l2"),
+    ]
+    entries = fetch_activity(FakeClient([moves]), "c1", ActivityCache(tmp_path))
+    assert len(entries) == 3
+
+
+def test_identical_entries_are_cached_once(tmp_path):
+    cache = ActivityCache(tmp_path)
+    fetch_activity(FakeClient([[event(1, userId="u1")]]), "c1", cache)
+    entries = fetch_activity(FakeClient([[event(1, userId="u1")]]), "c1", cache)
+    assert entries == [event(1, userId="u1")]
+
+
+def test_newest_first_stops_at_first_cached_page(tmp_path):
+    cache = ActivityCache(tmp_path)
+    old = [[event(3, id="a3")], [event(2, id="a2")], [event(1, id="a1")]]
+    fetch_activity(FakeClient(old), "c1", cache)
+
+    client = FakeClient([[event(4, id="a4")]] + old)
+    entries = fetch_activity(client, "c1", cache)
+    assert [e["id"] for e in entries] == ["a1", "a2", "a3", "a4"]
+    assert client.read == 2
+
+
+def test_oldest_first_reads_every_page(tmp_path):
+    cache = ActivityCache(tmp_path)
+    old = [[event(1, id="a1")], [event(2, id="a2")]]
+    fetch_activity(FakeClient(old), "c1", cache)
+
+    client = FakeClient(old + [[event(3, id="a3")]])
+    entries = fetch_activity(client, "c1", cache)
+    assert [e["id"] for e in entries] == ["a1", "a2", "a3"]
+    assert client.read == 3
+
+
+def test_without_cache_returns_oldest_first():
+    client = FakeClient([[event(2, id="a2"), event(1, id="a1")]])
+    assert [e["id"] for e in fetch_activity(client, "c1")] == ["a1", "a2"]
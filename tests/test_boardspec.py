@@ -0,0 +1,180 @@
+"""Tests for board spec planning and the dependency-level executor."""
+
+import pytest
+
+from kanbn_cli.utils.boardspec import apply_changes, parse_spec, plan
+from kanbn_cli.utils.errors import APIError, ValidationError
+
+BUG = {"publicId": "lbl-bug", "name": "bug", "colourCode": "#ff0000"}
+DEFECT = {"publicId": "lbl-defect", "name": "defect", "colourCode": "#ff0000"}
+ITEMS = [
+    {"publicId": "i-inbox", "title": "Inbox", "completed": True},
+    {"publicId": "i-plan", "title": "Plan"},
+]
+
+
+def _board(labels=(BUG,)):
+    return {
+        "b1": {
+            "publicId": "b1",
+            "labels": list(labels),
+            "lists": [
+                {
+                    "publicId": "l-backlog",
+                    "name": "Backlog",
+                    "cards": [
+                        {
+                            "publicId": "c-review",
+                            "title": "Weekly review",
+                            "description": None,
+                            "labels": [labels[0]] if labels else [],
+                            "checklists": [
+                                {"publicId": "cl-steps", "name": "Steps", "items": ITEMS}
+                            ],
+                        },
+                        {"publicId": "c-other", "title": "Unmanaged", "description": "x"},
+                    ],
+                }
+            ],
+        }
+    }
+
+
+def _spec(**card):
+    card = {"title": "Weekly review", "description": "", "labels": ["bug"], **card}
+    card.setdefault(
+        "checklists", [{"name": "Steps", "items": ["Inbox", {"title": "Plan", "completed": False}]}]
+    )
+    return {
+        "board": "b1",
+        "labels": [{"name": "bug", "color": "#FF0000", "aliases": ["defect"]}],
+        "lists": [{"name": "Backlog", "cards": [card]}],
+    }
+
+
+def _plan(spec, state=None, prune=False):
+    changes, refs = plan(parse_spec(spec), state or _board(), prune)
+    return [change.describe() for change in changes], refs
+
+
+def test_unchanged_board_plans_nothing():
+    # null vs "" descriptions, color case and a ticked plain-string item are all "unchanged"
+    described, refs = _plan(_spec())
+    assert described == []
+    assert refs[("card", "b1", "Backlog", "Weekly review")] == "c-review"
+    assert refs[("checklist", "b1", "Backlog", "Weekly review", "Steps")] == "cl-steps"
+
+
+def test_unmanaged_fields_are_left_alone():
+    card = {"title": "Weekly review", "checklists": []}
+    spec = {"board": "b1", "lists": [{"name": "Backlog", "cards": [card]}]}
+    assert _plan(spec)[0] == []
+
+
+def test_changes_are_planned_in_order():
+    spec = _spec(
+        description="Every Friday",
+        labels=["ops"],
+        checklists=[
+            {"name": "Steps", "items": ["Inbox", {"title": "Plan", "completed": True}, "Ship"]},
+            {"name": "Follow-up", "items": ["Mail"]},
+        ],
+    )
+    spec["labels"].append({"name": "ops", "color": "#00ff00"})
+    spec["lists"].append({"name": "Later", "cards": [{"title": "Someday"}]})
+    described, _ = _plan(spec)
+    assert described == [
+        "create label 'ops' (#00ff00)",
+        "update card 'Backlog / Weekly review' (description)",
+        "update card 'Backlog / Weekly review' (add label ops)",
+        "update card 'Backlog / Weekly review' (remove label bug)",
+        "update item 'Backlog / Weekly review / Steps / Plan' (complete)",
+        "create item 'Backlog / Weekly review / Steps / Ship'",
+        "create checklist 'Backlog / Weekly review / Follow-up'",
+        "create item 'Backlog / Weekly review / Follow-up / Mail'",
+        "create list 'Later'",
+        "create card 'Later / Someday'",
+    ]
+
+
+def test_renamed_label_stays_on_its_cards():
+    described, refs = _plan(_spec(), _board(labels=(DEFECT,)))
+    assert described == ["update label 'bug' (rename 'defect' -> 'bug')"]
+    assert refs[("label", "b1", "bug")] == "lbl-defect"
+
+
+def test_prune_deletes_labels_outside_the_spec():
+    described, _ = _plan(_spec(), _board(labels=(BUG, DEFECT)), prune=True)
+    assert described == ["delete label 'defect'"]
+
+
+def test_unknown_card_label_is_rejected():
+    with pytest.raises(ValidationError):
+        _plan(_spec(labels=["nope"]))
+
+
+class FakeClient:
+    """Records writes and hands out IDs; posts to ``fail`` endpoints raise APIError."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = []
+
+    def post(self, endpoint, json=None, headers=None):
+        self.calls.append(("POST", endpoint, json))
+        if endpoint in self.fail:
+            raise APIError("Bad request", status_code=400)
+        return {"publicId": f"new-{len(self.calls)}"}
+
+    def put(self, endpoint, json=None):
+        self.calls.append(("PUT", endpoint, json))
+        return {}
+
+    def delete(self, endpoint):
+        self.calls.append(("DELETE", endpoint, None))
+        return {}
+
+
+def _new_list_spec():
+    cards = [
+        {"title": "One", "checklists": [{"name": "Steps", "items": ["a"]}]},
+        {"title": "Two"},
+    ]
+    return {"board": "b1", "lists": [{"name": "Later", "cards": cards}]}
+
+
+def test_apply_threads_created_ids_through_levels():
+    changes, refs = plan(parse_spec(_new_list_spec()), _board())
+    client = FakeClient()
+    counts = apply_changes(client, changes, refs, concurrency=1)
+    assert counts == {"done": 5, "failed": 0, "skipped": 0}
+    assert [(method, endpoint) for method, endpoint, _ in client.calls] == [
+        ("POST", "lists"),
+        ("POST", "cards"),
+        ("POST", "cards"),
+        ("POST", "cards/new-2/checklists"),
+        ("POST", "checklists/new-4/items"),
+    ]
+    cards = [body for _, endpoint, body in client.calls if endpoint == "cards"]
+    assert [card["title"] for card in cards] == ["One", "Two"]
+    assert {card["listPublicId"] for card in cards} == {"new-1"}
+
+
+def test_failure_skips_dependents_and_rest_of_chain():
+    changes, refs = plan(parse_spec(_new_list_spec()), _board())
+    client = FakeClient(fail={"lists"})
+    failed = []
+    counts = apply_changes(
+        client, changes, refs, on_result=lambda change, error: failed.append(change.describe())
+    )
+    assert counts == {"done": 0, "failed": 1, "skipped": 4}
+    assert failed == ["create list 'Later'"]
+    assert client.calls == [("POST", "lists", {"name": "Later", "board_id": "b1"})]
+
+
+def test_failed_card_skips_the_rest_of_its_list_chain():
+    changes, refs = plan(parse_spec(_new_list_spec()), _board())
+    client = FakeClient(fail={"cards"})
+    counts = apply_changes(client, changes, refs)
+    # One fails, Two is skipped behind it, then One's checklist and item
+    assert counts == {"done": 1, "failed": 1, "skipped": 3}
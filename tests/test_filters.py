@@ -0,0 +1,167 @@
+"""Tests for card filters and the date parsing behind them."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from kanbn_cli.api.records import Card
+from kanbn_cli.utils.dates import parse_duration, parse_when
+from kanbn_cli.utils.errors import ValidationError
+from kanbn_cli.utils.filters import CardFilter, compile_filter, filter_cards
+
+DAY = 86400
+# 2026-10-19T12:00:00Z
+NOW = datetime(2026, 10, 19, 12, tzinfo=timezone.utc).timestamp()
+
+
+def _ts(text):
+    return datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp()
+
+
+def _card(public_id, list_name="Backlog", labels=(), members=(), due=None, **data):
+    payload = {
+        "publicId": public_id,
+        "title": data.pop("title", f"Card {public_id}"),
+        "labels": [{"publicId": f"lbl-{name}", "name": name} for name in labels],
+        "members": [{"user": {"name": name}} for name in members],
+        "dueDate": due,
+        **data,
+    }
+    return Card.from_api(payload, f"list-{list_name}", list_name)
+
+
+CARDS = [
+    _card("a", "Backlog", labels=("bug",), members=("alice",), due="2026-11-01T10:00:00Z"),
+    _card("b", "Doing", labels=("bug", "urgent"), members=("bob",), due="2026-10-20T00:00:00Z"),
+    _card("c", "Doing", labels=("Urgent",), due="2026-10-01T09:00:00Z", title="Invoice run"),
+    _card("d", "Done", description="Billing follow-up"),
+    _card(
+        "e",
+        "Done",
+        members=("Alice", "carol"),
+        checklists=[{"name": "Steps", "items": [{"title": "x", "completed": True}]}],
+    ),
+    _card(
+        "f",
+        "Backlog",
+        checklists=[
+            {"name": "Steps", "items": [{"title": "x"}, {"title": "y", "completed": True}]}
+        ],
+    ),
+]
+
+
+def _select(**options):
+    spec = CardFilter.from_options(**options)
+    return [card.public_id for card in filter_cards(CARDS, compile_filter(spec))]
+
+
+def test_empty_filter_matches_everything():
+    spec = CardFilter.from_options()
+    assert spec.empty
+    assert _select() == ["a", "b", "c", "d", "e", "f"]
+
+
+def test_lists_match_any_case_insensitively():
+    assert _select(lists=["doing", "DONE"]) == ["b", "c", "d", "e"]
+
+
+def test_labels_must_all_match():
+    assert _select(labels=["bug"]) == ["a", "b"]
+    assert _select(labels=["bug", "urgent"]) == ["b"]
+    assert _select(labels=["urgent"]) == ["b", "c"]
+
+
+def test_assignees_match_any():
+    assert _select(assignees=["alice"]) == ["a", "e"]
+    assert _select(assignees=["bob", "carol"]) == ["b", "e"]
+
+
+def test_match_searches_title_and_description():
+    assert _select(match="invoice|billing") == ["c", "d"]
+    assert _select(match="^card [ab]$") == ["a", "b"]
+
+
+def test_checklist_states():
+    assert _select(checklist="done") == ["e"]
+    assert _select(checklist="open") == ["f"]
+    assert _select(checklist="none") == ["a", "b", "c", "d"]
+
+
+def test_due_bounds_skip_cards_without_due_date():
+    assert _select(due_after="2026-10-15") == ["a", "b"]
+    assert _select(due_before="2026-10-15") == ["c"]
+
+
+def test_date_only_upper_bound_includes_the_whole_day():
+    assert _select(due_before="2026-11-01") == ["a", "b", "c"]
+    assert _select(due_after="2026-11-01", due_before="2026-11-01") == ["a"]
+    assert _select(due_before="2026-11-01T09:00:00Z") == ["b", "c"]
+
+
+def test_criteria_combine_with_and():
+    assert _select(lists=["Doing"], labels=["urgent"], due_after="2026-10-15") == ["b"]
+    assert _select(labels=["bug"], assignees=["carol"]) == []
+
+
+def test_filter_cards_is_lazy():
+    seen = []
+
+    def source():
+        for card in CARDS:
+            seen.append(card.public_id)
+            yield card
+
+    matches = filter_cards(source(), compile_filter(CardFilter.from_options(labels=["bug"])))
+    assert next(matches).public_id == "a"
+    assert seen == ["a"]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"checklist": "maybe"},
+        {"match": "("},
+        {"due_after": "someday"},
+        {"due_before": "+3x"},
+    ],
+)
+def test_invalid_options_raise_validation_error(options):
+    with pytest.raises(ValidationError):
+        CardFilter.from_options(**options)
+
+
+def test_parse_when_keywords_and_offsets():
+    midnight = _ts("2026-10-19T00:00:00Z")
+    assert parse_when("now", NOW) == NOW
+    assert parse_when("today", NOW) == midnight
+    assert parse_when("today", NOW, end_of_day=True) == pytest.approx(midnight + DAY)
+    assert parse_when("today", NOW, end_of_day=True) < midnight + DAY
+    assert parse_when("+3d", NOW) == NOW + 3 * DAY
+    assert parse_when("-2w", NOW) == NOW - 14 * DAY
+    # Offsets and full timestamps are exact points in time either way
+    assert parse_when("+3d", NOW, end_of_day=True) == NOW + 3 * DAY
+
+
+def test_parse_when_dates_and_timestamps():
+    start = _ts("2026-11-01T00:00:00Z")
+    assert parse_when("2026-11-01", NOW) == start
+    assert start + DAY - 1 < parse_when("2026-11-01", NOW, end_of_day=True) < start + DAY
+    stamp = "2026-11-01T09:30:00Z"
+    assert parse_when(stamp, NOW, end_of_day=True) == _ts(stamp)
+    with pytest.raises(ValueError):
+        parse_when("next tuesday", NOW)
+
+
+@pytest.mark.parametrize(
+    "text, seconds",
+    [("90s", 90), ("15m", 900), ("12h", 43200), ("7d", 7 * DAY), ("2w", 14 * DAY), ("30", 30)],
+)
+def test_parse_duration(text, seconds):
+    assert parse_duration(text) == seconds
+
+
+@pytest.mark.parametrize("text", ["", "d", "3x", "-5m"])
+def test_parse_duration_rejects_bad_input(text):
+    with pytest.raises(ValueError):
+        parse_duration(text)
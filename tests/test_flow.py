@@ -0,0 +1,59 @@
+"""Tests for cycle time start detection in the flow metrics."""
+
+from datetime import datetime, timezone
+
+from kanbn_cli.utils.flow import BoardColumns, compute_flow_metrics
+
+DAY = 86400.0
+NOW = 1767225600.0  # 2026-01-01T00:00:00Z
+
+
+def board(*cards_by_list):
+    names = ["Ideas", "Backlog", "Doing", "Done"]
+    return {
+        "lists": [
+            {"publicId": f"l{i}", "name": name, "index": i, "cards": cards}
+            for i, (name, cards) in enumerate(zip(names, cards_by_list))
+        ]
+    }
+
+
+def at(day):
+    return datetime.fromtimestamp(NOW + day * DAY, timezone.utc).isoformat()
+
+
+def moved(day, list_id):
+    return {"type": "card.updated.list", "createdAt": at(day), "toList": {"publicId": list_id}}
+
+
+def created(day):
+    return {"type": "card.created", "createdAt": at(day)}
+
+
+def cycle_days(activity, **kwargs):
+    columns = BoardColumns(board([], [], [], [{"publicId": "c1"}]), {"c1": activity})
+    return compute_flow_metrics(columns, now=NOW + 30 * DAY, **kwargs)["cycleTime"]["avg"]
+
+
+HISTORY = [created(0), moved(2, "l1"), moved(5, "l2"), moved(9, "l3")]
+
+
+def test_default_backlog_is_first_list():
+    # Moving from Ideas to Backlog on day 2 already counts as started
+    assert cycle_days(HISTORY) == 7
+
+
+def test_backlog_lists_option_delays_the_start():
+    assert cycle_days(HISTORY, backlog_lists=["ideas", "Backlog"]) == 4
+
+
+def test_moves_to_unknown_lists_do_not_start_the_clock():
+    history = [created(0), moved(1, "deleted-list"), moved(5, "l2"), moved(9, "l3")]
+    assert cycle_days(history) == 4
+
+
+def test_metrics_report_backlog_lists():
+    columns = BoardColumns(board([], [], [], []))
+    metrics = compute_flow_metrics(columns, now=NOW, backlog_lists=["Backlog"])
+    assert metrics["backlogLists"] == ["Backlog"]
+    assert compute_flow_metrics(columns, now=NOW)["backlogLists"] == ["Ideas"]
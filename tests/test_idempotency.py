@@ -0,0 +1,113 @@
+"""Tests for idempotent creates, including ones that go to the offline queue."""
+
+import httpx
+import pytest
+
+from kanbn_cli.api.idempotency import KEY_HEADER, IdempotencyStore, Lookup, create_once
+from kanbn_cli.api.offline import OfflineQueue
+from kanbn_cli.utils.errors import APIError
+
+PAYLOAD = {"title": "Weekly review", "listPublicId": "l1"}
+LOOKUP = Lookup("b1", "cards", "Weekly review", "l1")
+
+
+class FakeClient:
+    """Answers creates from a script of results (entities, exceptions or "queue")."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.posts = []
+        self.gets = 0
+        self.offline_queue = OfflineQueue()
+
+    def post(self, endpoint, json=None, headers=None):
+        self.posts.append(headers[KEY_HEADER])
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        if result == "queue":
+            return self.offline_queue.enqueue("POST", endpoint, None, json, headers)
+        return result
+
+    def get(self, endpoint):
+        self.gets += 1
+        card = {"publicId": "unrelated", "title": "Weekly review", "createdAt": "2000-01-01"}
+        return {"lists": [{"publicId": "l1", "cards": [card]}]}
+
+
+def test_done_key_returns_recorded_entity():
+    client = FakeClient({"publicId": "c1"})
+    assert create_once(client, "cards", PAYLOAD, "k", LOOKUP) == {"publicId": "c1"}
+    assert create_once(client, "cards", PAYLOAD, "k", LOOKUP) == {"publicId": "c1"}
+    assert len(client.posts) == 1
+
+
+def test_queued_create_is_not_recorded_as_done():
+    client = FakeClient("queue")
+    placeholder = create_once(client, "cards", PAYLOAD, "k", LOOKUP)
+    assert placeholder["publicId"].startswith("@local:")
+
+    record = IdempotencyStore().begin("k")
+    assert record["status"] == "queued"
+    assert record["localId"] == placeholder["publicId"]
+
+    # Before replay a rerun gets the same placeholder and sends nothing
+    again = create_once(client, "cards", PAYLOAD, "k", LOOKUP)
+    assert again == {"publicId": placeholder["publicId"], "queued": True}
+    assert len(client.posts) == 1
+
+
+def test_replay_records_the_real_entity_for_the_key():
+    client = FakeClient("queue")
+    create_once(client, "cards", PAYLOAD, "k", LOOKUP)
+
+    sent = []
+
+    def send(method, endpoint, params, json, headers):
+        sent.append(headers[KEY_HEADER])
+        return {"publicId": "c-real", "title": json["title"]}
+
+    assert client.offline_queue.replay(send)["done"] == 1
+    assert sent == ["k"]
+    assert create_once(client, "cards", PAYLOAD, "k", LOOKUP) == {
+        "publicId": "c-real",
+        "title": "Weekly review",
+    }
+    assert len(client.posts) == 1
+
+
+def test_failed_replay_lets_the_key_start_over():
+    client = FakeClient("queue", {"publicId": "c2"})
+    create_once(client, "cards", PAYLOAD, "k", LOOKUP)
+
+    def send(method, endpoint, params, json, headers):
+        raise APIError("Bad request", status_code=400)
+
+    assert client.offline_queue.replay(send)["failed"] == 1
+    assert create_once(client, "cards", PAYLOAD, "k", LOOKUP) == {"publicId": "c2"}
+    assert len(client.posts) == 2
+
+
+def test_rejected_create_forgets_the_key():
+    client = FakeClient(APIError("Bad request", status_code=400), {"publicId": "c3"})
+    with pytest.raises(APIError):
+        create_once(client, "cards", PAYLOAD, "k", LOOKUP)
+    assert "k" not in IdempotencyStore()._update(lambda records, now: dict(records))
+
+    # A fresh start: no resume lookup that could adopt the unrelated card
+    assert create_once(client, "cards", PAYLOAD, "k", LOOKUP) == {"publicId": "c3"}
+    assert client.gets == 0
+
+
+def test_ambiguous_failure_keeps_the_key_pending():
+    client = FakeClient(*[httpx.ReadTimeout("slow")] * 3)
+    with pytest.raises(httpx.ReadTimeout):
+        create_once(client, "cards", PAYLOAD, "k", LOOKUP, retries=2)
+    assert IdempotencyStore().begin("k")["status"] == "pending"
+    assert len(set(client.posts)) == 1  # every retry reused the key
+
+
+def test_fresh_key_does_not_adopt_older_entity():
+    client = FakeClient(httpx.ReadTimeout("slow"), {"publicId": "c4"})
+    assert create_once(client, "cards", PAYLOAD, "k", LOOKUP) == {"publicId": "c4"}
+    assert client.gets == 1
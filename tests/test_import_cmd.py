@@ -0,0 +1,38 @@
+"""Tests for the failed-import record used by trello-batch --retry-failed."""
+
+import pytest
+
+from kanbn_cli.commands.import_cmd import _load_failed, _save_failed
+from kanbn_cli.utils.errors import ValidationError
+
+
+def test_save_then_load_round_trips(tmp_path):
+    path = tmp_path / "failed.json"
+    _save_failed(path, "ws1", ["b1", "b2"])
+    assert _load_failed(path) == {"workspace": "ws1", "boards": ["b1", "b2"]}
+    assert [p.name for p in tmp_path.iterdir()] == ["failed.json"]
+
+
+def test_save_replaces_existing_record(tmp_path):
+    path = tmp_path / "failed.json"
+    _save_failed(path, "ws1", ["b1"])
+    _save_failed(path, "ws2", ["b3"])
+    assert _load_failed(path) == {"workspace": "ws2", "boards": ["b3"]}
+
+
+def test_missing_keys_default(tmp_path):
+    path = tmp_path / "failed.json"
+    path.write_text("{}")
+    assert _load_failed(path) == {"workspace": None, "boards": []}
+
+
+@pytest.mark.parametrize(
+    "content",
+    ['{"workspace": "ws1", "boa', "", '["b1"]', '{"boards": "b1"}'],
+    ids=["truncated", "empty", "not-an-object", "boards-not-a-list"],
+)
+def test_corrupt_record_is_reported(tmp_path, content):
+    path = tmp_path / "failed.json"
+    path.write_text(content)
+    with pytest.raises(ValidationError, match="failed.json is unreadable"):
+        _load_failed(path)
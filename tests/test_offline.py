@@ -0,0 +1,166 @@
+"""Tests for the offline write queue: journal, placeholders and replay."""
+
+import httpx
+import pytest
+
+from kanbn_cli.api.client import KanbnClient
+from kanbn_cli.api.offline import LOCAL_PREFIX, UNSENT_ERRORS, OfflineQueue
+from kanbn_cli.config import KanbnConfig
+from kanbn_cli.utils.errors import APIError, ValidationError
+
+
+class Recorder:
+    """``send`` callable for replay that records calls and hands out IDs."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = []
+
+    def __call__(self, method, endpoint, params, json, headers):
+        self.calls.append((method, endpoint, json))
+        if (method, endpoint) in self.fail:
+            raise APIError("Bad request", status_code=400)
+        return {"publicId": f"real-{len(self.calls)}"} if method == "POST" else {}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return OfflineQueue(tmp_path / "queue.jsonl")
+
+
+def _client(handler):
+    config = KanbnConfig(api_url="http://kanbn.test/api", api_token="t", offline_queue=True)
+    return KanbnClient(config, http=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def test_enqueue_journals_and_returns_placeholder(queue, tmp_path):
+    placeholder = queue.enqueue("POST", "cards", None, {"title": "A"})
+    assert placeholder["publicId"].startswith(LOCAL_PREFIX)
+    assert placeholder["queued"] is True
+    assert placeholder["title"] == "A"
+
+    queue.enqueue("POST", f"cards/{placeholder['publicId']}/comments", None, {"comment": "hi"})
+    reopened = OfflineQueue(tmp_path / "queue.jsonl")
+    assert [entry["endpoint"] for entry in reopened.pending()] == [
+        "cards",
+        f"cards/{placeholder['publicId']}/comments",
+    ]
+    assert reopened.unresolved({"cardId": placeholder["publicId"]}) == {placeholder["publicId"]}
+
+
+def test_replay_runs_dependencies_first_and_rewrites_placeholders(queue):
+    card = queue.enqueue("POST", "cards", None, {"title": "A", "listPublicId": "l1"})["publicId"]
+    queue.enqueue("POST", f"cards/{card}/comments", None, {"comment": "hi"})
+    queue.enqueue("POST", "cards", None, {"title": "B", "listPublicId": "l2"})
+    queue.enqueue("PUT", "labels/x", None, {"cardPublicIds": [card]})
+
+    send = Recorder()
+    counts = queue.replay(send, concurrency=1)
+    assert counts == {"done": 4, "failed": 0, "skipped": 0}
+    # Both creates run first; everything referencing the first card waits for it
+    assert send.calls[:2] == [
+        ("POST", "cards", {"title": "A", "listPublicId": "l1"}),
+        ("POST", "cards", {"title": "B", "listPublicId": "l2"}),
+    ]
+    assert sorted(send.calls[2:], key=lambda call: call[1]) == [
+        ("POST", "cards/real-1/comments", {"comment": "hi"}),
+        ("PUT", "labels/x", {"cardPublicIds": ["real-1"]}),
+    ]
+    assert queue.mapping()[card] == "real-1"
+    assert queue.pending() == []
+
+
+def test_writes_to_one_resource_keep_journal_order(queue):
+    for title in ("one", "two", "three"):
+        queue.enqueue("PUT", "cards/c1", None, {"title": title})
+    send = Recorder()
+    queue.replay(send, concurrency=8)
+    assert [call[2]["title"] for call in send.calls] == ["one", "two", "three"]
+
+
+def test_failure_blocks_dependents_until_retried(queue):
+    card = queue.enqueue("POST", "cards", None, {"title": "A"})["publicId"]
+    queue.enqueue("POST", f"cards/{card}/comments", None, {"comment": "hi"})
+
+    counts = queue.replay(Recorder(fail={("POST", "cards")}))
+    assert counts == {"done": 0, "failed": 1, "skipped": 1}
+    assert [entry["endpoint"] for entry in queue.pending()] == [f"cards/{card}/comments"]
+
+    assert queue.retry_failed() == 1
+    send = Recorder()
+    assert queue.replay(send) == {"done": 2, "failed": 0, "skipped": 0}
+    assert send.calls[1][1] == "cards/real-1/comments"
+
+
+def test_replay_stops_while_still_offline(queue):
+    queue.enqueue("POST", "cards", None, {"title": "A"})
+    queue.enqueue("PUT", "cards/c1", None, {"title": "B"})
+    queue.enqueue("PUT", "cards/c1", None, {"title": "C"})
+
+    def offline(method, endpoint, params, json, headers):
+        raise httpx.ConnectError("down")
+
+    counts = queue.replay(offline, is_offline=lambda e: isinstance(e, UNSENT_ERRORS))
+    assert counts["done"] == 0 and counts["failed"] == 0
+    assert len(queue.pending()) == 3
+
+
+def test_compact_keeps_placeholder_mapping(queue):
+    card = queue.enqueue("POST", "cards", None, {"title": "A"})["publicId"]
+    queue.enqueue("PUT", "cards/c1", None, {"title": "B"})
+    queue.replay(Recorder())
+    lines = queue.path.read_text().splitlines()
+    assert len(lines) == 2  # the create (without its body) and its result
+    assert queue.mapping() == {card: "real-1"}
+    assert queue.resolve(f"cards/{card}") == "cards/real-1"
+
+
+def test_client_queues_unsent_writes_and_everything_behind_them(tmp_path):
+    sent = []
+
+    def handler(request):
+        sent.append((request.method, request.url.path))
+        raise httpx.ConnectError("down", request=request)
+
+    client = _client(handler)
+    client._offline_queue = OfflineQueue(tmp_path / "queue.jsonl")
+    card = client.post("cards", json={"title": "A"})
+    assert card["queued"] and card["publicId"].startswith(LOCAL_PREFIX)
+    assert len(sent) == 1
+
+    # Depends on a queued create: journaled without trying the network
+    comment = client.post(f"cards/{card['publicId']}/comments", json={"comment": "hi"})
+    assert comment["queued"]
+    assert len(sent) == 1
+
+    # Reads cannot be answered for a placeholder
+    with pytest.raises(ValidationError):
+        client.get(f"cards/{card['publicId']}")
+
+
+def test_client_rewrites_replayed_placeholders(tmp_path):
+    queue_path = tmp_path / "queue.jsonl"
+    card = OfflineQueue(queue_path).enqueue("POST", "cards", None, {"title": "A"})["publicId"]
+    OfflineQueue(queue_path).replay(Recorder())
+
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"publicId": "real-1"})
+
+    client = _client(handler)
+    client._offline_queue = OfflineQueue(queue_path)
+    client.put(f"cards/{card}", json={"title": "B"})
+    assert seen == ["/api/cards/real-1"]
+
+
+def test_client_raises_errors_after_the_request_was_sent(tmp_path):
+    def handler(request):
+        raise httpx.ReadTimeout("slow", request=request)
+
+    client = _client(handler)
+    client._offline_queue = OfflineQueue(tmp_path / "queue.jsonl")
+    with pytest.raises(httpx.ReadTimeout):
+        client.post("cards", json={"title": "A"})
+    assert client.offline_queue.pending() == []
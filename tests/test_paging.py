@@ -0,0 +1,85 @@
+"""Tests for how the client walks paged collection endpoints."""
+
+import asyncio
+
+import httpx
+
+from kanbn_cli.api.client import AsyncKanbnClient, KanbnClient
+from kanbn_cli.config import KanbnConfig
+
+CONFIG = KanbnConfig(api_url="http://kanbn.test/api", api_token="t")
+
+
+class Server:
+    """Answers GETs from a list of bodies and records the query of each request."""
+
+    def __init__(self, *bodies):
+        self.bodies = list(bodies)
+        self.queries = []
+
+    def __call__(self, request):
+        self.queries.append(dict(request.url.params))
+        return httpx.Response(200, json=self.bodies.pop(0))
+
+
+def pages(server, **kwargs):
+    http = httpx.Client(transport=httpx.MockTransport(server))
+    with KanbnClient(CONFIG, http=http) as client:
+        return list(client.iter_pages("things", prefetch=False, **kwargs))
+
+
+def test_limit_is_only_sent_when_asked():
+    server = Server([{"id": 1}, {"id": 2}])
+    assert pages(server, params={"query": "x"}) == [[{"id": 1}, {"id": 2}]]
+    assert server.queries == [{"query": "x"}]
+
+
+def test_page_size_pages_by_offset_until_a_short_page():
+    server = Server([{"id": 1}, {"id": 2}], [{"id": 3}])
+    assert len(pages(server, page_size=2)) == 2
+    assert server.queries == [{"limit": "2"}, {"limit": "2", "offset": "2"}]
+
+
+def test_top_level_next_is_data_not_a_cursor():
+    server = Server({"items": [{"id": 1}], "next": "chapter-2"})
+    assert len(pages(server)) == 1
+    assert server.queries == [{}]
+
+
+def test_cursor_from_pagination_envelope():
+    server = Server(
+        {"items": [{"id": 1}], "pagination": {"next": "c2", "hasMore": True}},
+        {"items": [{"id": 2}], "pagination": {"next": None, "hasMore": False}},
+    )
+    assert len(pages(server)) == 2
+    assert server.queries == [{}, {"cursor": "c2"}]
+
+
+def test_cursor_from_meta_envelope():
+    server = Server(
+        {"data": [{"id": 1}], "meta": {"nextCursor": "c2"}},
+        {"data": [{"id": 2}], "meta": {}},
+    )
+    assert len(pages(server)) == 2
+    assert server.queries[1] == {"cursor": "c2"}
+
+
+def test_cursor_from_explicit_key():
+    server = Server({"items": [{"id": 1}], "after": "c2"}, {"items": [{"id": 2}]})
+    assert len(pages(server, cursor_key="after")) == 2
+    assert server.queries[1] == {"cursor": "c2"}
+
+
+def test_async_client_sends_limit_only_when_asked():
+    server = Server([{"id": 1}])
+
+    async def run():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(server))
+        client = AsyncKanbnClient(CONFIG, http=http)
+        try:
+            return [page async for page in client.iter_pages("things", prefetch=False)]
+        finally:
+            await http.aclose()
+
+    assert asyncio.run(run()) == [[{"id": 1}]]
+    assert server.queries == [{}]
@@ -0,0 +1,57 @@
+"""Quiet runs must not import rich at all."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Runs the CLI in-process, then reports which rich modules got imported
+SCRIPT = """
+import json, runpy, sys
+sys.argv = ["kanbn"] + json.loads(sys.argv[1])
+try:
+    runpy.run_module("kanbn_cli.main", run_name="__main__")
+except SystemExit:
+    pass
+loaded = [name for name, module in sys.modules.items()
+          if name.split(".")[0] == "rich" and module is not None]
+sys.stderr.write("RICH=" + json.dumps(loaded))
+"""
+
+
+def _run(args, kanbn_home, **env):
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, json.dumps(args)],
+        capture_output=True,
+        text=True,
+        env={
+            "PATH": "",
+            "KANBN_HOME": str(kanbn_home),
+            "HOME": str(kanbn_home),
+            "KANBN_API_URL": "http://127.0.0.1:1/api",
+            "KANBN_API_TOKEN": "token",
+            **env,
+        },
+    )
+    return result.stdout, json.loads(result.stderr.rsplit("RICH=", 1)[1])
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["-q", "card", "create", "LIST1", "Title"],
+        ["card", "create", "LIST1", "Title", "-q"],
+        ["--quiet", "queue", "list"],
+    ],
+)
+def test_quiet_run_does_not_import_rich(args, kanbn_home):
+    stdout, loaded = _run(args, kanbn_home, KANBN_OFFLINE_QUEUE="1")
+    assert loaded == []
+    if "create" in args:
+        assert stdout.startswith("@local:")
+
+
+def test_normal_run_still_uses_rich(kanbn_home):
+    _, loaded = _run(["queue", "list"], kanbn_home)
+    assert "rich.console" in loaded
@@ -0,0 +1,110 @@
+"""Tests for --sort orderings and bounded top-K selection."""
+
+import random
+
+import pytest
+
+from kanbn_cli.api.records import Card
+from kanbn_cli.utils.errors import ValidationError
+from kanbn_cli.utils.sorting import CardOrder, _Descending, order_items
+
+
+def _card(public_id, list_id="l1", index=0, due=None, updated=None, title=None):
+    return Card(
+        public_id,
+        title or f"Card {public_id}",
+        list_id=list_id,
+        index=index,
+        due_date=due,
+        updated_at=updated,
+    )
+
+
+def _ids(cards):
+    return [card.public_id for card in cards]
+
+
+CARDS = [
+    _card("a", due="2026-11-01T00:00:00Z", updated="2026-10-01T00:00:00Z", title="beta"),
+    _card("b", updated="2026-10-05T00:00:00Z", title="Alpha"),
+    _card("c", due="2026-10-20T00:00:00Z", title="gamma"),
+    _card("d", due="2026-11-01T00:00:00Z", updated="2026-10-09T00:00:00Z", title="alpha"),
+    _card("e", title="Delta"),
+]
+
+
+def test_descending_inverts_comparison():
+    assert _Descending(2) < _Descending(1)
+    assert not _Descending(1) < _Descending(2)
+    assert _Descending(3) == _Descending(3)
+    assert sorted([1, 3, 2], key=_Descending) == [3, 2, 1]
+
+
+def test_parse_rejects_unknown_keys():
+    with pytest.raises(ValidationError):
+        CardOrder.parse("due,priority")
+
+
+def test_missing_values_sort_last_in_both_directions():
+    ascending = CardOrder.parse("due")
+    descending = CardOrder.parse("-due")
+    assert _ids(sorted(CARDS, key=ascending.key)) == ["c", "a", "d", "b", "e"]
+    assert _ids(sorted(CARDS, key=descending.key)) == ["a", "d", "c", "b", "e"]
+
+
+def test_multi_key_ordering_breaks_ties_with_later_keys():
+    order = CardOrder.parse("due,-updated")
+    assert _ids(sorted(CARDS, key=order.key)) == ["c", "d", "a", "b", "e"]
+    order = CardOrder.parse("-updated, title")
+    assert _ids(sorted(CARDS, key=order.key)) == ["d", "b", "a", "e", "c"]
+
+
+def test_title_sort_ignores_case():
+    order = CardOrder.parse("title")
+    assert [card.title for card in sorted(CARDS, key=order.key)] == [
+        "Alpha", "alpha", "beta", "Delta", "gamma"
+    ]
+
+
+def test_position_uses_list_order_then_card_index():
+    cards = [
+        _card("x", "done", 0),
+        _card("y", "backlog", 1),
+        _card("z", "backlog", 0),
+        _card("w", "doing", 0),
+    ]
+    order = CardOrder.parse("position")
+    for list_id, index in (("backlog", 0), ("doing", 1), ("done", 2)):
+        order.note_list(list_id, index)
+    assert _ids(sorted(cards, key=order.key)) == ["z", "y", "w", "x"]
+    descending = CardOrder.parse("-position")
+    descending.list_positions = order.list_positions
+    assert _ids(order_items(cards, descending)) == ["x", "w", "y", "z"]
+
+
+def test_order_items_without_order_keeps_input_order_and_is_lazy():
+    consumed = []
+
+    def source():
+        for card in CARDS:
+            consumed.append(card.public_id)
+            yield card
+
+    assert _ids(order_items(source(), limit=2)) == ["a", "b"]
+    assert consumed == ["a", "b"]
+    assert _ids(order_items(CARDS)) == _ids(CARDS)
+
+
+@pytest.mark.parametrize("spec", ["due", "-due", "due,-updated", "-updated,title", "title"])
+@pytest.mark.parametrize("limit", [0, 1, 3, 5, 50])
+def test_top_k_matches_sorted_prefix(spec, limit):
+    rng = random.Random(f"{spec}-{limit}")
+    days = [None] + [f"2026-10-{day:02d}T00:00:00Z" for day in range(1, 8)]
+    cards = [
+        _card(str(i), due=rng.choice(days), updated=rng.choice(days), title=rng.choice("abcAB"))
+        for i in range(200)
+    ]
+    order = CardOrder.parse(spec)
+    expected = sorted(cards, key=order.key)[:limit]
+    assert _ids(order_items(iter(cards), order, limit)) == _ids(expected)
+    assert _ids(order_items(cards, order)) == _ids(sorted(cards, key=order.key))
@@ -0,0 +1,66 @@
+"""Tests for the incremental JSON parser behind streamed board responses."""
+
+import json
+
+import pytest
+
+from kanbn_cli.api.streaming import BoardStream, iter_items
+from kanbn_cli.utils.errors import APIError
+
+BOARD = {
+    "publicId": "b1",
+    "name": "Board é \"one\"",
+    "pos": 1.5,
+    "lists": [
+        {
+            "publicId": "l1",
+            "name": "Backlog",
+            "index": 2e3,
+            "cards": [
+                {"publicId": "c1", "title": "First", "index": 0, "score": -12.25e-2},
+                {"publicId": "c2", "title": "Second", "index": 1, "done": True, "due": None},
+            ],
+        },
+        {"publicId": "l2", "name": "Empty", "index": 10, "cards": []},
+        {
+            "publicId": "l3",
+            "name": "Done",
+            "index": -7,
+            "cards": [{"publicId": "c3", "title": "x, y: [z]", "index": 123456789}],
+        },
+    ],
+    "labels": [{"publicId": "lbl1", "name": "bug"}],
+}
+DOC = json.dumps(BOARD)
+EXPECTED = [
+    (lst["publicId"], card) for lst in BOARD["lists"] for card in lst["cards"]
+]
+
+
+def _parse(chunks):
+    stream = BoardStream(chunks)
+    cards = [(lst["publicId"], card) for lst, card in stream]
+    return cards, stream.board
+
+
+@pytest.mark.parametrize("offset", range(1, len(DOC)))
+def test_board_stream_split_at_every_offset(offset):
+    cards, board = _parse([DOC[:offset], DOC[offset:]])
+    assert cards == EXPECTED
+    assert board["name"] == BOARD["name"]
+    assert board["pos"] == 1.5
+
+
+def test_board_stream_one_character_chunks():
+    cards, board = _parse(list(DOC))
+    assert cards == EXPECTED
+    assert board["publicId"] == "b1"
+
+
+def test_number_at_end_of_document():
+    assert list(iter_items(["[1, 2.", "5e", "1]"])) == [1, 25.0]
+
+
+def test_truncated_stream_raises():
+    with pytest.raises(APIError):
+        list(BoardStream([DOC[: len(DOC) // 2]]))